@@ -4,9 +4,22 @@ Ad metrics analysis system for identifying high-performing patterns
 import os
 import json
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Mapping, Optional
 import random
 from datetime import datetime
+from types import MappingProxyType
+
+# Placeholder global patterns for marketplace analysis. Every result shares
+# this read-only mapping until real pattern extraction replaces it.
+_DEFAULT_GLOBAL_PATTERNS = MappingProxyType({
+    "headline_avg_length": 5.2,  # Words
+    "high_engagement_factors": (
+        "Clear product visualization",
+        "Professional lighting",
+        "Minimal text overlay",
+        "Consistent brand elements"
+    )
+})
 
 class AdMetricsAnalyzer:
     """
@@ -49,17 +62,19 @@ class AdMetricsAnalyzer:
             os.makedirs(self.data_dir, exist_ok=True)
             
             # Look for metrics data files
-            metrics_files = [f for f in os.listdir(self.data_dir) if f.endswith('.json') and 'metrics' in f]
+            with os.scandir(self.data_dir) as it:
+                metrics_files = [e for e in it
+                                 if e.is_file() and e.name.endswith('.json') and 'metrics' in e.name]
             
             if metrics_files:
-                # Use the most recent file
-                latest_file = max(metrics_files, key=lambda f: os.path.getmtime(os.path.join(self.data_dir, f)))
+                # Use the most recent file (DirEntry caches the stat result)
+                latest_file = max(metrics_files, key=lambda e: e.stat().st_mtime)
                 
                 # Load data
-                with open(os.path.join(self.data_dir, latest_file), 'r', encoding='utf-8') as f:
+                with open(latest_file.path, 'r', encoding='utf-8') as f:
                     metrics_data = json.load(f)
                 
-                self.logger.info(f"Loaded metrics data from {latest_file}")
+                self.logger.info(f"Loaded metrics data from {latest_file.name}")
             else:
                 self.logger.info("No metrics data files found, using default patterns")
         except Exception as e:
@@ -376,24 +391,12 @@ class AdMetricsAnalyzer:
                     self.logger.warning("Unsupported file format")
                     return {}
             
-            # Process data to extract patterns
-            # This would be a comprehensive analysis of ad elements and performance
-            # For now, we'll return a placeholder
-            
             results = {
                 "analyzed_date": datetime.now().isoformat(),
                 "source_file": data_file,
                 "total_ads": len(data),
                 "industries": {},
-                "global_patterns": {
-                    "headline_avg_length": 5.2,  # Words
-                    "high_engagement_factors": [
-                        "Clear product visualization",
-                        "Professional lighting",
-                        "Minimal text overlay",
-                        "Consistent brand elements"
-                    ]
-                }
+                "global_patterns": self._extract_global_patterns(data)
             }
             
             # Save results
@@ -405,6 +408,21 @@ class AdMetricsAnalyzer:
             self.logger.error(f"Error analyzing marketplace data: {str(e)}")
             return {}
     
+    def _extract_global_patterns(self, data: Any) -> Mapping[str, Any]:
+        """
+        Extract global patterns from marketplace data.
+        
+        This would be a comprehensive analysis of ad elements and performance.
+        For now it returns the shared placeholder, which must not be mutated.
+        
+        Args:
+            data: Loaded marketplace data
+            
+        Returns:
+            Read-only mapping of global patterns
+        """
+        return _DEFAULT_GLOBAL_PATTERNS
+    
     def _save_analysis_results(self, results: Dict[str, Any]) -> None:
         """
         Save analysis results to file.
@@ -422,7 +440,7 @@ class AdMetricsAnalyzer:
             
             # Save to file
             with open(os.path.join(self.data_dir, filename), 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2)
+                json.dump(results, f, indent=2, default=dict)  # default handles read-only mappings
             
             self.logger.info(f"Saved analysis results to {filename}")
             
@@ -441,7 +459,8 @@ class AdMetricsAnalyzer:
         """
         try:
             # Find all JSON files in the folder
-            json_files = [f for f in os.listdir(market_data_folder) if f.endswith('.json')]
+            with os.scandir(market_data_folder) as it:
+                json_files = [e for e in it if e.is_file() and e.name.endswith('.json')]
             
             if not json_files:
                 self.logger.warning(f"No JSON files found in {market_data_folder}")
@@ -451,10 +470,8 @@ class AdMetricsAnalyzer:
             
             # Process each file
             for json_file in json_files:
-                file_path = os.path.join(market_data_folder, json_file)
-                
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
+                    with open(json_file.path, 'r', encoding='utf-8') as f:
                         data = json.load(f)
                         
                     if isinstance(data, list):
@@ -467,7 +484,7 @@ class AdMetricsAnalyzer:
                             combined_data.append(data)
                             
                 except Exception as e:
-                    self.logger.error(f"Error processing {json_file}: {str(e)}")
+                    self.logger.error(f"Error processing {json_file.name}: {str(e)}")
             
             # Now analyze the combined data
             if not combined_data:
@@ -6,14 +6,26 @@ and extract patterns that can be added to the ad patterns database.
 """
 
 import os
+import asyncio
 import json
 import logging
 import re
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any
 from datetime import datetime
 import time
 import random
 
+logger = logging.getLogger(__name__)
+
+# Best uses implied by each headline pattern type
+_PATTERN_USES = {
+    'question': ('engagement_focused', 'problem_aware_audience'),
+    'numbered_list': ('feature_rich_products', 'comparison_shoppers'),
+    'how_to': ('solution_focused', 'educational_content'),
+    'problem_solution': ('pain_point_targeting', 'solution_aware_audience'),
+    'announcement': ('new_products', 'product_launches'),
+}
+
 class AdPatternsAnalyzer:
     """Analyze ads and extract patterns with engagement metrics."""
     
@@ -24,9 +36,7 @@ class AdPatternsAnalyzer:
         Args:
             data_path: Path to the directory for storing analysis results
         """
-        # Set up logging
-        logging.basicConfig(level=logging.INFO)
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         
         # Set data path
         self.data_path = data_path or os.path.join('data', 'training')
@@ -709,17 +719,17 @@ class AdPatternsAnalyzer:
         # Sort by engagement rate
         return sorted(ctas, key=lambda x: x['engagement_metrics']['average_engagement_rate'], reverse=True)
     
-    def _aggregate_visual_approaches(self) -> List[Dict]:
+    def _aggregate_visual_approaches(self) -> Iterable[Dict]:
         """Aggregate visual approaches from current analysis."""
         # Visual approaches are mostly added manually since image analysis
         # Would require computer vision capabilities
-        return list(self.current_analysis.get('visual_approaches', {}).values())
+        return self.current_analysis.get('visual_approaches', {}).values()
     
-    def _aggregate_color_schemes(self) -> List[Dict]:
+    def _aggregate_color_schemes(self) -> Iterable[Dict]:
         """Aggregate color schemes from current analysis."""
         # Color schemes are mostly added manually since color analysis
         # Would require computer vision capabilities
-        return list(self.current_analysis.get('color_schemes', {}).values())
+        return self.current_analysis.get('color_schemes', {}).values()
     
     def _save_analysis_results(self, results: Dict) -> None:
         """Save analysis results to file."""
@@ -730,15 +740,32 @@ class AdPatternsAnalyzer:
             filename = f"ad_analysis_{industry_slug}_{timestamp}.json"
             filepath = os.path.join(self.data_path, filename)
             
-            # Save to file
+            # Serialize up front so the file is written in a single call
+            # (aggregates may be lazy views; materialize them here)
+            payload = json.dumps(results, indent=2, ensure_ascii=False, default=list)
             with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
+                f.write(payload)
             
             self.logger.info(f"Analysis results saved to: {filepath}")
             
         except Exception as e:
             self.logger.error(f"Error saving analysis results: {str(e)}")
     
+    async def save_analysis_results_async(self, results_list: List[Dict]) -> None:
+        """
+        Save several analysis results (e.g. one per industry) concurrently.
+        
+        Each save runs on a worker thread, so the writes overlap with each
+        other and do not block a running event loop.
+        
+        Args:
+            results_list: Analysis results as returned by complete_analysis
+        """
+        await asyncio.gather(*(
+            asyncio.to_thread(self._save_analysis_results, results)
+            for results in results_list
+        ))
+    
     def convert_analysis_to_database_format(self, analysis_file: str) -> Dict:
         """
         Convert analysis results to database format for the AdPatternsDatabase.
@@ -768,6 +795,8 @@ class AdPatternsAnalyzer:
             
             # Format headline patterns
             for pattern in analysis.get('headline_patterns', []):
+                # Only copy examples when there are more than we keep
+                examples = pattern.get('examples') or []
                 db_pattern = {
                     "id": pattern.get('id', f"{industry}_{pattern['pattern']}"),
                     "pattern": pattern.get('pattern', 'undefined'),
@@ -776,7 +805,7 @@ class AdPatternsAnalyzer:
                         "average_engagement_rate": pattern.get('engagement_metrics', {}).get('average_engagement_rate', 0),
                         "sample_size": pattern.get('engagement_metrics', {}).get('sample_size', 0)
                     },
-                    "examples": pattern.get('examples', [])[:3],
+                    "examples": examples if len(examples) <= 3 else examples[:3],
                     "best_for": self._infer_best_uses(pattern)
                 }
                 db_format['headline_patterns'].append(db_pattern)
@@ -825,43 +854,30 @@ class AdPatternsAnalyzer:
     
     def _infer_best_uses(self, pattern: Dict) -> List[str]:
         """Infer best uses for a pattern based on metrics and type."""
-        best_uses = []
         pattern_type = pattern.get('pattern', '').lower()
         
-        # Add based on pattern type
-        if pattern_type == 'question':
-            best_uses.append('engagement_focused')
-            best_uses.append('problem_aware_audience')
-            
-        elif pattern_type == 'numbered_list':
-            best_uses.append('feature_rich_products')
-            best_uses.append('comparison_shoppers')
-            
-        elif pattern_type == 'how_to':
-            best_uses.append('solution_focused')
-            best_uses.append('educational_content')
-            
-        elif pattern_type == 'problem_solution':
-            best_uses.append('pain_point_targeting')
-            best_uses.append('solution_aware_audience')
-            
-        elif pattern_type == 'announcement':
-            best_uses.append('new_products')
-            best_uses.append('product_launches')
+        # Start from the uses implied by pattern type
+        best_uses = list(_PATTERN_USES.get(pattern_type, ()))
         
-        # Check word count
+        # Top up from word count, stopping at 3 uses
         avg_word_count = pattern.get('average_word_count', 0)
         if avg_word_count <= 5:
-            best_uses.append('mobile_ads')
-            best_uses.append('minimal_designs')
+            word_count_uses = ('mobile_ads', 'minimal_designs')
         elif avg_word_count >= 8:
-            best_uses.append('detailed_information')
+            word_count_uses = ('detailed_information',)
+        else:
+            word_count_uses = ()
         
-        return best_uses[:3]  # Limit to top 3 uses
-
+        for use in word_count_uses:
+            if len(best_uses) >= 3:
+                break
+            best_uses.append(use)
+        
+        return best_uses
 
 # Example usage if run directly
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     analyzer = AdPatternsAnalyzer()
     
     # Example manual ad data
@@ -4166,30 +4166,24 @@ DO NOT include any products, text, logos, or human elements. Create ONLY the emp
         img_small = img_small.convert("RGB")
     
     # Get pixel data
-        pixels = list(img_small.getdata())
+        pixels = np.asarray(img_small, dtype=np.float32).reshape(-1, 3) / 255.0
     
-    # Calculate saturation and vibrance for each pixel
-        import colorsys
-        vibrant_pixels = []
+    # Calculate saturation and vibrance for each pixel (HSV value is the max channel)
+        value = pixels.max(axis=1)
+        saturation = np.divide(value - pixels.min(axis=1), value,
+                               out=np.zeros_like(value), where=value > 0)
     
-        for r, g, b in pixels:
-            r_norm, g_norm, b_norm = r/255.0, g/255.0, b/255.0
-            h, s, v = colorsys.rgb_to_hsv(r_norm, g_norm, b_norm)
-        
-        # Only consider saturated, vibrant colors
-            if s > 0.5 and v > 0.5:
-                vibrance = s * v
-                vibrant_pixels.append(((r, g, b), vibrance))
+    # Only consider saturated, vibrant colors
+        vibrant = (saturation > 0.5) & (value > 0.5)
     
     # If no vibrant pixels found
-        if not vibrant_pixels:
+        if not vibrant.any():
             return None
     
-    # Sort by vibrance and get top results
-        vibrant_pixels.sort(key=lambda x: x[1], reverse=True)
-    
     # Return most vibrant color
-        return vibrant_pixels[0][0]
+        vibrance = np.where(vibrant, saturation * value, -1.0)
+        r, g, b = np.asarray(img_small).reshape(-1, 3)[int(np.argmax(vibrance))]
+        return (int(r), int(g), int(b))
 
     def _calculate_text_safe_areas(self, placement: Dict[str, int], width: int, height: int) -> Dict[str, Dict[str, Any]]:
         """
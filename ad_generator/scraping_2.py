@@ -3376,21 +3376,18 @@ class FacebookAdsScraper:
             if image.mode != 'RGB':
                 image = image.convert('RGB')
             
-            # Get image data
-            pixels = list(image.getdata())
-            
-            # Cluster similar colors
-            color_counts = {}
-            for pixel in pixels:
-                # Normalize the color to reduce variations
-                normalized = (pixel[0] // 10 * 10, pixel[1] // 10 * 10, pixel[2] // 10 * 10)
-                if normalized in color_counts:
-                    color_counts[normalized] += 1
-                else:
-                    color_counts[normalized] = 1
-            
-            # Sort by frequency
-            sorted_colors = sorted(color_counts.items(), key=lambda x: x[1], reverse=True)
+            # Normalize the colors to reduce variations and pack each into one integer
+            pixels = np.asarray(image, dtype=np.uint32).reshape(-1, 3) // 10 * 10
+            packed = (pixels[:, 0] << 16) | (pixels[:, 1] << 8) | pixels[:, 2]
+            
+            # Count the clustered colors and keep the most frequent ones
+            values, counts = np.unique(packed, return_counts=True)
+            top = np.argpartition(-counts, min(10, len(counts)) - 1)[:10]
+            top = top[np.argsort(-counts[top], kind='stable')]
+            sorted_colors = [
+                ((int(value) >> 16, (int(value) >> 8) & 0xFF, int(value) & 0xFF), int(count))
+                for value, count in zip(values[top], counts[top])
+            ]
             
             # Convert to hex, keeping only distinct colors (using HSV distance)
             distinct_colors = []
@@ -1,6 +1,6 @@
 """
 Social media integration module.
 """
-from .social_media_api import search_social_media_ads
+from .social_media_api import search_social_media_ads, clear_social_media_cache
 
-__all__ = ['search_social_media_ads']
\ No newline at end of file
+__all__ = ['search_social_media_ads', 'clear_social_media_cache']
\ No newline at end of file
@@ -3,32 +3,29 @@ Social media integration module that provides real-time insights for ad generati
 Uses Reddit API to analyze trends and preferences for more effective ads.
 """
 import os
+import functools
+import hashlib
+import heapq
+import json
 import logging
 import random
 import re
+import string
+import threading
 import time
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-try:
-    import praw
-    PRAW_AVAILABLE = True
-except ImportError:
-    praw = None
-    PRAW_AVAILABLE = False
 
-from dotenv import load_dotenv
+# praw (with its requests stack) and dotenv are imported on first use by
+# RedditAnalyzer, so the fallback-only path never pays for them
+praw = None
+_dotenv_loaded = False
 
-# Load environment variables
-load_dotenv()
-
-def setup_logging():
-    """Set up logging configuration."""
-    logging.basicConfig(level=logging.INFO)
-    return logging.getLogger(__name__)
-
-# Set up logger
-logger = setup_logging()
+# Module logger; handler configuration is left to the application
+logger = logging.getLogger(__name__)
 
 # Default ad insights by industry (fallback if API fails)
 DEFAULT_INSIGHTS = {
@@ -36,7 +33,7 @@ DEFAULT_INSIGHTS = {
         "recommended_format": "Product-focused with clean background",
         "text_placement": "centered",
         "text_style": "minimal",
-        "key_elements": ["product close-up", "key feature highlight", "brand name"],
+        "key_elements": ("product close-up", "key feature highlight", "brand name"),
         "visual_focus": "product details",
         "color_scheme": "blue and white gradient"
     },
@@ -44,7 +41,7 @@ DEFAULT_INSIGHTS = {
         "recommended_format": "Lifestyle with model",
         "text_placement": "bottom",
         "text_style": "elegant",
-        "key_elements": ["attractive model", "product in use", "aspirational setting"],
+        "key_elements": ("attractive model", "product in use", "aspirational setting"),
         "visual_focus": "product in context",
         "color_scheme": "neutral with accent colors"
     },
@@ -52,7 +49,7 @@ DEFAULT_INSIGHTS = {
         "recommended_format": "Close-up with rich colors",
         "text_placement": "top",
         "text_style": "bold",
-        "key_elements": ["mouth-watering visuals", "steam or movement", "perfect styling"],
+        "key_elements": ("mouth-watering visuals", "steam or movement", "perfect styling"),
         "visual_focus": "texture and details",
         "color_scheme": "warm and vibrant colors"
     },
@@ -60,7 +57,7 @@ DEFAULT_INSIGHTS = {
         "recommended_format": "Dramatic angle with motion suggestion",
         "text_placement": "bottom",
         "text_style": "bold",
-        "key_elements": ["dynamic angle", "showroom finish", "dramatic lighting"],
+        "key_elements": ("dynamic angle", "showroom finish", "dramatic lighting"),
         "visual_focus": "vehicle profile",
         "color_scheme": "dark with bright accents"
     },
@@ -68,7 +65,7 @@ DEFAULT_INSIGHTS = {
         "recommended_format": "Clean and elegant with model",
         "text_placement": "side",
         "text_style": "elegant",
-        "key_elements": ["before/after suggestion", "product close-up", "skin texture"],
+        "key_elements": ("before/after suggestion", "product close-up", "skin texture"),
         "visual_focus": "transformation results",
         "color_scheme": "soft pastels or monochrome"
     },
@@ -76,7 +73,7 @@ DEFAULT_INSIGHTS = {
         "recommended_format": "Minimalist with premium feel",
         "text_placement": "centered",
         "text_style": "elegant",
-        "key_elements": ["subtle luxury cues", "perfect craftsmanship", "exclusive atmosphere"],
+        "key_elements": ("subtle luxury cues", "perfect craftsmanship", "exclusive atmosphere"),
         "visual_focus": "product details",
         "color_scheme": "black, gold, and white"
     },
@@ -84,7 +81,7 @@ DEFAULT_INSIGHTS = {
         "recommended_format": "Action-oriented with results",
         "text_placement": "side",
         "text_style": "bold",
-        "key_elements": ["active lifestyle", "transformation suggestion", "energy"],
+        "key_elements": ("active lifestyle", "transformation suggestion", "energy"),
         "visual_focus": "people in motion",
         "color_scheme": "energetic contrasts"
     },
@@ -92,57 +89,190 @@ DEFAULT_INSIGHTS = {
         "recommended_format": "Lifestyle in context",
         "text_placement": "bottom",
         "text_style": "minimal",
-        "key_elements": ["room setting", "lifestyle integration", "comfort cues"],
+        "key_elements": ("room setting", "lifestyle integration", "comfort cues"),
         "visual_focus": "product in home environment",
         "color_scheme": "warm neutrals"
     }
 }
 
+DEFAULT_INSIGHTS = MappingProxyType({
+    industry: MappingProxyType(insights) for industry, insights in DEFAULT_INSIGHTS.items()
+})
+
 # Default fallback insights
-DEFAULT_FALLBACK = {
+DEFAULT_FALLBACK = MappingProxyType({
     "recommended_format": "Product-centered with clean background",
     "text_placement": "centered",
     "text_style": "minimal",
-    "key_elements": ["product close-up", "brand elements", "quality suggestion"],
+    "key_elements": ("product close-up", "brand elements", "quality suggestion"),
     "visual_focus": "product details",
     "color_scheme": "blue gradient"
-}
+})
 
 # Industry to subreddit mapping
-INDUSTRY_SUBREDDITS = {
-    "Technology": ["technology", "gadgets", "tech", "android", "apple", "iphone"],
-    "Fashion": ["malefashionadvice", "femalefashionadvice", "streetwear", "sneakers"],
-    "Food": ["food", "cooking", "foodporn", "recipes"],
-    "Automotive": ["cars", "autos", "carporn", "teslamotors"],
-    "Beauty": ["skincareaddiction", "makeupaddiction", "beauty"],
-    "Luxury": ["watches", "luxury", "rolex", "luxurylifestyle"],
-    "Fitness": ["fitness", "running", "bodybuilding", "weightlifting"],
-    "Home": ["homedecorating", "interiordesign", "houseplants", "furniture"]
-}
+INDUSTRY_SUBREDDITS = MappingProxyType({
+    "Technology": ("technology", "gadgets", "tech", "android", "apple", "iphone"),
+    "Fashion": ("malefashionadvice", "femalefashionadvice", "streetwear", "sneakers"),
+    "Food": ("food", "cooking", "foodporn", "recipes"),
+    "Automotive": ("cars", "autos", "carporn", "teslamotors"),
+    "Beauty": ("skincareaddiction", "makeupaddiction", "beauty"),
+    "Luxury": ("watches", "luxury", "rolex", "luxurylifestyle"),
+    "Fitness": ("fitness", "running", "bodybuilding", "weightlifting"),
+    "Home": ("homedecorating", "interiordesign", "houseplants", "furniture")
+})
 
 # Product to subreddit mapping
-PRODUCT_SUBREDDITS = {
-    "iphone": ["iphone", "apple", "ios", "applehelp"],
-    "watch": ["watches", "applewatch", "watchexchange", "smartwatch"],
-    "perfume": ["fragrance", "perfume", "scents"],
-    "laptop": ["laptops", "macbook", "thinkpad", "suggestalaptop"],
-    "shoe": ["sneakers", "goodyearwelt", "running", "shoes"],
-    "headphone": ["headphones", "audiophile", "airpods"],
-    "coffee": ["coffee", "espresso", "cafe"],
-    "skincare": ["skincareaddiction", "asianbeauty", "tretinoin"]
+PRODUCT_SUBREDDITS = MappingProxyType({
+    "iphone": ("iphone", "apple", "ios", "applehelp"),
+    "watch": ("watches", "applewatch", "watchexchange", "smartwatch"),
+    "perfume": ("fragrance", "perfume", "scents"),
+    "laptop": ("laptops", "macbook", "thinkpad", "suggestalaptop"),
+    "shoe": ("sneakers", "goodyearwelt", "running", "shoes"),
+    "headphone": ("headphones", "audiophile", "airpods"),
+    "coffee": ("coffee", "espresso", "cafe"),
+    "skincare": ("skincareaddiction", "asianbeauty", "tretinoin")
+})
+
+# Industry text triggers -> DEFAULT_INSIGHTS category, in match priority order
+_INDUSTRY_TRIGGERS = {
+    trigger: category
+    for category, triggers in (
+        ("Technology", ("tech", "computer", "phone", "gadget", "electronics")),
+        ("Fashion", ("fashion", "clothing", "apparel", "wear", "shoe")),
+        ("Food", ("food", "restaurant", "meal", "drink", "beverage")),
+        ("Automotive", ("auto", "car", "vehicle", "motorcycle")),
+        ("Beauty", ("beauty", "cosmetic", "makeup", "skin", "hair")),
+        ("Luxury", ("luxury", "premium", "high-end", "exclusive")),
+        ("Fitness", ("fitness", "gym", "workout", "health", "exercise")),
+        ("Home", ("home", "furniture", "decor", "house", "interior")),
+    )
+    for trigger in triggers
 }
 
+# INDUSTRY_SUBREDDITS with lowercased keys, for substring matching
+_INDUSTRY_SUBREDDITS_LOWER = tuple((ind.lower(), subs) for ind, subs in INDUSTRY_SUBREDDITS.items())
+
 # Product to keywords mapping - words to look for in Reddit analysis
-PRODUCT_KEYWORDS = {
-    "iphone": ["screen", "camera", "battery", "ios", "app", "design", "pro", "max", "color", "performance"],
-    "watch": ["dial", "movement", "automatic", "quartz", "strap", "complication", "chronograph", "water resistance"],
-    "perfume": ["scent", "fragrance", "note", "longevity", "sillage", "projection", "bottle", "designer"],
-    "laptop": ["screen", "battery", "keyboard", "processor", "gpu", "ram", "storage", "performance", "design"],
-    "shoe": ["comfort", "fit", "style", "cushioning", "support", "durability", "breathability", "color"],
-    "headphone": ["sound", "noise cancellation", "battery", "comfort", "wireless", "bass", "microphone", "design"],
-    "coffee": ["flavor", "brew", "roast", "aroma", "origin", "espresso", "grind", "machine"],
-    "skincare": ["moisturizer", "cleanser", "serum", "spf", "retinol", "acid", "hydration", "skin type"]
-}
+PRODUCT_KEYWORDS = MappingProxyType({
+    "iphone": ("screen", "camera", "battery", "ios", "app", "design", "pro", "max", "color", "performance"),
+    "watch": ("dial", "movement", "automatic", "quartz", "strap", "complication", "chronograph", "water resistance"),
+    "perfume": ("scent", "fragrance", "note", "longevity", "sillage", "projection", "bottle", "designer"),
+    "laptop": ("screen", "battery", "keyboard", "processor", "gpu", "ram", "storage", "performance", "design"),
+    "shoe": ("comfort", "fit", "style", "cushioning", "support", "durability", "breathability", "color"),
+    "headphone": ("sound", "noise cancellation", "battery", "comfort", "wireless", "bass", "microphone", "design"),
+    "coffee": ("flavor", "brew", "roast", "aroma", "origin", "espresso", "grind", "machine"),
+    "skincare": ("moisturizer", "cleanser", "serum", "spf", "retinol", "acid", "hydration", "skin type")
+})
+
+# Words used for the basic sentiment estimate
+POSITIVE_WORDS = ("good", "great", "excellent", "amazing", "awesome", "love", "best", "perfect")
+NEGATIVE_WORDS = ("bad", "poor", "terrible", "worst", "hate", "dislike", "disappointing")
+
+# Keywords used when a product matches no PRODUCT_KEYWORDS entry
+DEFAULT_KEYWORDS = ("quality", "design", "feature", "performance", "price", "value")
+
+
+# Single-word terms are counted from tokens; only phrases need a regex.
+# Tokens are split on whitespace after mapping punctuation/digits to spaces.
+_TOKEN_TRANSLATION = str.maketrans({c: ' ' for c in string.punctuation + string.digits})
+
+
+@functools.lru_cache(maxsize=64)
+def _phrase_pattern(keywords: tuple) -> Optional[re.Pattern]:
+    """
+    Compile one word-bounded alternation over the multi-word keywords.
+    
+    Returns None when every keyword is a single word.
+    """
+    phrases = sorted({keyword for keyword in keywords if ' ' in keyword}, key=len, reverse=True)
+    if not phrases:
+        return None
+    return re.compile(r'\b(?:' + '|'.join(map(re.escape, phrases)) + r')\b')
+
+
+# Precompile the patterns for every product family at import time
+for _words in PRODUCT_KEYWORDS.values():
+    _phrase_pattern(_words)
+_phrase_pattern(DEFAULT_KEYWORDS)
+del _words
+
+# On-disk cache of Reddit results, so repeat lookups skip the network
+SOCIAL_CACHE_DIR = os.path.join('data', 'cache', 'social_media')
+INSIGHTS_CACHE_TTL = 3600  # seconds, per (product, brand, industry)
+SUBREDDIT_CACHE_TTL = 900  # seconds, per (subreddit, product, brand)
+
+
+class _DiskCache:
+    """Small JSON-file cache with a time-to-live, keyed by strings."""
+    
+    def __init__(self, directory: str, ttl: float):
+        self.directory = directory
+        self.ttl = ttl
+    
+    def _path(self, key: str) -> str:
+        digest = hashlib.blake2b(key.lower().encode('utf-8'), digest_size=16).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+    
+    def get(self, key: str):
+        """Return the cached value for key, or None if missing or expired."""
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if time.time() - entry.get('ts', 0) >= self.ttl:
+            return None
+        return entry.get('value')
+    
+    def set(self, key: str, value) -> None:
+        """Store a JSON-serializable value under key."""
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'ts': time.time(), 'value': value}, f)
+            # Atomic swap so concurrent readers never see a partial file
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write social media cache entry: {str(e)}")
+    
+    def clear(self) -> None:
+        """Remove all cache entries."""
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.name.endswith('.json'):
+                        os.remove(entry.path)
+        except OSError:
+            pass
+
+
+_insights_cache = _DiskCache(os.path.join(SOCIAL_CACHE_DIR, 'insights'), INSIGHTS_CACHE_TTL)
+_subreddit_cache = _DiskCache(os.path.join(SOCIAL_CACHE_DIR, 'subreddits'), SUBREDDIT_CACHE_TTL)
+
+
+def _load_env() -> None:
+    """Load environment variables from .env once."""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _dotenv_loaded = True
+
+
+def _import_praw():
+    """Import praw on first use; returns None if it is not installed."""
+    global praw
+    if praw is None:
+        try:
+            import praw as praw_module
+        except ImportError:
+            return None
+        praw = praw_module
+    return praw
+
 
 class RedditAnalyzer:
     """Analyze Reddit for advertising insights."""
@@ -150,23 +280,49 @@ class RedditAnalyzer:
     def __init__(self):
         """Initialize Reddit API client."""
         try:
+            _load_env()
             reddit_client_id = os.getenv('REDDIT_CLIENT_ID')
             reddit_client_secret = os.getenv('REDDIT_CLIENT_SECRET')
             
             if not reddit_client_id or not reddit_client_secret:
                 logger.warning("Reddit API credentials not found in environment variables")
                 self.reddit = None
+            elif _import_praw() is None:
+                logger.warning("praw is not installed, Reddit analysis disabled")
+                self.reddit = None
             else:
                 self.reddit = praw.Reddit(
                     client_id=reddit_client_id,
                     client_secret=reddit_client_secret,
-                    user_agent="AdGenerator/1.0 (by /u/YourUsername)"  # Update with your username
+                    user_agent="AdGenerator/1.0 (by /u/YourUsername)",  # Update with your username
+                    requestor_kwargs={"session": self._build_http_session()}
                 )
                 logger.info("Reddit API client initialized successfully")
         except Exception as e:
             logger.error(f"Error initializing Reddit client: {str(e)}")
             self.reddit = None
     
+    @staticmethod
+    def _build_http_session():
+        """
+        Build a pooled keep-alive HTTP session for the PRAW client.
+        
+        The pool is sized for the concurrent subreddit fetches so every
+        request reuses an open TLS connection.
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        session.mount('https://', adapter)
+        return session
+    
     def is_available(self) -> bool:
         """Check if Reddit API is available."""
         return self.reddit is not None
@@ -182,26 +338,32 @@ class RedditAnalyzer:
         Returns:
             List of subreddit names
         """
-        subreddits = set()
+        # Dict keys dedupe while keeping a stable order, so the first
+        # subreddits (the ones analyzed) are the most specific
+        subreddits = {}
         
-        # Get product-specific subreddits
+        # Get product-specific subreddits (first matching product wins)
         product_lower = product.lower()
         for key, subs in PRODUCT_SUBREDDITS.items():
             if key in product_lower:
-                subreddits.update(subs)
+                subreddits.update(dict.fromkeys(subs))
+                break
         
-        # Get industry subreddits
-        for ind, subs in INDUSTRY_SUBREDDITS.items():
-            if ind.lower() in industry.lower():
-                subreddits.update(subs)
+        # Get industry subreddits (first matching industry wins)
+        industry_lower = industry.lower()
+        for ind, subs in _INDUSTRY_SUBREDDITS_LOWER:
+            if ind in industry_lower:
+                subreddits.update(dict.fromkeys(subs))
+                break
         
         # If no matches, use some general subreddits
         if not subreddits:
-            subreddits = {"askreddit", "popular", "all"}
+            return ["askreddit", "popular", "all"]
         
         return list(subreddits)
     
-    def analyze_subreddits(self, subreddit_names: List[str], product: str, brand_name: str) -> Dict:
+    def analyze_subreddits(self, subreddit_names: List[str], product: str, brand_name: str,
+                           fetch_comments: bool = False) -> Dict:
         """
         Analyze subreddits for trends and insights.
         
@@ -209,6 +371,8 @@ class RedditAnalyzer:
             subreddit_names: List of subreddit names
             product: Product name
             brand_name: Brand name
+            fetch_comments: Also fetch comments of each subreddit's top post
+                (one extra request per subreddit)
             
         Returns:
             Dictionary of insights
@@ -226,8 +390,7 @@ class RedditAnalyzer:
                     keywords.extend(words)
             
             if not keywords:
-                # Default keywords
-                keywords = ["quality", "design", "feature", "performance", "price", "value"]
+                keywords = list(DEFAULT_KEYWORDS)
             
             # Get brand name keywords
             brand_keywords = [brand_name.lower()]
@@ -235,38 +398,20 @@ class RedditAnalyzer:
             # Search for posts in subreddits
             all_posts = []
             all_comments = []
-            for subreddit_name in subreddit_names[:3]:  # Limit to 3 subreddits to avoid rate limits
-                try:
-                    subreddit = self.reddit.subreddit(subreddit_name)
-                    
-                    # Get top posts from past month
-                    for post in subreddit.top(time_filter="month", limit=10):
-                        all_posts.append({
-                            "title": post.title,
-                            "text": post.selftext,
-                            "score": post.score,
-                            "upvote_ratio": post.upvote_ratio
-                        })
-                        
-                        # Get comments
-                        post.comments.replace_more(limit=0)  # Avoid loading more comments (for speed)
-                        for comment in list(post.comments)[:5]:  # Top 5 comments
-                            all_comments.append({
-                                "text": comment.body,
-                                "score": comment.score
-                            })
-                    
-                    # Search for posts related to product/brand
-                    for post in subreddit.search(f"{product} OR {brand_name}", limit=10):
-                        all_posts.append({
-                            "title": post.title,
-                            "text": post.selftext,
-                            "score": post.score,
-                            "upvote_ratio": post.upvote_ratio
-                        })
-                except Exception as subreddit_error:
-                    logger.warning(f"Error processing subreddit {subreddit_name}: {str(subreddit_error)}")
-                    continue
+            # Fetch concurrently; limit to 3 subreddits to avoid rate limits
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                futures = {
+                    executor.submit(self._fetch_subreddit, subreddit_name, product, brand_name,
+                                    fetch_comments): subreddit_name
+                    for subreddit_name in subreddit_names[:3]
+                }
+                for future in as_completed(futures):
+                    try:
+                        posts, comments = future.result()
+                        all_posts.extend(posts)
+                        all_comments.extend(comments)
+                    except Exception as subreddit_error:
+                        logger.warning(f"Error processing subreddit {futures[future]}: {str(subreddit_error)}")
             
             # Analyze results
             return self._extract_insights(all_posts, all_comments, keywords, brand_keywords, product)
@@ -275,6 +420,66 @@ class RedditAnalyzer:
             logger.error(f"Error analyzing Reddit: {str(e)}")
             return {}
     
+    def _fetch_subreddit(self, subreddit_name: str, product: str, brand_name: str,
+                         fetch_comments: bool = False):
+        """
+        Fetch the month's top posts from a subreddit in one listing request.
+        
+        Posts mentioning the product or brand are flagged as relevant, which
+        replaces a separate search request. Results are cached on disk for
+        SUBREDDIT_CACHE_TTL seconds.
+        
+        Args:
+            subreddit_name: Subreddit name
+            product: Product name
+            brand_name: Brand name
+            fetch_comments: Also fetch the top comments of the highest-scoring post
+            
+        Returns:
+            Tuple of (posts, comments)
+        """
+        cache_key = f"{subreddit_name}|{product}|{brand_name}|{int(fetch_comments)}"
+        cached = _subreddit_cache.get(cache_key)
+        logger.info(f"Subreddit r/{subreddit_name} cache={'HIT' if cached is not None else 'MISS'}")
+        if cached is not None:
+            return cached['posts'], cached['comments']
+        
+        posts = []
+        comments = []
+        subreddit = self.reddit.subreddit(subreddit_name)
+        
+        # Matches product or brand mentions (skipping empty names)
+        names = [re.escape(name) for name in (product, brand_name) if name]
+        mention_re = re.compile(r'\b(?:' + '|'.join(names) + r')\b', re.I) if names else None
+        
+        # Get top posts from past month
+        top_post = None
+        for post in subreddit.top(time_filter="month", limit=25):
+            relevant = mention_re is not None and bool(
+                mention_re.search(post.title) or mention_re.search(post.selftext)
+            )
+            posts.append({
+                "title": post.title,
+                "text": post.selftext,
+                "score": post.score,
+                "upvote_ratio": post.upvote_ratio,
+                "relevant": relevant
+            })
+            if top_post is None or post.score > top_post.score:
+                top_post = post
+        
+        # Comments cost one request per post, so only read the top post's
+        if fetch_comments and top_post is not None:
+            top_post.comments.replace_more(limit=0)  # Avoid loading more comments (for speed)
+            for comment in list(top_post.comments)[:5]:  # Top 5 comments
+                comments.append({
+                    "text": comment.body,
+                    "score": comment.score
+                })
+        
+        _subreddit_cache.set(cache_key, {"posts": posts, "comments": comments})
+        return posts, comments
+    
     def _extract_insights(self, posts: List[Dict], comments: List[Dict], 
                          keywords: List[str], brand_keywords: List[str], product: str) -> Dict:
         """
@@ -296,31 +501,33 @@ class RedditAnalyzer:
                 return {}
             
             # Combine all text for analysis
-            all_text = ""
+            parts = []
             for post in posts:
-                all_text += post["title"] + " " + post["text"] + " "
+                parts.append(post["title"])
+                parts.append(post["text"])
+                if post.get("relevant"):
+                    # Posts mentioning the product or brand count double
+                    parts.append(post["title"])
+                    parts.append(post["text"])
+            parts.extend(comment["text"] for comment in comments)
             
-            for comment in comments:
-                all_text += comment["text"] + " "
+            all_text = " ".join(parts).lower()
             
-            all_text = all_text.lower()
+            # Count every word once, then add multi-word keyword phrases
+            term_counts = Counter(all_text.translate(_TOKEN_TRANSLATION).split())
+            pattern = _phrase_pattern(tuple(keywords))
+            if pattern is not None:
+                term_counts.update(pattern.findall(all_text))
             
-            # Count keyword occurrences
-            keyword_counts = {}
-            for keyword in keywords:
-                count = len(re.findall(r'\b' + re.escape(keyword) + r'\b', all_text))
-                keyword_counts[keyword] = count
+            keyword_counts = {keyword: term_counts[keyword] for keyword in keywords}
             
             # Top keywords
-            top_keywords = sorted(keyword_counts.items(), key=lambda x: x[1], reverse=True)
-            top_keywords = [k for k, v in top_keywords if v > 0][:5]
+            top_keywords = heapq.nlargest(5, keyword_counts.items(), key=lambda x: x[1])
+            top_keywords = [k for k, v in top_keywords if v > 0]
             
             # Analyze sentiment (very basic approach)
-            positive_words = ["good", "great", "excellent", "amazing", "awesome", "love", "best", "perfect"]
-            negative_words = ["bad", "poor", "terrible", "worst", "hate", "dislike", "disappointing"]
-            
-            positive_count = sum(all_text.count(word) for word in positive_words)
-            negative_count = sum(all_text.count(word) for word in negative_words)
+            positive_count = sum(term_counts[word] for word in POSITIVE_WORDS)
+            negative_count = sum(term_counts[word] for word in NEGATIVE_WORDS)
             
             sentiment = "positive" if positive_count > negative_count else "neutral"
             
@@ -368,90 +575,175 @@ class RedditAnalyzer:
         
         # iPhone specific
         if "iphone" in product_lower:
-            if any(k in ["camera", "photo", "photography"] for k in keywords):
+            if any(k in ("camera", "photo", "photography") for k in keywords):
                 return "camera system close-up"
-            elif any(k in ["screen", "display"] for k in keywords):
+            elif any(k in ("screen", "display") for k in keywords):
                 return "screen with vibrant content"
             else:
                 return "phone profile with screen display"
         
         # Watch specific
         elif "watch" in product_lower:
-            if any(k in ["dial", "face"] for k in keywords):
+            if any(k in ("dial", "face") for k in keywords):
                 return "watch face details"
-            elif any(k in ["strap", "band"] for k in keywords):
+            elif any(k in ("strap", "band") for k in keywords):
                 return "full watch with focus on band"
             else:
                 return "watch at 10:10 position with reflections"
         
         # Generic approach based on keywords
-        if any(k in ["design", "look", "style", "aesthetic"] for k in keywords):
+        if any(k in ("design", "look", "style", "aesthetic") for k in keywords):
             return "product design and styling"
-        elif any(k in ["feature", "function", "capability"] for k in keywords):
+        elif any(k in ("feature", "function", "capability") for k in keywords):
             return "product in use showing key features"
-        elif any(k in ["detail", "quality", "craftsmanship"] for k in keywords):
+        elif any(k in ("detail", "quality", "craftsmanship") for k in keywords):
             return "close-up details showing quality"
         
         # Default
         return "product with professional lighting and staging"
 
 
-def search_social_media_ads(product: str, brand_name: str, industry: str) -> Dict:
+_reddit_analyzer: Optional[RedditAnalyzer] = None
+_reddit_analyzer_lock = threading.Lock()
+
+
+def _get_reddit_analyzer() -> RedditAnalyzer:
+    """
+    Return the shared RedditAnalyzer, creating it on first use.
+    
+    Only a connected analyzer is kept, so a process that starts before its
+    credentials or network are ready picks up Reddit once they are.
+    """
+    global _reddit_analyzer
+    if _reddit_analyzer is None:
+        with _reddit_analyzer_lock:
+            if _reddit_analyzer is None:
+                analyzer = RedditAnalyzer()
+                if not analyzer.is_available():
+                    return analyzer
+                _reddit_analyzer = analyzer
+    return _reddit_analyzer
+
+
+def search_social_media_ads(product: str, brand_name: Optional[str] = None,
+                            industry: Optional[str] = None) -> Mapping:
     """
     Search social media platforms for ad trends and insights.
     Uses Reddit API for real-time data when available.
     
+    Simulated insights are memoized per normalized (product, brand_name,
+    industry); Reddit insights go through the on-disk cache on every call,
+    so they expire after INSIGHTS_CACHE_TTL even in a long-lived process.
+    Fallback results after an error are never cached.
+    The returned mapping is read-only because it may be shared between
+    callers; copy it with dict() before modifying.
+    
     Args:
         product: Product name or description
         brand_name: Brand name
         industry: Industry category
         
     Returns:
-        Dictionary of social media insights for ad creation
+        Read-only mapping of social media insights for ad creation
     """
+    product = product.lower().strip()
+    brand_name = (brand_name or '').lower()
+    industry = (industry or '').lower()
     logger.info(f"Analyzing social media trends for {brand_name} {product} in {industry}")
     
     try:
-        # Initialize Reddit analyzer
-        reddit_analyzer = RedditAnalyzer()
-        
-        # Base insights dictionary
-        insights = _get_insights_for_industry(industry)
+        # Shared Reddit analyzer (client is created once it can connect)
+        reddit_analyzer = _get_reddit_analyzer()
         
-        # Add product-specific customizations from simulated data
-        product_insights = _get_product_specific_insights(product, brand_name)
-        insights.update(product_insights)
+        # Industry defaults with product-specific customizations
+        insights = _simulated_insights(product, brand_name, industry)
         
         # If Reddit API is available, get real insights
-        if reddit_analyzer.is_available():
-            # Get relevant subreddits
-            subreddits = reddit_analyzer.get_relevant_subreddits(product, industry)
-            logger.info(f"Analyzing subreddits: {', '.join(subreddits[:3])}")
-            
-            # Analyze subreddits
-            reddit_insights = reddit_analyzer.analyze_subreddits(subreddits, product, brand_name)
-            
-            # Update insights with Reddit data
-            if reddit_insights:
-                logger.info("Successfully obtained Reddit insights")
-                insights.update(reddit_insights)
-                
-                # Log trending keywords if available
-                if "trending_keywords" in reddit_insights:
-                    logger.info(f"Trending keywords: {', '.join(reddit_insights['trending_keywords'])}")
-            else:
-                logger.info("No Reddit insights available, using default data")
-        else:
+        if not reddit_analyzer.is_available():
             logger.info("Reddit API not available, using simulated insights")
+            return insights
+        
+        reddit_insights = _get_reddit_insights(reddit_analyzer, product, brand_name, industry)
+        if not reddit_insights:
+            logger.info("No Reddit insights available, using default data")
+            return insights
+        
+        # Update insights with Reddit data
+        logger.info("Successfully obtained Reddit insights")
+        insights = dict(insights)
+        insights.update(reddit_insights)
         
-        return insights
+        # Log trending keywords if available
+        if "trending_keywords" in reddit_insights:
+            logger.info(f"Trending keywords: {', '.join(reddit_insights['trending_keywords'])}")
         
+        return MappingProxyType(insights)
+    
     except Exception as e:
         logger.error(f"Error analyzing social media trends: {str(e)}")
-        # Return default insights as fallback
+        # Return default insights as fallback, uncached so the next call retries
         return DEFAULT_FALLBACK
 
 
+def clear_social_media_cache() -> None:
+    """Drop all cached social media insights, in memory and on disk."""
+    _simulated_insights.cache_clear()
+    _insights_cache.clear()
+    _subreddit_cache.clear()
+
+
+@functools.lru_cache(maxsize=1024)
+def _simulated_insights(product: str, brand_name: str, industry: str) -> Mapping:
+    """
+    Build the simulated (non-Reddit) insights for already-normalized arguments.
+    
+    Args:
+        product: Lowercased, stripped product name
+        brand_name: Lowercased brand name
+        industry: Lowercased industry category
+        
+    Returns:
+        Read-only mapping of simulated insights
+    """
+    # Base insights dictionary (a fresh copy, safe to update)
+    insights = _get_insights_for_industry(industry)
+    
+    # Add product-specific customizations from simulated data
+    insights.update(_get_product_specific_insights(product, brand_name))
+    return MappingProxyType(insights)
+
+
+def _get_reddit_insights(reddit_analyzer: RedditAnalyzer, product: str,
+                         brand_name: str, industry: str) -> Optional[Dict]:
+    """
+    Return Reddit insights for normalized arguments, through the on-disk TTL cache.
+    
+    Args:
+        reddit_analyzer: Connected Reddit analyzer
+        product: Lowercased, stripped product name
+        brand_name: Lowercased brand name
+        industry: Lowercased industry category
+        
+    Returns:
+        Dictionary of Reddit insights, or None/empty if none were found
+    """
+    cache_key = f"{product}|{brand_name}|{industry}"
+    reddit_insights = _insights_cache.get(cache_key)
+    logger.info(f"Reddit insights cache={'HIT' if reddit_insights is not None else 'MISS'}")
+    
+    if reddit_insights is None:
+        # Get relevant subreddits
+        subreddits = reddit_analyzer.get_relevant_subreddits(product, industry)
+        logger.info(f"Analyzing subreddits: {', '.join(subreddits[:3])}")
+        
+        # Analyze subreddits
+        reddit_insights = reddit_analyzer.analyze_subreddits(subreddits, product, brand_name)
+        if reddit_insights:
+            _insights_cache.set(cache_key, reddit_insights)
+    
+    return reddit_insights
+
+
 def _get_insights_for_industry(industry: str) -> Dict:
     """
     Get appropriate insights for a specific industry.
@@ -460,78 +752,85 @@ def _get_insights_for_industry(industry: str) -> Dict:
         industry: Industry name or category
         
     Returns:
-        Dictionary of social media insights
+        New dictionary of social media insights (a copy of the shared
+        defaults, so callers may update it)
     """
     # Clean and normalize industry name
-    industry_clean = industry.strip().lower()
-    
-    # Map to main categories
-    if any(tech in industry_clean for tech in ["tech", "computer", "phone", "gadget", "electronics"]):
-        return DEFAULT_INSIGHTS["Technology"]
-    elif any(fashion in industry_clean for fashion in ["fashion", "clothing", "apparel", "wear", "shoe"]):
-        return DEFAULT_INSIGHTS["Fashion"]
-    elif any(food in industry_clean for food in ["food", "restaurant", "meal", "drink", "beverage"]):
-        return DEFAULT_INSIGHTS["Food"]
-    elif any(auto in industry_clean for auto in ["auto", "car", "vehicle", "motorcycle"]):
-        return DEFAULT_INSIGHTS["Automotive"]
-    elif any(beauty in industry_clean for beauty in ["beauty", "cosmetic", "makeup", "skin", "hair"]):
-        return DEFAULT_INSIGHTS["Beauty"]
-    elif any(luxury in industry_clean for luxury in ["luxury", "premium", "high-end", "exclusive"]):
-        return DEFAULT_INSIGHTS["Luxury"]
-    elif any(fitness in industry_clean for fitness in ["fitness", "gym", "workout", "health", "exercise"]):
-        return DEFAULT_INSIGHTS["Fitness"]
-    elif any(home in industry_clean for home in ["home", "furniture", "decor", "house", "interior"]):
-        return DEFAULT_INSIGHTS["Home"]
-    else:
-        # Return technology as default if no match
-        return DEFAULT_FALLBACK
+    category = _industry_category(industry.strip().lower())
+    
+    if category is None:
+        # Return generic fallback if no match
+        return dict(DEFAULT_FALLBACK)
+    return dict(DEFAULT_INSIGHTS[category])
+
+
+@functools.lru_cache(maxsize=256)
+def _industry_category(industry_clean: str) -> Optional[str]:
+    """
+    Map a normalized industry name to a DEFAULT_INSIGHTS category.
+    
+    Args:
+        industry_clean: Stripped, lowercased industry name
+        
+    Returns:
+        Category name, or None if no trigger matches
+    """
+    # Triggers are ordered by category priority
+    for trigger, category in _INDUSTRY_TRIGGERS.items():
+        if trigger in industry_clean:
+            return category
+    return None
 
 
-def _get_product_specific_insights(product: str, brand_name: str) -> Dict:
+@functools.lru_cache(maxsize=256)
+def _get_product_specific_insights(product: str, brand_name: str) -> Mapping:
     """
     Get product-specific customizations to insights.
     
+    Results are memoized, so they are returned read-only.
+    
     Args:
         product: Product name or description
         brand_name: Brand name
         
     Returns:
-        Dictionary of product-specific customizations
+        Read-only mapping of product-specific customizations
     """
     product_lower = product.lower()
     
     # iPhone customizations
     if "iphone" in product_lower:
-        return {
+        return MappingProxyType({
             "visual_focus": "phone screen and profile",
-            "key_elements": ["iPhone at angle", "screen display", "sleek design"],
+            "key_elements": ("iPhone at angle", "screen display", "sleek design"),
             "color_scheme": "dark blue to black gradient"
-        }
+        })
     
     # Watch customizations
-    elif any(watch in product_lower for watch in ["watch", "timepiece"]):
-        return {
+    elif any(watch in product_lower for watch in ("watch", "timepiece")):
+        return MappingProxyType({
             "visual_focus": "watch face and details",
             "text_placement": "bottom",
-            "key_elements": ["watch at 10:10 position", "metal details", "craftsmanship"],
+            "key_elements": ("watch at 10:10 position", "metal details", "craftsmanship"),
             "color_scheme": "elegant dark gradient"
-        }
+        })
     
     # Perfume customizations
-    elif any(fragrance in product_lower for fragrance in ["perfume", "fragrance", "cologne"]):
-        return {
+    elif any(fragrance in product_lower for fragrance in ("perfume", "fragrance", "cologne")):
+        return MappingProxyType({
             "visual_focus": "bottle silhouette",
             "text_placement": "side",
-            "key_elements": ["bottle with reflection", "mist or essence suggestion", "luxury cues"],
+            "key_elements": ("bottle with reflection", "mist or essence suggestion", "luxury cues"),
             "color_scheme": "dark with shimmer"
-        }
+        })
     
     # No specific customizations
-    return {}
+    return MappingProxyType({})
 
 
 # For testing
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     # Set up environment variables if running directly
     from dotenv import load_dotenv
     load_dotenv()
@@ -5,10 +5,158 @@ Provides brand-specific typography styles and rules based on brand identity
 import os
 import logging
 import re
-from typing import Dict, List, Tuple, Any, Optional, Union
+from functools import cached_property
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple, Any, Optional, Union
 import numpy as np
 from PIL import Image, ImageColor
 
+# ITU-R 601-2 luma weights, the same ones Pillow uses for mode 'L'
+LUMINANCE_WEIGHTS = np.array([0.299, 0.587, 0.114])
+
+# ITU-R BT.709 weights used for WCAG relative luminance
+RELATIVE_LUMINANCE_WEIGHTS = np.array([0.2126, 0.7152, 0.0722])
+
+# Signature colors for well-known brands (RGBA)
+_BRAND_COLORS = {
+    "apple": {
+        "primary": (0, 122, 255, 255),  # Apple blue
+        "secondary": (255, 59, 48, 255),  # Apple red
+        "light_text": (255, 255, 255, 255),
+        "dark_text": (0, 0, 0, 255)
+    },
+    "nike": {
+        "primary": (0, 0, 0, 255),  # Nike black
+        "secondary": (255, 255, 255, 255),  # White
+        "light_text": (255, 255, 255, 255),
+        "dark_text": (0, 0, 0, 255)
+    },
+    "coca-cola": {
+        "primary": (237, 28, 36, 255),  # Coca-Cola red
+        "secondary": (255, 255, 255, 255),  # White
+        "light_text": (255, 255, 255, 255),
+        "dark_text": (0, 0, 0, 255)
+    },
+    "facebook": {
+        "primary": (66, 103, 178, 255),  # Facebook blue
+        "secondary": (255, 255, 255, 255),  # White
+        "light_text": (255, 255, 255, 255),
+        "dark_text": (0, 0, 0, 255)
+    },
+    "amazon": {
+        "primary": (255, 153, 0, 255),  # Amazon orange
+        "secondary": (0, 0, 0, 255),  # Black
+        "light_text": (255, 255, 255, 255),
+        "dark_text": (0, 0, 0, 255)
+    },
+    "google": {
+        "primary": (66, 133, 244, 255),  # Google blue
+        "secondary": (234, 67, 53, 255),  # Google red
+        "tertiary": (251, 188, 5, 255),  # Google yellow
+        "quaternary": (52, 168, 83, 255),  # Google green
+        "light_text": (255, 255, 255, 255),
+        "dark_text": (0, 0, 0, 255)
+    },
+    "microsoft": {
+        "primary": (241, 80, 37, 255),  # Microsoft red
+        "secondary": (0, 164, 239, 255),  # Microsoft blue
+        "tertiary": (255, 185, 0, 255),  # Microsoft yellow
+        "quaternary": (127, 186, 0, 255),  # Microsoft green
+        "light_text": (255, 255, 255, 255),
+        "dark_text": (0, 0, 0, 255)
+    },
+    "starbucks": {
+        "primary": (0, 122, 74, 255),  # Starbucks green
+        "secondary": (0, 0, 0, 255),  # Black
+        "light_text": (255, 255, 255, 255),
+        "dark_text": (0, 0, 0, 255)
+    },
+    "mcdonalds": {
+        "primary": (255, 199, 44, 255),  # McDonald's yellow
+        "secondary": (227, 31, 38, 255),  # McDonald's red
+        "light_text": (255, 255, 255, 255),
+        "dark_text": (0, 0, 0, 255)
+    },
+    "adidas": {
+        "primary": (0, 0, 0, 255),  # Adidas black
+        "secondary": (255, 255, 255, 255),  # White
+        "light_text": (255, 255, 255, 255),
+        "dark_text": (0, 0, 0, 255)
+    },
+    "pepsi": {
+        "primary": (0, 85, 184, 255),  # Pepsi blue
+        "secondary": (230, 9, 23, 255),  # Pepsi red
+        "light_text": (255, 255, 255, 255),
+        "dark_text": (0, 0, 0, 255)
+    },
+    "louis vuitton": {
+        "primary": (157, 122, 74, 255),  # LV brown
+        "secondary": (4, 9, 40, 255),  # Navy blue
+        "light_text": (255, 255, 255, 255),
+        "dark_text": (0, 0, 0, 255)
+    }
+}
+BRAND_COLORS = MappingProxyType({
+    brand: MappingProxyType(colors) for brand, colors in _BRAND_COLORS.items()
+})
+
+# Product and slogan names that identify a brand in BRAND_COLORS
+BRAND_COLOR_ALIASES = {
+    "iphone": "apple",
+    "macbook": "apple",
+    "ipad": "apple",
+    "imac": "apple",
+    "airpods": "apple",
+    "just do it": "nike",
+    "coke": "coca-cola",
+    "fb": "facebook",
+    "galaxy": "samsung",
+    "pixel": "google",
+    "surface": "microsoft",
+    "lv": "louis vuitton"
+}
+
+# Keywords that identify an industry when it is not named directly
+INDUSTRY_CATEGORIES = {
+    "tech": "technology",
+    "software": "technology",
+    "computer": "technology",
+    "smartphone": "technology",
+    "electronics": "technology",
+    "digital": "technology",
+
+    "clothes": "fashion",
+    "apparel": "fashion",
+    "clothing": "fashion",
+    "shoes": "fashion",
+    "wear": "fashion",
+    "dress": "fashion",
+
+    "high-end": "luxury",
+    "premium": "luxury",
+    "exclusive": "luxury",
+    "watches": "luxury",
+    "jewelry": "luxury",
+
+    "restaurant": "food",
+    "dining": "food",
+    "cuisine": "food",
+    "beverage": "food",
+    "drink": "food",
+
+    "cosmetics": "beauty",
+    "skincare": "beauty",
+    "makeup": "beauty",
+    "haircare": "beauty",
+    "perfume": "beauty"
+}
+
+
+def luminance(colors, weights: np.ndarray = LUMINANCE_WEIGHTS) -> Union[float, np.ndarray]:
+    """Luma between 0 and 1 of an RGB(A) color, or of every row of an (N, 3|4) color array."""
+    return np.asarray(colors)[..., :3] @ weights / 255
+
+
 class BrandTypographyManager:
     """
     Manages typography rules and styles specific to different brands and industries.
@@ -31,11 +179,26 @@ class BrandTypographyManager:
         # Load style presets
         self.style_presets = self._load_style_presets()
         
-        # Load industry typographic standards
-        self.industry_standards = self._load_industry_standards()
+        # Industry standards and brand style guides are built on first lookup
         
-        # Load brand-specific style guides
-        self.brand_style_guides = self._load_brand_style_guides()
+        # Color strategy handlers used by generate_color_scheme
+        self._color_strategies = {
+            'brand_colors': self._apply_brand_color_strategy,
+            'image_derived': self._apply_image_derived_strategy,
+            'monochromatic': self._apply_monochromatic_strategy,
+            'dramatic': self._apply_dramatic_strategy,
+            'contrasting': self._apply_contrasting_strategy,
+        }
+    
+    @cached_property
+    def industry_standards(self) -> Dict[str, Dict[str, Any]]:
+        """Industry typographic standards, loaded on first use."""
+        return self._load_industry_standards()
+    
+    @cached_property
+    def brand_style_guides(self) -> Dict[str, Dict[str, Any]]:
+        """Brand-specific style guides, loaded on first use."""
+        return self._load_brand_style_guides()
     
     def _load_style_presets(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -662,41 +825,7 @@ class BrandTypographyManager:
                 return industry_key
         
         # Check for industry categories and aliases
-        industry_categories = {
-            "tech": "technology",
-            "software": "technology",
-            "computer": "technology",
-            "smartphone": "technology",
-            "electronics": "technology",
-            "digital": "technology",
-            
-            "clothes": "fashion",
-            "apparel": "fashion",
-            "clothing": "fashion",
-            "shoes": "fashion",
-            "wear": "fashion",
-            "dress": "fashion",
-            
-            "high-end": "luxury",
-            "premium": "luxury",
-            "exclusive": "luxury",
-            "watches": "luxury",
-            "jewelry": "luxury",
-            
-            "restaurant": "food",
-            "dining": "food",
-            "cuisine": "food",
-            "beverage": "food",
-            "drink": "food",
-            
-            "cosmetics": "beauty",
-            "skincare": "beauty",
-            "makeup": "beauty",
-            "haircare": "beauty",
-            "perfume": "beauty"
-        }
-        
-        for category, industry_key in industry_categories.items():
+        for category, industry_key in INDUSTRY_CATEGORIES.items():
             if category in industry_lower and industry_key in self.industry_standards:
                 return industry_key
         
@@ -717,11 +846,8 @@ class BrandTypographyManager:
         Returns:
             Color scheme dictionary
         """
-        # Extract dominant colors from image
-        dominant_colors = self._extract_dominant_colors(image)
-        
-        # Calculate image brightness
-        brightness = self._calculate_image_brightness(image)
+        # Extract dominant colors and brightness from a single pass over the image
+        dominant_colors, brightness = self._analyze_image(image)
         
         # Determine text color based on brightness
         if brightness > 0.5:
@@ -749,82 +875,9 @@ class BrandTypographyManager:
         }
         
         # Apply color strategy
-        if color_strategy == 'brand_colors' and brand_colors:
-            # Use brand colors
-            color_scheme["accent_color"] = brand_colors.get("primary", (41, 128, 185, 230))
-            color_scheme["button_color"] = brand_colors.get("primary", (41, 128, 185, 230))
-            
-            # Ensure adequate contrast for text
-            if brightness > 0.5:
-                # Light image - see if brand color works for text
-                brand_text = brand_colors.get("dark_text", text_color)
-                color_scheme["text_color"] = brand_text
-                color_scheme["headline_color"] = brand_text
-                color_scheme["subheadline_color"] = brand_text
-                color_scheme["body_color"] = brand_text
-                color_scheme["cta_color"] = (255, 255, 255, 255)  # White CTA text
-                color_scheme["brand_color"] = brand_text
-            else:
-                # Dark image - use light brand text
-                brand_text = brand_colors.get("light_text", text_color)
-                color_scheme["text_color"] = brand_text
-                color_scheme["headline_color"] = brand_text
-                color_scheme["subheadline_color"] = brand_text
-                color_scheme["body_color"] = brand_text
-                color_scheme["cta_color"] = (255, 255, 255, 255)  # White CTA text
-                color_scheme["brand_color"] = brand_text
-                
-        elif color_strategy == 'image_derived':
-            # Use colors derived from the image
-            if dominant_colors:
-                dominant = dominant_colors[0]
-                color_scheme["accent_color"] = (*dominant, 230)
-                color_scheme["button_color"] = (*dominant, 230)
-                
-                # Check if the dominant color has enough contrast with text
-                luminance = (0.299 * dominant[0] + 0.587 * dominant[1] + 0.114 * dominant[2]) / 255
-                if abs(luminance - (brightness > 0.5)) < 0.3:
-                    # Not enough contrast, use complementary color
-                    complementary = self._get_complementary_color(dominant)
-                    color_scheme["accent_color"] = (*complementary, 230)
-                    color_scheme["button_color"] = (*complementary, 230)
-                    
-        elif color_strategy == 'monochromatic':
-            # Use monochromatic scheme based on brightness
-            if brightness > 0.5:
-                # Light image - use dark accent
-                color_scheme["accent_color"] = (30, 30, 30, 230)
-                color_scheme["button_color"] = (30, 30, 30, 230)
-            else:
-                # Dark image - use light accent
-                color_scheme["accent_color"] = (245, 245, 245, 230)
-                color_scheme["button_color"] = (245, 245, 245, 230)
-                
-        elif color_strategy == 'dramatic':
-            # High contrast, dramatic colors
-            if brightness > 0.5:
-                # Light image - use bold, dark colors
-                color_scheme["accent_color"] = (48, 63, 159, 230)  # Deep blue
-                color_scheme["button_color"] = (48, 63, 159, 230)
-                color_scheme["background_color"] = (0, 0, 0, 160)  # Semi-transparent black
-            else:
-                # Dark image - use vibrant accent
-                color_scheme["accent_color"] = (255, 87, 34, 230)  # Deep orange
-                color_scheme["button_color"] = (255, 87, 34, 230)
-                color_scheme["background_color"] = (0, 0, 0, 180)  # More opaque black
-                
-        elif color_strategy == 'contrasting':
-            # Use contrasting color to dominant
-            if dominant_colors:
-                dominant = dominant_colors[0]
-                complementary = self._get_complementary_color(dominant)
-                color_scheme["accent_color"] = (*complementary, 230)
-                color_scheme["button_color"] = (*complementary, 230)
-                
-                # Use dominant as background if it has enough contrast with text
-                luminance = (0.299 * dominant[0] + 0.587 * dominant[1] + 0.114 * dominant[2]) / 255
-                if abs(luminance - (brightness > 0.5)) > 0.4:
-                    color_scheme["background_color"] = (*dominant, 120)  # Semi-transparent
+        apply_strategy = self._color_strategies.get(color_strategy)
+        if apply_strategy:
+            apply_strategy(color_scheme, brightness, dominant_colors, brand_colors)
         
         # Apply any color overrides from the style
         color_overrides = typography_style.get('color_overrides', {})
@@ -834,16 +887,104 @@ class BrandTypographyManager:
             
         return color_scheme
     
-    def _extract_dominant_colors(self, image: Image.Image, num_colors: int = 5) -> List[Tuple[int, int, int]]:
+    def _apply_brand_color_strategy(self, color_scheme: Dict[str, Any], brightness: float,
+                                    dominant_colors: List[Tuple[int, int, int]],
+                                    brand_colors: Optional[Dict[str, Any]]) -> None:
+        """Use the brand's own colors for accents and text."""
+        if not brand_colors:
+            return
+        
+        color_scheme["accent_color"] = brand_colors.get("primary", (41, 128, 185, 230))
+        color_scheme["button_color"] = brand_colors.get("primary", (41, 128, 185, 230))
+        
+        # Dark brand text on light images, light brand text on dark images
+        text_key = "dark_text" if brightness > 0.5 else "light_text"
+        brand_text = brand_colors.get(text_key, color_scheme["text_color"])
+        for key in ("text_color", "headline_color", "subheadline_color", "body_color", "brand_color"):
+            color_scheme[key] = brand_text
+        color_scheme["cta_color"] = (255, 255, 255, 255)  # White CTA text
+    
+    def _apply_image_derived_strategy(self, color_scheme: Dict[str, Any], brightness: float,
+                                      dominant_colors: List[Tuple[int, int, int]],
+                                      brand_colors: Optional[Dict[str, Any]]) -> None:
+        """Use the image's dominant color as the accent, or its complement when contrast is low."""
+        if not dominant_colors:
+            return
+        
+        dominant = dominant_colors[0]
+        accent = dominant
+        
+        # Check if the dominant color has enough contrast with text
+        if abs(luminance(dominant) - (brightness > 0.5)) < 0.3:
+            # Not enough contrast, use complementary color
+            accent = self._get_complementary_color(dominant)
+        
+        color_scheme["accent_color"] = (*accent, 230)
+        color_scheme["button_color"] = (*accent, 230)
+    
+    def _apply_monochromatic_strategy(self, color_scheme: Dict[str, Any], brightness: float,
+                                      dominant_colors: List[Tuple[int, int, int]],
+                                      brand_colors: Optional[Dict[str, Any]]) -> None:
+        """Use a dark accent on light images and a light accent on dark images."""
+        accent = (30, 30, 30, 230) if brightness > 0.5 else (245, 245, 245, 230)
+        color_scheme["accent_color"] = accent
+        color_scheme["button_color"] = accent
+    
+    def _apply_dramatic_strategy(self, color_scheme: Dict[str, Any], brightness: float,
+                                 dominant_colors: List[Tuple[int, int, int]],
+                                 brand_colors: Optional[Dict[str, Any]]) -> None:
+        """High contrast, dramatic colors over a semi-transparent black backing."""
+        if brightness > 0.5:
+            # Light image - use bold, dark colors
+            accent, background = (48, 63, 159, 230), (0, 0, 0, 160)  # Deep blue
+        else:
+            # Dark image - use vibrant accent
+            accent, background = (255, 87, 34, 230), (0, 0, 0, 180)  # Deep orange
+        color_scheme["accent_color"] = accent
+        color_scheme["button_color"] = accent
+        color_scheme["background_color"] = background
+    
+    def _apply_contrasting_strategy(self, color_scheme: Dict[str, Any], brightness: float,
+                                    dominant_colors: List[Tuple[int, int, int]],
+                                    brand_colors: Optional[Dict[str, Any]]) -> None:
+        """Accent with the complement of the dominant color."""
+        if not dominant_colors:
+            return
+        
+        dominant = dominant_colors[0]
+        complementary = self._get_complementary_color(dominant)
+        color_scheme["accent_color"] = (*complementary, 230)
+        color_scheme["button_color"] = (*complementary, 230)
+        
+        # Use dominant as background if it has enough contrast with text
+        if abs(luminance(dominant) - (brightness > 0.5)) > 0.4:
+            color_scheme["background_color"] = (*dominant, 120)  # Semi-transparent
+    
+    def _analyze_image(self, image: Image.Image,
+                       num_colors: int = 5) -> Tuple[List[Tuple[int, int, int]], float]:
         """
-        Extract dominant colors from an image.
+        Extract dominant colors and overall brightness from one downsampled copy of an image.
         
         Args:
             image: PIL Image object
             num_colors: Number of colors to extract
             
         Returns:
-            List of RGB tuples representing dominant colors
+            Tuple of (dominant RGB colors, brightness between 0 and 1)
+        """
+        img_small = self._sample_image(image)
+        brightness = float(luminance(np.asarray(img_small)).mean())
+        return self._quantize_colors(img_small, num_colors), brightness
+    
+    def _sample_image(self, image: Image.Image) -> Image.Image:
+        """
+        Downsample an image to 100x100 RGB for color analysis.
+        
+        Args:
+            image: PIL Image object
+            
+        Returns:
+            100x100 RGB image
         """
         # Resize image for faster processing
         img_small = image.resize((100, 100), Image.Resampling.LANCZOS)
@@ -852,57 +993,50 @@ class BrandTypographyManager:
         if img_small.mode != 'RGB':
             img_small = img_small.convert('RGB')
         
-        # Get colors
-        pixels = [tuple(p) for p in np.array(img_small).reshape(-1, 3)]
-        
-        # Count occurrences of each color
-        color_counts = {}
-        for pixel in pixels:
-            if pixel in color_counts:
-                color_counts[pixel] += 1
-            else:
-                color_counts[pixel] = 1
-        
-        # Sort by frequency
-        sorted_colors = sorted(color_counts.items(), key=lambda x: x[1], reverse=True)
-        
-        # Return top colors
-        return [color for color, count in sorted_colors[:num_colors]]
+        return img_small
     
-    def _calculate_image_brightness(self, image: Image.Image) -> float:
+    def _quantize_colors(self, image: Image.Image, num_colors: int) -> List[Tuple[int, int, int]]:
         """
-        Calculate the overall brightness of an image.
+        Find the dominant colors of an RGB image by octree quantization.
+        
+        Near-identical pixels (e.g. resampling noise) are clustered together, so
+        the result reflects color regions rather than exact pixel values.
         
         Args:
-            image: PIL Image object
+            image: RGB image
+            num_colors: Number of colors to extract
             
         Returns:
-            Float value between 0 (dark) and 1 (bright)
+            List of RGB tuples, most frequent first
         """
-        # Convert to grayscale for brightness calculation
-        gray = image.convert('L')
+        if num_colors <= 0:
+            return []
         
-        # Calculate average brightness normalized to 0-1
-        histogram = gray.histogram()
-        pixels = sum(histogram)
-        brightness = sum(i * pixels for i, pixels in enumerate(histogram)) / (255 * sum(histogram))
+        quantized = image.quantize(colors=num_colors, method=Image.Quantize.FASTOCTREE)
+        palette = quantized.getpalette()
         
-        return brightness
+        # getcolors yields (count, palette index) pairs; sort by frequency
+        color_counts = sorted(quantized.getcolors(num_colors), key=lambda x: x[0], reverse=True)
+        return [tuple(palette[index * 3:index * 3 + 3]) for _, index in color_counts]
     
-    def _get_complementary_color(self, color: Tuple[int, int, int]) -> Tuple[int, int, int]:
+    def _get_complementary_color(self, color: Union[Tuple[int, int, int], np.ndarray]
+                                 ) -> Union[Tuple[int, int, int], np.ndarray]:
         """
         Get complementary color.
         
         Args:
-            color: RGB color tuple
+            color: RGB color tuple, or an (N, 3) array of RGB colors
             
         Returns:
-            Complementary RGB color tuple
+            Complementary RGB color tuple, or an array of complements for array input
         """
+        if isinstance(color, np.ndarray):
+            return 255 - color
+        
         r, g, b = color
         return (255 - r, 255 - g, 255 - b)
     
-    def _get_brand_colors(self, brand_name: Optional[str]) -> Optional[Dict[str, Any]]:
+    def _get_brand_colors(self, brand_name: Optional[str]) -> Optional[Mapping[str, Any]]:
         """
         Get brand-specific colors.
         
@@ -910,121 +1044,26 @@ class BrandTypographyManager:
             brand_name: Brand name
             
         Returns:
-            Dictionary with brand colors or None if not found
+            Read-only mapping with brand colors or None if not found
         """
         if not brand_name:
             return None
             
         brand_lower = brand_name.lower()
         
-        # Common brand colors
-        brand_colors = {
-            "apple": {
-                "primary": (0, 122, 255, 255),  # Apple blue
-                "secondary": (255, 59, 48, 255),  # Apple red
-                "light_text": (255, 255, 255, 255),
-                "dark_text": (0, 0, 0, 255)
-            },
-            "nike": {
-                "primary": (0, 0, 0, 255),  # Nike black
-                "secondary": (255, 255, 255, 255),  # White
-                "light_text": (255, 255, 255, 255),
-                "dark_text": (0, 0, 0, 255)
-            },
-            "coca-cola": {
-                "primary": (237, 28, 36, 255),  # Coca-Cola red
-                "secondary": (255, 255, 255, 255),  # White
-                "light_text": (255, 255, 255, 255),
-                "dark_text": (0, 0, 0, 255)
-            },
-            "facebook": {
-                "primary": (66, 103, 178, 255),  # Facebook blue
-                "secondary": (255, 255, 255, 255),  # White
-                "light_text": (255, 255, 255, 255),
-                "dark_text": (0, 0, 0, 255)
-            },
-            "amazon": {
-                "primary": (255, 153, 0, 255),  # Amazon orange
-                "secondary": (0, 0, 0, 255),  # Black
-                "light_text": (255, 255, 255, 255),
-                "dark_text": (0, 0, 0, 255)
-            },
-            "google": {
-                "primary": (66, 133, 244, 255),  # Google blue
-                "secondary": (234, 67, 53, 255),  # Google red
-                "tertiary": (251, 188, 5, 255),  # Google yellow
-                "quaternary": (52, 168, 83, 255),  # Google green
-                "light_text": (255, 255, 255, 255),
-                "dark_text": (0, 0, 0, 255)
-            },
-            "microsoft": {
-                "primary": (241, 80, 37, 255),  # Microsoft red
-                "secondary": (0, 164, 239, 255),  # Microsoft blue
-                "tertiary": (255, 185, 0, 255),  # Microsoft yellow
-                "quaternary": (127, 186, 0, 255),  # Microsoft green
-                "light_text": (255, 255, 255, 255),
-                "dark_text": (0, 0, 0, 255)
-            },
-            "starbucks": {
-                "primary": (0, 122, 74, 255),  # Starbucks green
-                "secondary": (0, 0, 0, 255),  # Black
-                "light_text": (255, 255, 255, 255),
-                "dark_text": (0, 0, 0, 255)
-            },
-            "mcdonalds": {
-                "primary": (255, 199, 44, 255),  # McDonald's yellow
-                "secondary": (227, 31, 38, 255),  # McDonald's red
-                "light_text": (255, 255, 255, 255),
-                "dark_text": (0, 0, 0, 255)
-            },
-            "adidas": {
-                "primary": (0, 0, 0, 255),  # Adidas black
-                "secondary": (255, 255, 255, 255),  # White
-                "light_text": (255, 255, 255, 255),
-                "dark_text": (0, 0, 0, 255)
-            },
-            "pepsi": {
-                "primary": (0, 85, 184, 255),  # Pepsi blue
-                "secondary": (230, 9, 23, 255),  # Pepsi red
-                "light_text": (255, 255, 255, 255),
-                "dark_text": (0, 0, 0, 255)
-            },
-            "louis vuitton": {
-                "primary": (157, 122, 74, 255),  # LV brown
-                "secondary": (4, 9, 40, 255),  # Navy blue
-                "light_text": (255, 255, 255, 255),
-                "dark_text": (0, 0, 0, 255)
-            }
-        }
-        
         # Check for direct match
-        if brand_lower in brand_colors:
-            return brand_colors[brand_lower]
+        if brand_lower in BRAND_COLORS:
+            return BRAND_COLORS[brand_lower]
         
         # Check for partial matches
-        for brand, colors in brand_colors.items():
+        for brand, colors in BRAND_COLORS.items():
             if brand in brand_lower or brand_lower in brand:
                 return colors
                 
         # Brand aliases
-        brand_aliases = {
-            "iphone": "apple",
-            "macbook": "apple",
-            "ipad": "apple",
-            "imac": "apple",
-            "airpods": "apple",
-            "just do it": "nike",
-            "coke": "coca-cola",
-            "fb": "facebook",
-            "galaxy": "samsung",
-            "pixel": "google",
-            "surface": "microsoft",
-            "lv": "louis vuitton"
-        }
-        
-        for alias, brand in brand_aliases.items():
-            if alias in brand_lower and brand in brand_colors:
-                return brand_colors[brand]
+        for alias, brand in BRAND_COLOR_ALIASES.items():
+            if alias in brand_lower and brand in BRAND_COLORS:
+                return BRAND_COLORS[brand]
         
         return None
     
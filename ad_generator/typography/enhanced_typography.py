@@ -4,6 +4,7 @@ Provides sophisticated typography with perfect background integration for advert
 """
 import os
 import logging
+import threading
 import numpy as np
 try:
     import cv2
@@ -17,6 +18,52 @@ import colorsys
 import math
 import random
 from collections import defaultdict
+from types import MappingProxyType
+
+from .brand_typography import RELATIVE_LUMINANCE_WEIGHTS, luminance
+from .font_pairing import load_default_font, measure_text, open_font
+
+# Platform font directories, filtered once so lookups never probe paths from other OSes
+SYSTEM_FONT_DIRECTORIES = tuple(
+    directory for directory in (
+        "/usr/share/fonts/truetype/",
+        "/usr/share/fonts/TTF/",
+        "/Library/Fonts/",
+        "C:\\Windows\\Fonts\\",
+    )
+    if os.path.isdir(directory)
+)
+
+FONT_FILE_EXTENSIONS = ('.ttf', '.otf', '.ttc')
+
+# Platform file names of the standard fonts used when no font manager is available
+COMMON_FONT_FILES = MappingProxyType({
+    "Arial": ("arial.ttf", "Arial.ttf", "ARIAL.TTF"),
+    "Arial-Bold": ("arialbd.ttf", "Arial Bold.ttf", "Arial-Bold.ttf"),
+    "Times": ("times.ttf", "Times.ttf", "Times New Roman.ttf"),
+    "Times-Bold": ("timesbd.ttf", "Times Bold.ttf", "Times-Bold.ttf"),
+    "Helvetica": ("Helvetica.ttf", "helvetica.ttf"),
+    "Helvetica-Bold": ("Helvetica-Bold.ttf", "helvetica-bold.ttf"),
+})
+
+
+def _index_font_directories(directories) -> Dict[str, str]:
+    """
+    Map the lowercase file stem of every font under directories to its path.
+    
+    Subdirectories are walked like PIL's own bare-name lookup does, since
+    Linux packages install fonts in per-family folders
+    (e.g. truetype/msttcorefonts/).
+    """
+    index = {}
+    for directory in directories:
+        for root, _, files in os.walk(directory):
+            for name in files:
+                stem, extension = os.path.splitext(name)
+                if extension.lower() in FONT_FILE_EXTENSIONS:
+                    index.setdefault(stem.lower(), os.path.join(root, name))
+    return index
+
 
 class EnhancedTypographySystem:
     """
@@ -34,6 +81,11 @@ class EnhancedTypographySystem:
         self.text_effects = text_effects
         self.brand_typography = brand_typography
         
+        # System font index, built on the first fallback font load
+        self._font_index: Dict[str, str] = {}
+        self._font_index_built = False
+        self._font_index_lock = threading.Lock()
+        
         # Initialize style databases
         self.industry_typography_styles = self._initialize_industry_styles()
         self.brand_level_typography = self._initialize_brand_level_styles()
@@ -617,7 +669,7 @@ class EnhancedTypographySystem:
     
     def _extract_colors_fallback(self, image: Image.Image, n_colors: int = 8) -> List[Tuple[int, int, int]]:
         """
-        Extract dominant colors using a simple binning approach (fallback).
+        Extract dominant colors using octree quantization (fallback).
         
         Args:
             image: PIL Image
@@ -627,18 +679,15 @@ class EnhancedTypographySystem:
             List of RGB tuples representing dominant colors
         """
         # Resize image for faster processing
-        img_small = image.resize((100, 100), Image.Resampling.LANCZOS)
+        img_small = image.resize((100, 100), Image.Resampling.LANCZOS).convert('RGB')
         
-        # Get colors
-        colors = img_small.getcolors(maxcolors=10000)
-        if not colors:
-            return [(0, 0, 0), (255, 255, 255), (128, 128, 128)]
+        # Cluster similar pixels into at most n_colors palette entries
+        quantized = img_small.quantize(colors=n_colors, method=Image.Quantize.FASTOCTREE)
+        palette = np.array(quantized.getpalette()[:n_colors * 3]).reshape(-1, 3)
         
         # Sort by frequency
-        sorted_colors = sorted(colors, key=lambda x: x[0], reverse=True)
-        
-        # Return top N colors
-        return [color[1] for color in sorted_colors[:n_colors]]
+        counts = np.bincount(np.asarray(quantized).ravel(), minlength=len(palette))
+        return [tuple(int(c) for c in palette[i]) for i in np.argsort(-counts, kind='stable') if counts[i]]
     
     def _extract_color_palette(self, dominant_colors: List[Tuple[int, int, int]], 
                             brightness: float) -> Dict[str, Tuple[int, int, int]]:
@@ -1029,8 +1078,7 @@ class EnhancedTypographySystem:
                 self.logger.error(f"Error loading fonts: {str(e)}")
                 # Further fallback to most basic fonts
                 try:
-                    from PIL import ImageFont
-                    default_font = ImageFont.load_default()
+                    default_font = load_default_font()
                     fonts = {
                         'headline': default_font,
                         'subheadline': default_font,
@@ -1069,49 +1117,44 @@ class EnhancedTypographySystem:
         try:
             from PIL import ImageFont
             
-            # Common system font locations
-            font_paths = [
-                f"/usr/share/fonts/truetype/{font_name}.ttf",
-                f"/usr/share/fonts/TTF/{font_name}.ttf",
-                f"/Library/Fonts/{font_name}.ttf",
-                f"C:\\Windows\\Fonts\\{font_name}.ttf",
-                f"{font_name}.ttf"
-            ]
-            
-            # Try standard fonts by name
-            common_fonts = {
-                "Arial": ["arial.ttf", "Arial.ttf", "ARIAL.TTF"],
-                "Arial-Bold": ["arialbd.ttf", "Arial Bold.ttf", "Arial-Bold.ttf"],
-                "Times": ["times.ttf", "Times.ttf", "Times New Roman.ttf"],
-                "Times-Bold": ["timesbd.ttf", "Times Bold.ttf", "Times-Bold.ttf"],
-                "Helvetica": ["Helvetica.ttf", "helvetica.ttf"],
-                "Helvetica-Bold": ["Helvetica-Bold.ttf", "helvetica-bold.ttf"]
-            }
-            
-            # Try to load the requested font
-            if font_name in common_fonts:
-                for font_file in common_fonts[font_name]:
-                    for prefix in ["", "/usr/share/fonts/truetype/", "/Library/Fonts/", "C:\\Windows\\Fonts\\"]:
-                        try:
-                            return ImageFont.truetype(f"{prefix}{font_file}", size)
-                        except:
-                            continue
+            # Resolve the common file names, then the requested name, through the index
+            font_files = COMMON_FONT_FILES.get(font_name, ()) + (f"{font_name}.ttf",)
+            for font_file in font_files:
+                path = self._get_font_index().get(os.path.splitext(font_file)[0].lower())
+                if path:
+                    try:
+                        return open_font(path, size)
+                    except OSError:
+                        continue
             
-            # Try all the paths
-            for path in font_paths:
+            # Let PIL resolve the bare file names (working directory and its own font paths)
+            for font_file in font_files:
                 try:
-                    return ImageFont.truetype(path, size)
-                except:
+                    return ImageFont.truetype(font_file, size)
+                except OSError:
                     continue
             
             # Last resort - use default font
-            return ImageFont.load_default()
+            return load_default_font()
             
         except Exception as e:
             self.logger.error(f"Font loading error: {str(e)}")
             # Absolute last resort
-            from PIL import ImageFont
-            return ImageFont.load_default()
+            return load_default_font()
+    
+    def _get_font_index(self) -> Dict[str, str]:
+        """
+        Return the system font index, scanning the font directories on first use.
+        
+        Returns:
+            Dictionary mapping lowercase font file stems to paths
+        """
+        if not self._font_index_built:
+            with self._font_index_lock:
+                if not self._font_index_built:
+                    self._font_index = _index_font_directories(SYSTEM_FONT_DIRECTORIES)
+                    self._font_index_built = True
+        return self._font_index
     
     def _calculate_font_sizes(self, fonts: Dict[str, Any], 
                            text_elements: Dict[str, str],
@@ -1166,7 +1209,7 @@ class EnhancedTypographySystem:
                         # Fallback to PIL font loading
                         from PIL import ImageFont
                         if hasattr(base_font, 'path'):
-                            sized_font = ImageFont.truetype(base_font.path, size)
+                            sized_font = open_font(base_font.path, size)
                         else:
                             # Use a system font with appropriate size
                             font_name = "Arial" if element != 'headline' else "Arial-Bold"
@@ -1378,18 +1421,7 @@ class EnhancedTypographySystem:
         Returns:
             (width, height) tuple
         """
-        try:
-            # Try new Pillow method first
-            bbox = font.getbbox(text)
-            return bbox[2] - bbox[0], bbox[3] - bbox[1]
-        except AttributeError:
-            try:
-                # Fall back to older method
-                return font.getsize(text)
-            except:
-                # Rough estimate if all else fails
-                size = getattr(font, 'size', 12)
-                return int(len(text) * size * 0.6), int(size * 1.2)
+        return measure_text(font, text)
     
     def _generate_text_colors(self, image: Image.Image, analysis: Dict[str, Any],
                            text_positions: Dict[str, Tuple[int, int]], 
@@ -1427,6 +1459,8 @@ class EnhancedTypographySystem:
         
     # Generate colors for each text element
         colors = {}
+        brand_elements = []
+        brand_brightness = []
     
         for element, position in text_positions.items():
             std_element = element
@@ -1451,16 +1485,11 @@ class EnhancedTypographySystem:
             # Headlines need maximum contrast
                 colors[element] = (255, 255, 255, 255) if local_brightness < 0.5 else (0, 0, 0, 255)
             elif std_element == 'brand':
-            # Brand often uses accent color
+            # Brand often uses accent color, checked for contrast after the loop
+                colors[element] = (255, 255, 255, 255) if local_brightness < 0.5 else (0, 0, 0, 255)
                 if accent_color:
-                # Check if accent has enough contrast
-                    if self._has_sufficient_contrast(accent_color[:3], local_brightness):
-                        colors[element] = accent_color
-                    else:
-                    # Use default high-contrast color
-                        colors[element] = (255, 255, 255, 255) if local_brightness < 0.5 else (0, 0, 0, 255)
-                else:
-                    colors[element] = (255, 255, 255, 255) if local_brightness < 0.5 else (0, 0, 0, 255)
+                    brand_elements.append(element)
+                    brand_brightness.append(local_brightness)
             elif std_element == 'cta':
             # CTA needs to stand out
                 colors[element] = (255, 255, 255, 255)  # Text color for CTA button
@@ -1468,6 +1497,13 @@ class EnhancedTypographySystem:
             # Other elements use default colors with good contrast
                 colors[element] = (230, 230, 230, 255) if local_brightness < 0.5 else (50, 50, 50, 255)
     
+    # Use the accent for brand elements where it has enough contrast
+        if brand_elements:
+            has_contrast = self._has_sufficient_contrast(accent_color[:3], np.array(brand_brightness))
+            for element, sufficient in zip(brand_elements, has_contrast):
+                if sufficient:
+                    colors[element] = accent_color
+    
     # Store button color specifically for CTA
         if 'call_to_action' in colors:
             button_color = accent_color if accent_color else (41, 128, 185, 230)
@@ -1476,7 +1512,7 @@ class EnhancedTypographySystem:
             cta_text_color = colors['call_to_action'][:3]
         
         # Calculate background brightness for button
-            button_brightness = (button_color[0] * 299 + button_color[1] * 587 + button_color[2] * 114) / 1000 / 255
+            button_brightness = float(luminance(button_color))
         
         # Ensure contrast between button and text
             if not self._has_sufficient_contrast(cta_text_color, button_brightness):
@@ -1526,35 +1562,31 @@ class EnhancedTypographySystem:
         region = image.crop((left, upper, right, lower))
         
         # Convert to grayscale and calculate average brightness
-        gray_region = region.convert('L')
-        brightness = sum(gray_region.getdata()) / (len(gray_region.getdata()) * 255)
+        gray_region = np.asarray(region.convert('L'))
+        brightness = float(gray_region.mean()) / 255
         
         return brightness
     
     def _has_sufficient_contrast(self, color: Tuple[int, int, int], 
-                          background_brightness: float) -> bool:
+                          background_brightness: Union[float, np.ndarray]) -> Union[bool, np.ndarray]:
         """
     Check if a color has sufficient contrast with the background.
     
     Args:
-        color: Color to check (RGB tuple)
-        background_brightness: Background brightness value (0-1)
+        color: Color to check (RGB tuple, or an (N, 3) array of colors)
+        background_brightness: Background brightness value (0-1), or an array of them
         
     Returns:
-        True if contrast is sufficient
+        True if contrast is sufficient, or a boolean array for array arguments
     """
         try:
         # Calculate relative luminance of the color
-            r, g, b = [c/255.0 for c in color]
-            luminance = 0.2126 * r + 0.7152 * g + 0.0722 * b
+            color_luminance = luminance(color, RELATIVE_LUMINANCE_WEIGHTS)
         
-        # Check contrast with background
-            if background_brightness < 0.5:
-            # Dark background
-                return luminance > 0.5
-            else:
-            # Light background
-                return luminance < 0.5
+        # Dark backgrounds need a light color, light backgrounds a dark one
+            sufficient = np.where(np.asarray(background_brightness) < 0.5,
+                                  color_luminance > 0.5, color_luminance < 0.5)
+            return bool(sufficient) if sufficient.ndim == 0 else sufficient
         except Exception as e:
             self.logger.error(f"Error checking contrast: {str(e)}")
         # Default to True to allow operation to continue
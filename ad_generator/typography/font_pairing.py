@@ -5,9 +5,203 @@ Provides reliable font selection and pairing
 import os
 import logging
 import json
-from typing import Dict, List, Tuple, Any, Optional, Union
+import re
+import sys
+from functools import lru_cache
+from typing import Dict, Iterator, List, Tuple, Any, Optional, Union
 from PIL import ImageFont
 
+# Style subdirectories searched inside every font directory
+FONT_SUBDIRECTORIES = ('display', 'sans', 'serif', 'fallback', 'mono', 'variable')
+
+# Font file extensions recognised when indexing font directories
+FONT_EXTENSIONS = ('.ttf', '.otf')
+
+# Bundled fonts tried when none of an element's fonts or fallbacks load
+PROJECT_FALLBACK_FONTS = (
+    "OpenSans-Regular.ttf",
+    "Roboto-Regular.ttf",
+    "LiberationSans-Regular.ttf",
+    "Montserrat-Regular.ttf",
+)
+
+# Style keywords mapped to the font pairing they imply, checked in order
+STYLE_PAIRING_KEYWORDS = (
+    ("sans", "modern"),
+    ("sans-serif", "modern"),
+    ("clean", "modern"),
+    ("professional", "modern"),
+    ("corporate", "modern"),
+    
+    ("serif", "luxury"),
+    ("high-end", "luxury"),
+    ("premium", "luxury"),
+    ("upscale", "luxury"),
+    ("expensive", "luxury"),
+    
+    ("mix", "contrast"),
+    ("mixed", "contrast"),
+    ("hybrid", "contrast"),
+    # Matched at this priority, ahead of the minimal and bold keywords
+    ("sophisticated", "elegant"),
+    
+    ("simple", "minimal"),
+    ("minimalist", "minimal"),
+    ("light", "minimal"),
+    ("thin", "minimal"),
+    
+    ("strong", "bold"),
+    ("heavy", "bold"),
+    ("powerful", "bold"),
+    ("impactful", "bold"),
+    
+    ("classic", "elegant"),
+    ("classy", "elegant"),
+    ("refined", "elegant"),
+    
+    ("fun", "playful"),
+    ("friendly", "playful"),
+    ("casual", "playful"),
+    ("approachable", "playful"),
+    
+    ("tech", "technical"),
+    ("functional", "technical"),
+    ("efficient", "technical"),
+    ("digital", "technical"),
+    
+    ("artistic", "creative"),
+    ("unique", "creative"),
+    ("distinctive", "creative"),
+    ("unconventional", "creative"),
+)
+
+# Weight and style words that appear in font names but are not part of the family
+_NON_FAMILY_TOKENS = frozenset({
+    'regular', 'book', 'medium', 'light', 'extralight', 'ultralight', 'thin',
+    'bold', 'semibold', 'demibold', 'demi', 'extrabold', 'ultrabold', 'heavy', 'black',
+    'italic', 'oblique', 'condensed'
+})
+
+# Most distinct (font path, size) faces kept open; shrink-to-fit and
+# responsive scaling try many sizes, so the cache must not grow unbounded
+FONT_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=FONT_CACHE_SIZE)
+def open_font(font_path: str, size: int) -> ImageFont.FreeTypeFont:
+    """Open a TrueType/OpenType font, reusing a recently parsed face when possible."""
+    return ImageFont.truetype(font_path, size)
+
+
+@lru_cache(maxsize=1)
+def load_default_font() -> ImageFont.ImageFont:
+    """Return PIL's built-in default font, decoding it only once per process."""
+    return ImageFont.load_default()
+
+
+def _bbox_dimensions(font: ImageFont.FreeTypeFont, text: str) -> Tuple[int, int]:
+    """Measure text from its bounding box (Pillow >= 8.0.0)."""
+    left, top, right, bottom = font.getbbox(text)
+    return right - left, bottom - top
+
+
+def _size_dimensions(font: ImageFont.FreeTypeFont, text: str) -> Tuple[int, int]:
+    """Measure text with the older getsize API."""
+    return font.getsize(text)
+
+
+def _estimated_dimensions(font: Any, text: str) -> Tuple[int, int]:
+    """Estimate text size from the character count."""
+    size = getattr(font, 'size', 12)
+    return int(len(text) * size * 0.6), int(size * 1.2)
+
+
+# Measuring method supported by the installed Pillow, chosen once at import
+if hasattr(ImageFont.FreeTypeFont, 'getbbox'):
+    _measure_with_pillow = _bbox_dimensions
+elif hasattr(ImageFont.FreeTypeFont, 'getsize'):
+    _measure_with_pillow = _size_dimensions
+else:
+    _measure_with_pillow = _estimated_dimensions
+
+
+@lru_cache(maxsize=4096)
+def measure_text(font: ImageFont.FreeTypeFont, text: str) -> Tuple[int, int]:
+    """
+    Measure text as (width, height) once per (font, text) pair.
+    
+    Shared by every typography engine. Fonts hash by identity, so a
+    reloaded font gets its own entries rather than stale measurements.
+    """
+    try:
+        return _measure_with_pillow(font, text)
+    except (AttributeError, TypeError):
+        # Font objects without the selected method
+        return _estimated_dimensions(font, text)
+
+
+def _font_index_key(font_name: str) -> str:
+    """Normalize a font name or file name to its font index key."""
+    font_name = font_name.lower()
+    if font_name.endswith(FONT_EXTENSIONS):
+        font_name = font_name[:-4]
+    return font_name
+
+
+@lru_cache(maxsize=1024)
+def _font_name_variations(font_name: str) -> Tuple[str, ...]:
+    """Spellings of a font name to try, in priority order and computed once per name."""
+    return tuple(dict.fromkeys((
+        font_name,
+        font_name.replace(' ', ''),
+        font_name.replace('-', ''),
+        font_name.replace(' ', '-'),
+        font_name.replace('-', ' ')
+    )))
+
+
+@lru_cache(maxsize=1024)
+def _font_index_keys(font_name: str) -> Tuple[str, ...]:
+    """Font index keys for every spelling of a font name."""
+    return tuple(dict.fromkeys(_font_index_key(variant) for variant in _font_name_variations(font_name)))
+
+
+@lru_cache(maxsize=64)
+def _match_style_keyword(style: str) -> Optional[str]:
+    """Font pairing implied by the first style keyword found in a lowercased style name."""
+    for keyword, pairing in STYLE_PAIRING_KEYWORDS:
+        if keyword in style:
+            return pairing
+    return None
+
+
+def _split_font_name(font_name: str) -> Tuple[str, Tuple[str, ...]]:
+    """Split a font name into its lowercased family and its weight/style tokens."""
+    parts = [part for part in re.split(r'[-_ ]+', font_name.lower()) if part]
+    family = ' '.join(part for part in parts if part not in _NON_FAMILY_TOKENS)
+    styles = tuple(part for part in parts if part in _NON_FAMILY_TOKENS)
+    return family, styles
+
+
+def _freeze_font_table(table: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert the font lists in a font table to tuples of interned names.
+    
+    Font names such as 'Helvetica Neue-Bold' repeat across styles, brands and
+    industries; interning makes every occurrence share one string object, and
+    tuples keep the shared lists from being mutated by callers.
+    """
+    frozen = {}
+    for key, value in table.items():
+        if isinstance(value, dict):
+            frozen[key] = _freeze_font_table(value)
+        elif isinstance(value, list):
+            frozen[key] = tuple(sys.intern(name) if isinstance(name, str) else name for name in value)
+        else:
+            frozen[key] = value
+    return frozen
+
+
 class FontPairingEngine:
     """
     Engine for intelligent font selection and pairing.
@@ -30,26 +224,30 @@ class FontPairingEngine:
         # Cache for loaded fonts
         self.font_cache = {}
 
+        # Resolved file path for each font name that loaded successfully
+        self.font_paths: Dict[str, str] = {}
+
+        # Index of every font file in the font directories, plus one file per family
+        self.font_index = self._build_font_index()
+        self.font_families = self._build_font_families()
+
         # Load font mapping
         self.font_mapping = self._load_font_mapping()
+        self.mapped_alternative_keys = tuple(dict.fromkeys(
+            _font_index_key(alt) for alternatives in self.font_mapping.values() for alt in alternatives
+        ))
     
         # Initialize font pairings
-        self.font_pairings = self._initialize_font_pairings()
+        self.font_pairings = _freeze_font_table(self._initialize_font_pairings())
     
         # Initialize brand-specific fonts
-        self.brand_fonts = self._initialize_brand_fonts()
+        self.brand_fonts = _freeze_font_table(self._initialize_brand_fonts())
     
         # Initialize industry-specific fonts
-        self.industry_fonts = self._initialize_industry_fonts()
+        self.industry_fonts = _freeze_font_table(self._initialize_industry_fonts())
     
         # Validate and load system fonts
         self.available_fonts = self._discover_available_fonts()
-
-        self.font_directories
-        self.font_pairings = self._initialize_font_pairings()
-        self.brand_fonts = self._initialize_brand_fonts()
-        self.industry_fonts = self._initialize_industry_fonts()
-        self.available_fonts = self._discover_available_fonts()
         
         # Log font setup results
         self.logger.info(f"Font setup complete. Found {len(self.available_fonts)} fonts.")
@@ -405,28 +603,7 @@ Add these methods to font_pairing.py to resolve remaining initialization issues
     Returns:
         List of available font names
     """
-        available_fonts = []
-    
-    # Check each font directory
-        for directory in self.font_directories:
-            if not os.path.exists(directory):
-                continue
-            
-        # Check main directory
-            try:
-                for file in os.listdir(directory):
-                    if file.lower().endswith(('.ttf', '.otf')):
-                        available_fonts.append(file)
-                    
-            # Check subdirectories
-                for subdir in ['display', 'sans', 'serif', 'fallback', 'mono', 'variable']:
-                    subdir_path = os.path.join(directory, subdir)
-                    if os.path.exists(subdir_path):
-                        for file in os.listdir(subdir_path):
-                            if file.lower().endswith(('.ttf', '.otf')):
-                                available_fonts.append(file)
-            except Exception as e:
-                self.logger.warning(f"Error scanning directory {directory}: {str(e)}")
+        available_fonts = [os.path.basename(path) for path in self.font_index.values()]
     
         self.logger.info(f"Discovered {len(available_fonts)} available fonts")
         return available_fonts
@@ -477,11 +654,12 @@ Add these methods to font_pairing.py to resolve remaining initialization issues
         # Try each mapping path
         for mapping_file in mapping_paths:
             try:
-                if os.path.exists(mapping_file):
-                    with open(mapping_file, 'r') as f:
-                        mapping = json.load(f)
-                    self.logger.info(f"Loaded font mapping from {mapping_file}")
-                    return mapping
+                with open(mapping_file, 'r') as f:
+                    mapping = json.load(f)
+                self.logger.info(f"Loaded font mapping from {mapping_file}")
+                return mapping
+            except FileNotFoundError:
+                continue
             except Exception as e:
                 self.logger.warning(f"Could not load font mapping from {mapping_file}: {str(e)}")
     
@@ -505,129 +683,32 @@ Add these methods to font_pairing.py to resolve remaining initialization issues
         cache_key = f"{font_name}_{size}"
         if cache_key in self.font_cache:
             return self.font_cache[cache_key]
-            
-        # Standard font name formats to try
-        font_variations = [
-            font_name,
-            font_name.replace(' ', ''),
-            font_name.replace('-', ''),
-            font_name.replace(' ', '-'),
-            font_name.replace('-', ' ')
-        ]
         
-        # Standard extensions to try
-        extensions = ['.ttf', '.otf', '.TTF', '.OTF', '']
+        # A previously resolved path skips the directory probe entirely
+        font_path = self.font_paths.get(font_name)
+        if font_path:
+            try:
+                font = open_font(font_path, size)
+                self.font_cache[cache_key] = font
+                return font
+            except Exception as e:
+                self.logger.debug(f"Failed to reload font {font_path}: {str(e)}")
+                del self.font_paths[font_name]
         
-        # First try mapped alternatives
-        font_mapped = self._get_mapped_font_file(font_name)
-        if font_mapped:
-            for directory in self.font_directories:
-                # Try subdirectories first
-                for subdir in ['display', 'sans', 'serif', 'fallback', 'mono', 'variable']:
-                    subdir_path = os.path.join(directory, subdir)
-                    if os.path.exists(subdir_path):
-                        font_path = os.path.join(subdir_path, font_mapped)
-                        if os.path.exists(font_path):
-                            try:
-                                font = ImageFont.truetype(font_path, size)
-                                self.font_cache[cache_key] = font
-                                self.logger.info(f"Loaded mapped font: {font_path}")
-                                return font
-                            except Exception as e:
-                                self.logger.debug(f"Failed to load mapped font {font_path}: {str(e)}")
-                
-                # Also try in main directory
-                font_path = os.path.join(directory, font_mapped)
-                if os.path.exists(font_path):
-                    try:
-                        font = ImageFont.truetype(font_path, size)
-                        self.font_cache[cache_key] = font
-                        self.logger.info(f"Loaded mapped font: {font_path}")
-                        return font
-                    except Exception as e:
-                        self.logger.debug(f"Failed to load mapped font {font_path}: {str(e)}")
-        
-        # Try direct variations with extensions
-        for directory in self.font_directories:
-            if not os.path.exists(directory):
+        for font_path, source in self._candidate_font_paths(font_name):
+            try:
+                font = open_font(font_path, size)
+            except Exception as e:
+                self.logger.debug(f"Failed to load {source} {font_path}: {str(e)}")
                 continue
-                
-            # Try subdirectories first
-            for subdir in ['display', 'sans', 'serif', 'fallback', 'mono', 'variable']:
-                subdir_path = os.path.join(directory, subdir)
-                if not os.path.exists(subdir_path):
-                    continue
-                    
-                # Try all variations with all extensions
-                for variant in font_variations:
-                    for ext in extensions:
-                        font_path = os.path.join(subdir_path, f"{variant}{ext}")
-                        if os.path.exists(font_path):
-                            try:
-                                font = ImageFont.truetype(font_path, size)
-                                self.font_cache[cache_key] = font
-                                self.logger.info(f"Loaded font: {font_path}")
-                                return font
-                            except Exception as e:
-                                self.logger.debug(f"Failed to load font {font_path}: {str(e)}")
-            
-            # Also try in the main directory
-            for variant in font_variations:
-                for ext in extensions:
-                    font_path = os.path.join(directory, f"{variant}{ext}")
-                    if os.path.exists(font_path):
-                        try:
-                            font = ImageFont.truetype(font_path, size)
-                            self.font_cache[cache_key] = font
-                            self.logger.info(f"Loaded font: {font_path}")
-                            return font
-                        except Exception as e:
-                            self.logger.debug(f"Failed to load font {font_path}: {str(e)}")
-        
-        # Try mapped alternatives from the whole mapping
-        mapped_alternatives = []
-        for mapped_name, alternatives in self.font_mapping.items():
-            mapped_alternatives.extend(alternatives)
-        
-        # Make unique
-        mapped_alternatives = list(set(mapped_alternatives))
-        
-        # Try these alternatives in all directories
-        for alt in mapped_alternatives:
-            for directory in self.font_directories:
-                if not os.path.exists(directory):
-                    continue
-                
-                # Try subdirectories
-                for subdir in ['display', 'sans', 'serif', 'fallback', 'mono', 'variable']:
-                    subdir_path = os.path.join(directory, subdir)
-                    if not os.path.exists(subdir_path):
-                        continue
-                        
-                    font_path = os.path.join(subdir_path, alt)
-                    if os.path.exists(font_path):
-                        try:
-                            font = ImageFont.truetype(font_path, size)
-                            self.font_cache[cache_key] = font
-                            self.logger.info(f"Loaded alternative font: {font_path}")
-                            return font
-                        except Exception as e:
-                            self.logger.debug(f"Failed to load alternative font {font_path}: {str(e)}")
-                
-                # Try main directory
-                font_path = os.path.join(directory, alt)
-                if os.path.exists(font_path):
-                    try:
-                        font = ImageFont.truetype(font_path, size)
-                        self.font_cache[cache_key] = font
-                        self.logger.info(f"Loaded alternative font: {font_path}")
-                        return font
-                    except Exception as e:
-                        self.logger.debug(f"Failed to load alternative font {font_path}: {str(e)}")
+            self.font_paths[font_name] = font_path
+            self.font_cache[cache_key] = font
+            self.logger.info(f"Loaded {source}: {font_path}")
+            return font
         
         # Last resort - use PIL's default font
         try:
-            default_font = ImageFont.load_default()
+            default_font = load_default_font()
             self.font_cache[cache_key] = default_font
             self.logger.warning(f"Using PIL default font as last resort for {font_name}")
             return default_font
@@ -635,6 +716,110 @@ Add these methods to font_pairing.py to resolve remaining initialization issues
             self.logger.error(f"Failed to load default font: {str(e)}")
             return None
 
+    def _candidate_font_paths(self, font_name: str) -> Iterator[Tuple[str, str]]:
+        """
+        Yield indexed font files that could satisfy a font name, best match first.
+        
+        Args:
+            font_name: Font name to resolve
+            
+        Yields:
+            Tuples of (font path, description of how it was matched)
+        """
+        # First try mapped alternatives
+        font_mapped = self._get_mapped_font_file(font_name)
+        if font_mapped:
+            font_path = self.font_index.get(_font_index_key(font_mapped))
+            if font_path:
+                yield font_path, "mapped font"
+        
+        # Standard font name formats to try
+        for key in _font_index_keys(font_name):
+            font_path = self.font_index.get(key)
+            if font_path:
+                yield font_path, "font"
+        
+        # Bare family names resolve to that family's regular weight
+        for key in _font_index_keys(font_name):
+            font_path = self.font_families.get(key)
+            if font_path:
+                yield font_path, "font family"
+        
+        # Try mapped alternatives from the whole mapping
+        for key in self.mapped_alternative_keys:
+            font_path = self.font_index.get(key)
+            if font_path:
+                yield font_path, "alternative font"
+
+    def _build_font_index(self) -> Dict[str, str]:
+        """
+        Scan every font directory once and index font files by name.
+        
+        Style subdirectories are indexed before their parent directory and
+        earlier directories take priority, matching the lookup order.
+        
+        Returns:
+            Dictionary mapping lowercased font file names (without extension) to paths
+        """
+        font_index = {}
+        for directory in self.font_directories:
+            font_files, subdirs = self._scan_font_directory(directory)
+            
+            # Only style subdirectories present in the listing are scanned
+            for subdir in FONT_SUBDIRECTORIES:
+                if subdir in subdirs:
+                    for key, path in self._scan_font_directory(subdirs[subdir])[0].items():
+                        font_index.setdefault(key, path)
+            
+            for key, path in font_files.items():
+                font_index.setdefault(key, path)
+        
+        self.logger.debug(f"Indexed {len(font_index)} font files")
+        return font_index
+
+    def _scan_font_directory(self, directory: str) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        List one directory's font files and subdirectories with a single scandir.
+        
+        Args:
+            directory: Directory to scan
+            
+        Returns:
+            Tuple of (font index entries, subdirectory name to path)
+        """
+        font_files = {}
+        subdirs = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        subdirs[entry.name] = entry.path
+                    elif entry.name.lower().endswith(FONT_EXTENSIONS) and entry.is_file():
+                        font_files.setdefault(_font_index_key(entry.name), entry.path)
+        except OSError as e:
+            self.logger.warning(f"Error scanning directory {directory}: {str(e)}")
+        return font_files, subdirs
+
+    def _build_font_families(self) -> Dict[str, str]:
+        """
+        Map each font family in the index to one of its files, preferring the regular weight.
+        
+        Returns:
+            Dictionary mapping lowercased family names to font paths
+        """
+        font_families = {}
+        regular_families = set()
+        for key, path in self.font_index.items():
+            family, styles = _split_font_name(key)
+            if not family or family in regular_families:
+                continue
+            if set(styles) <= {'regular', 'book'}:
+                regular_families.add(family)
+                font_families[family] = path
+            else:
+                font_families.setdefault(family, path)
+        return font_families
+
     def _get_mapped_font_file(self, font_name: str) -> Optional[str]:
         """
         Get mapped font filename from the mapping.
@@ -652,15 +837,7 @@ Add these methods to font_pairing.py to resolve remaining initialization issues
                 return alternatives[0]
         
         # Try variations
-        font_variations = [
-            font_name,
-            font_name.replace(' ', ''),
-            font_name.replace('-', ''),
-            font_name.replace(' ', '-'),
-            font_name.replace('-', ' ')
-        ]
-        
-        for variant in font_variations:
+        for variant in _font_name_variations(font_name):
             if variant in self.font_mapping:
                 alternatives = self.font_mapping[variant]
                 if alternatives:
@@ -686,28 +863,28 @@ Add these methods to font_pairing.py to resolve remaining initialization issues
         
         found_fonts = {}
         
-        # Check each directory
+        # Check each directory, listing it once instead of probing it first
         for directory in self.font_directories:
-            if os.path.exists(directory):
-                self.logger.info(f"Font directory exists: {directory}")
-                
-                # Check for font files in main directory
-                main_fonts = [f for f in os.listdir(directory) 
-                            if f.lower().endswith(('.ttf', '.otf'))]
-                found_fonts[directory] = len(main_fonts)
-                
-                # Check subdirectories
-                expected_subdirs = ['display', 'sans', 'serif', 'fallback', 'mono', 'variable']
-                for subdir in expected_subdirs:
-                    subdir_path = os.path.join(directory, subdir)
-                    if os.path.exists(subdir_path):
-                        # Count fonts in this subdirectory
-                        subdir_fonts = [f for f in os.listdir(subdir_path) 
-                                      if f.lower().endswith(('.ttf', '.otf'))]
-                        found_fonts[subdir_path] = len(subdir_fonts)
-                        self.logger.info(f"  - {subdir}: {len(subdir_fonts)} fonts")
-            else:
+            try:
+                with os.scandir(directory) as entries:
+                    listing = {entry.name: entry for entry in entries}
+            except OSError:
                 self.logger.warning(f"Font directory does not exist: {directory}")
+                continue
+            
+            self.logger.info(f"Font directory exists: {directory}")
+            
+            # Check for font files in main directory
+            found_fonts[directory] = sum(1 for name in listing if name.lower().endswith(FONT_EXTENSIONS))
+            
+            # Check the style subdirectories present in the listing
+            for subdir in FONT_SUBDIRECTORIES:
+                entry = listing.get(subdir)
+                if entry is not None and entry.is_dir():
+                    # Count fonts in this subdirectory
+                    subdir_fonts = self._scan_font_directory(entry.path)[0]
+                    found_fonts[entry.path] = len(subdir_fonts)
+                    self.logger.info(f"  - {subdir}: {len(subdir_fonts)} fonts")
         
         # Test load some common fonts
         self.logger.info("Testing font loading capability:")
@@ -739,19 +916,23 @@ Add these methods to font_pairing.py to resolve remaining initialization issues
         # 1. Check font directories
         self.logger.info("Font directories:")
         for i, directory in enumerate(self.font_directories):
-            exists = os.path.exists(directory)
-            self.logger.info(f"  {i+1}. {directory} - {'EXISTS' if exists else 'MISSING'}")
+            try:
+                files = os.listdir(directory)
+            except FileNotFoundError:
+                self.logger.info(f"  {i+1}. {directory} - MISSING")
+                continue
+            except Exception as e:
+                self.logger.info(f"  {i+1}. {directory} - EXISTS")
+                self.logger.error(f"Error reading directory: {str(e)}")
+                continue
+            
+            self.logger.info(f"  {i+1}. {directory} - EXISTS")
             
-            if exists:
-                # List some fonts in this directory
-                try:
-                    files = os.listdir(directory)
-                    fonts = [f for f in files if f.lower().endswith(('.ttf', '.otf'))]
-                    self.logger.info(f"    Found {len(fonts)} font files")
-                    if fonts:
-                        self.logger.info(f"    Examples: {', '.join(fonts[:5])}")
-                except Exception as e:
-                    self.logger.error(f"Error reading directory: {str(e)}")
+            # List some fonts in this directory
+            fonts = [f for f in files if f.lower().endswith(FONT_EXTENSIONS)]
+            self.logger.info(f"    Found {len(fonts)} font files")
+            if fonts:
+                self.logger.info(f"    Examples: {', '.join(fonts[:5])}")
         
         # 2. Check font mapping
         self.logger.info("Font mapping:")
@@ -778,15 +959,10 @@ Add these methods to font_pairing.py to resolve remaining initialization issues
         fallbacks = ["Montserrat-Regular.ttf", "OpenSans-Regular.ttf", "Roboto-Regular.ttf", "LiberationSans-Regular.ttf"]
         
         for fallback in fallbacks:
-            found = False
-            for directory in self.font_directories:
-                path = os.path.join(directory, fallback)
-                if os.path.exists(path):
-                    found = True
-                    self.logger.info(f"  {fallback}: FOUND at {path}")
-                    break
-            
-            if not found:
+            path = self.font_index.get(_font_index_key(fallback))
+            if path:
+                self.logger.info(f"  {fallback}: FOUND at {path}")
+            else:
                 self.logger.warning(f"  {fallback}: NOT FOUND")
         
         self.logger.info("====================================")
@@ -929,14 +1105,7 @@ Add these methods to font_pairing.py to resolve remaining initialization issues
                 return font
     
         # Last resort - try project bundled fonts
-        project_fallbacks = [
-            "OpenSans-Regular.ttf",
-            "Roboto-Regular.ttf",
-            "LiberationSans-Regular.ttf",
-            "Montserrat-Regular.ttf"
-        ]
-    
-        for fallback in project_fallbacks:
+        for fallback in PROJECT_FALLBACK_FONTS:
             font = self._load_font(fallback, size)
             if font:
                 self.font_cache[cache_key] = font
@@ -945,7 +1114,7 @@ Add these methods to font_pairing.py to resolve remaining initialization issues
     
         # Try PIL default font as absolute last resort
         try:
-            default_font = ImageFont.load_default()
+            default_font = load_default_font()
             self.logger.warning(f"Using PIL default font for {element} as last resort")
             self.font_cache[cache_key] = default_font
             return default_font
@@ -1074,59 +1243,5 @@ Add these methods to font_pairing.py to resolve remaining initialization issues
         if style_lower in self.font_pairings:
             return style_lower
         
-        # Map to a similar style
-        style_mapping = {
-            "sans": "modern",
-            "sans-serif": "modern",
-            "clean": "modern",
-            "professional": "modern",
-            "corporate": "modern",
-            
-            "serif": "luxury",
-            "high-end": "luxury",
-            "premium": "luxury",
-            "upscale": "luxury",
-            "expensive": "luxury",
-            
-            "mix": "contrast",
-            "mixed": "contrast",
-            "hybrid": "contrast",
-            "sophisticated": "contrast",
-            
-            "simple": "minimal",
-            "minimalist": "minimal",
-            "light": "minimal",
-            "thin": "minimal",
-            
-            "strong": "bold",
-            "heavy": "bold",
-            "powerful": "bold",
-            "impactful": "bold",
-            
-            "classic": "elegant",
-            "classy": "elegant",
-            "refined": "elegant",
-            "sophisticated": "elegant",
-            
-            "fun": "playful",
-            "friendly": "playful",
-            "casual": "playful",
-            "approachable": "playful",
-            
-            "tech": "technical",
-            "functional": "technical",
-            "efficient": "technical",
-            "digital": "technical",
-            
-            "artistic": "creative",
-            "unique": "creative",
-            "distinctive": "creative",
-            "unconventional": "creative"
-        }
-        
-        for keyword, pairing in style_mapping.items():
-            if keyword in style_lower:
-                return pairing
-        
-        # Default to modern
-        return "modern"
\ No newline at end of file
+        # Map to a similar style, defaulting to modern
+        return _match_style_keyword(style_lower) or "modern"
@@ -2,12 +2,35 @@
 Text Layout Engine for Professional Ad Typography
 Provides advanced layout algorithms for ideal text placement
 """
+import copy
+import hashlib
 import logging
 import math
+from collections import OrderedDict
 from typing import Dict, List, Tuple, Any, Optional, Union
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 
+from .font_pairing import measure_text
+
+# Row and column labels of the 3x3 rule-of-thirds grid
+GRID_ROWS = ('top', 'middle', 'bottom')
+GRID_COLUMNS = ('left', 'center', 'right')
+GRID_POSITIONS = np.array([[f"{row}_{col}" for col in GRID_COLUMNS] for row in GRID_ROWS])
+
+# Images larger than this are downsampled to BRIGHTNESS_SAMPLE_SIZE before measuring brightness
+BRIGHTNESS_SAMPLE_THRESHOLD = 256
+BRIGHTNESS_SAMPLE_SIZE = (192, 192)
+
+# Number of recent image analyses each layout engine keeps
+ANALYSIS_CACHE_SIZE = 32
+
+
+def _image_cache_key(image: Image.Image) -> Tuple[str, Tuple[int, int], bytes]:
+    """Content key for an image: its mode, size and a digest of all of its pixels."""
+    return image.mode, image.size, hashlib.blake2b(image.tobytes(), digest_size=16).digest()
+
+
 class TextLayoutEngine:
     """
     Engine for calculating optimal text placement in advertisements.
@@ -21,6 +44,9 @@ class TextLayoutEngine:
         
         # Initialize layout strategies
         self.layout_strategies = self._initialize_layout_strategies()
+        
+        # Recent analyze_image results keyed by image content, least recently used first
+        self._analysis_cache: OrderedDict = OrderedDict()
     
     def _initialize_layout_strategies(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -207,34 +233,52 @@ class TextLayoutEngine:
             image: Image to analyze
             
         Returns:
-            Analysis results
+            Analysis results (a fresh copy the caller may modify)
         """
+        # The same creative is often analyzed again for every ad variant
+        cache_key = _image_cache_key(image)
+        cached = self._analysis_cache.get(cache_key)
+        if cached is not None:
+            self._analysis_cache.move_to_end(cache_key)
+            return copy.deepcopy(cached)
+        
         try:
+            # Convert to grayscale and find edges once for every analysis below
+            gray = image.convert('L')
+            edges = np.asarray(gray.filter(ImageFilter.FIND_EDGES))
+            
             # Calculate brightness map
-            brightness_map = self._calculate_brightness_map(image)
+            brightness_grid, overall_brightness = self._calculate_brightness_grid(gray)
+            brightness_map = self._brightness_grid_to_map(brightness_grid, overall_brightness)
             
             # Find subject position
-            subject_position = self._detect_subject_position(image)
+            subject_position = self._detect_subject_position(edges)
             
             # Analyze edges for visual complexity
-            edge_complexity = self._analyze_edge_complexity(image)
+            edge_complexity = self._analyze_edge_complexity(edges)
             
             # Determine rule of thirds points
             rule_of_thirds = self._calculate_rule_of_thirds(image.size)
             
             # Find ideal text areas
-            ideal_text_areas = self._find_ideal_text_areas(brightness_map, subject_position, edge_complexity)
+            ideal_text_areas = self._find_ideal_text_areas(brightness_grid, overall_brightness,
+                                                           subject_position, edge_complexity)
             
-            # Return analysis results
-            return {
+            analysis = {
                 "brightness_map": brightness_map,
                 "subject_position": subject_position,
                 "edge_complexity": edge_complexity,
                 "rule_of_thirds": rule_of_thirds,
                 "ideal_text_areas": ideal_text_areas,
-                "overall_brightness": brightness_map.get("overall", 0.5)
+                "overall_brightness": overall_brightness
             }
             
+            # Cache a private copy and return analysis results
+            self._analysis_cache[cache_key] = copy.deepcopy(analysis)
+            if len(self._analysis_cache) > ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
+            return analysis
+            
         except Exception as e:
             self.logger.error(f"Error analyzing image: {str(e)}")
             # Return default analysis
@@ -257,75 +301,74 @@ class TextLayoutEngine:
         Returns:
             Dictionary with brightness values for different regions
         """
+        return self._brightness_grid_to_map(*self._calculate_brightness_grid(image))
+    
+    def _calculate_brightness_grid(self, image: Image.Image) -> Tuple[np.ndarray, float]:
+        """
+        Calculate the brightness of each rule-of-thirds cell and of the whole image.
+        
+        Args:
+            image: PIL Image object
+            
+        Returns:
+            Tuple of (3x3 array of cell brightness, overall brightness), all between 0 and 1
+        """
+        # Cell averages are practically unchanged on a box-filtered thumbnail
+        if max(image.size) > BRIGHTNESS_SAMPLE_THRESHOLD:
+            image = image.resize(BRIGHTNESS_SAMPLE_SIZE, Image.Resampling.BOX)
+        
         # Convert to grayscale
-        gray = image.convert('L')
-        width, height = gray.size
+        gray = np.asarray(image.convert('L'))
+        height, width = gray.shape
         
         # Divide the image into a 3x3 grid (Rule of Thirds)
         cell_width = width // 3
         cell_height = height // 3
         
-        brightness_map = {}
-        
-        # Analyze each cell
-        for row in range(3):
-            for col in range(3):
-                # Define cell boundaries
-                left = col * cell_width
-                upper = row * cell_height
-                right = left + cell_width
-                lower = upper + cell_height
-                
-                # Crop and calculate brightness
-                cell = gray.crop((left, upper, right, lower))
-                brightness = float(np.array(cell).sum()) / (cell_width * cell_height * 255)
-                
-                # Store in map
-                position = f"{['top', 'middle', 'bottom'][row]}_{['left', 'center', 'right'][col]}"
-                brightness_map[position] = brightness
+        # Average every cell in one pass by folding the grid into extra axes
+        gray = gray.astype(np.float32)
+        grid = gray[:cell_height * 3, :cell_width * 3].reshape(3, cell_height, 3, cell_width)
+        cell_brightness = grid.mean(axis=(1, 3)) / 255
         
-        # Calculate overall brightness
-        brightness_map['overall'] = float(np.array(gray).sum()) / (width * height * 255)
+        return cell_brightness, float(gray.mean()) / 255
+    
+    def _brightness_grid_to_map(self, brightness_grid: np.ndarray, overall_brightness: float) -> Dict[str, float]:
+        """
+        Label a 3x3 brightness grid with its region names.
         
+        Args:
+            brightness_grid: 3x3 array of cell brightness
+            overall_brightness: Overall image brightness
+            
+        Returns:
+            Dictionary with brightness values for different regions
+        """
+        brightness_map = dict(zip(GRID_POSITIONS.ravel().tolist(), brightness_grid.ravel().tolist()))
+        brightness_map['overall'] = overall_brightness
         return brightness_map
     
-    def _detect_subject_position(self, image: Image.Image) -> Dict[str, float]:
+    def _detect_subject_position(self, edges: np.ndarray) -> Dict[str, float]:
         """
         Detect the main subject position in the image.
         
         Args:
-            image: PIL Image object
+            edges: Edge-detected grayscale image as an array
             
         Returns:
             Dictionary with normalized subject position {x, y}
         """
         try:
-            # Convert to grayscale
-            gray = image.convert('L')
-            width, height = gray.size
-            
-            # Apply edge detection
-            edges = gray.filter(ImageFilter.FIND_EDGES)
+            height, width = edges.shape
             
             # Find strongest edges
-            edge_data = list(np.array(edges).flatten())
-            strongest_edges = []
-            threshold = sum(edge_data) / len(edge_data) * 1.5  # Adjust threshold as needed
-            
-            for y in range(height):
-                for x in range(width):
-                    pixel_value = edges.getpixel((x, y))
-                    if pixel_value > threshold:
-                        strongest_edges.append((x, y))
+            threshold = edges.mean() * 1.5  # Adjust threshold as needed
+            edge_y, edge_x = np.nonzero(edges > threshold)
             
             # Calculate center of strongest edges
-            if strongest_edges:
-                center_x = sum(x for x, y in strongest_edges) / len(strongest_edges)
-                center_y = sum(y for x, y in strongest_edges) / len(strongest_edges)
-                
+            if edge_x.size:
                 # Normalize to 0-1 range
-                normalized_x = center_x / width
-                normalized_y = center_y / height
+                normalized_x = float(edge_x.mean()) / width
+                normalized_y = float(edge_y.mean()) / height
                 
                 return {
                     "x": normalized_x,
@@ -339,27 +382,20 @@ class TextLayoutEngine:
             self.logger.error(f"Error detecting subject position: {str(e)}")
             return {"x": 0.5, "y": 0.5}
     
-    def _analyze_edge_complexity(self, image: Image.Image) -> float:
+    def _analyze_edge_complexity(self, edges: np.ndarray) -> float:
         """
         Analyze edge complexity to determine visual complexity.
         
         Args:
-            image: PIL Image object
+            edges: Edge-detected grayscale image as an array
             
         Returns:
             Complexity score from 0.0 (simple) to 1.0 (complex)
         """
         try:
-            # Convert to grayscale
-            gray = image.convert('L')
-            
-            # Apply edge detection
-            edges = gray.filter(ImageFilter.FIND_EDGES)
-            
             # Calculate edge density
-            edge_data = list(np.array(edges).flatten())
-            edge_sum = sum(edge_data)
-            max_possible = 255 * len(edge_data)
+            edge_sum = float(edges.sum())
+            max_possible = 255 * edges.size
             
             # Normalize to 0-1 range
             complexity = min(1.0, edge_sum / max_possible * 10)  # Scale for reasonable values
@@ -398,34 +434,28 @@ class TextLayoutEngine:
             "intersections": intersections
         }
     
-    def _find_ideal_text_areas(self, brightness_map: Dict[str, float],
+    def _find_ideal_text_areas(self, brightness_grid: np.ndarray,
+                              overall_brightness: float,
                               subject_position: Dict[str, float],
                               edge_complexity: float) -> List[str]:
         """
         Find ideal areas for text placement based on image analysis.
         
         Args:
-            brightness_map: Brightness map of the image
+            brightness_grid: 3x3 array of cell brightness
+            overall_brightness: Overall image brightness
             subject_position: Position of the main subject
             edge_complexity: Edge complexity score
             
         Returns:
             List of areas suitable for text
         """
-        ideal_areas = []
-        
         # Determine if image is bright or dark overall
-        overall_brightness = brightness_map.get("overall", 0.5)
         is_bright = overall_brightness > 0.5
         
         # Find areas with good contrast
-        for position, brightness in brightness_map.items():
-            if position == "overall":
-                continue
-                
-            # Check for adequate contrast
-            if (is_bright and brightness < 0.4) or (not is_bright and brightness > 0.6):
-                ideal_areas.append(position)
+        contrast = brightness_grid < 0.4 if is_bright else brightness_grid > 0.6
+        ideal_areas = GRID_POSITIONS[contrast].tolist()
         
         # If no ideal areas found, use areas away from subject
         if not ideal_areas:
@@ -437,21 +467,15 @@ class TextLayoutEngine:
             subject_col = 0 if x < 0.33 else 1 if x < 0.66 else 2
             
             # Find positions away from subject
-            subject_pos = f"{['top', 'middle', 'bottom'][subject_row]}_{['left', 'center', 'right'][subject_col]}"
+            subject_pos = str(GRID_POSITIONS[subject_row, subject_col])
             
             # Add areas on opposite side
-            opposite_row = 2 - subject_row
-            opposite_col = 2 - subject_col
-            
-            opposite_pos = f"{['top', 'middle', 'bottom'][opposite_row]}_{['left', 'center', 'right'][opposite_col]}"
+            opposite_pos = str(GRID_POSITIONS[2 - subject_row, 2 - subject_col])
             ideal_areas.append(opposite_pos)
             
             # Add other positions not containing the subject
-            for row in range(3):
-                for col in range(3):
-                    pos = f"{['top', 'middle', 'bottom'][row]}_{['left', 'center', 'right'][col]}"
-                    if pos != subject_pos and pos != opposite_pos:
-                        ideal_areas.append(pos)
+            ideal_areas.extend(pos for pos in GRID_POSITIONS.ravel().tolist()
+                               if pos != subject_pos and pos != opposite_pos)
         
         # Prioritize areas based on common ad layout patterns
         if edge_complexity > 0.7:
@@ -1009,16 +1033,4 @@ class TextLayoutEngine:
         Returns:
             (width, height) tuple
         """
-        try:
-            # Try getbbox method first (Pillow >= 8.0.0)
-            bbox = font.getbbox(text)
-            if bbox:
-                return bbox[2] - bbox[0], bbox[3] - bbox[1]
-        except (AttributeError, TypeError):
-            try:
-                # Try older PIL method
-                return font.getsize(text)
-            except:
-                # Estimate based on character count
-                size = getattr(font, 'size', 12)
-                return int(len(text) * size * 0.6), int(size * 1.2) 
+        return measure_text(font, text)
@@ -4,9 +4,184 @@ Provides sophisticated text effects and treatments for advertising typography
 """
 import math
 import logging
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, List, Tuple, Any, Optional, Union
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont, ImageFilter, ImageEnhance, ImageChops
 
+from .font_pairing import load_default_font, measure_text
+
+# Scratch surface used only for measuring text
+_MEASURE_DRAW = ImageDraw.Draw(Image.new('L', (1, 1)))
+
+# Number of distinct layer sizes kept in each thread's scratch pool
+SCRATCH_POOL_SIZE = 16
+
+
+@lru_cache(maxsize=256)
+def text_mask(font: ImageFont.FreeTypeFont, text: str,
+              anchor: Optional[str] = None) -> Tuple[Image.Image, Tuple[int, int]]:
+    """
+    Rasterize text once into an 'L' coverage mask.
+    
+    Returns the mask and the offset of its top-left corner from the text
+    origin (interpreted with the given anchor, as in ImageDraw.text). The
+    mask is shared between callers and must not be modified.
+    """
+    left, top, right, bottom = _MEASURE_DRAW.textbbox((0, 0), text, font=font, anchor=anchor)
+    mask = Image.new('L', (max(right - left, 1), max(bottom - top, 1)), 0)
+    ImageDraw.Draw(mask).text((-left, -top), text, font=font, fill=255, anchor=anchor)
+    return mask, (left, top)
+
+
+@lru_cache(maxsize=128)
+def _outline_mask(font: ImageFont.FreeTypeFont, text: str, size: int) -> Tuple[Image.Image, Tuple[int, int]]:
+    """
+    Text mask grown by size pixels in every direction, with its offset from the text origin.
+    
+    Pillow's native stroke renders it in one pass instead of drawing the
+    text once per outline direction.
+    """
+    left, top, right, bottom = _MEASURE_DRAW.textbbox((0, 0), text, font=font, stroke_width=size)
+    mask = Image.new('L', (max(right - left, 1), max(bottom - top, 1)), 0)
+    ImageDraw.Draw(mask).text((-left, -top), text, font=font, fill=255, stroke_width=size, stroke_fill=255)
+    return mask, (left, top)
+
+
+def _paste_outline(layer: Image.Image, position: Tuple[int, int], text: str,
+                   font: ImageFont.FreeTypeFont, fill: Tuple[int, ...], size: int) -> None:
+    """Draw a size-pixel outline of text onto layer with a single paste."""
+    mask, (left, top) = _outline_mask(font, text, size)
+    layer.paste(fill, (position[0] + left, position[1] + top), mask)
+
+
+def _paste_text(layer: Image.Image, position: Tuple[int, int], text: str,
+                font: ImageFont.FreeTypeFont, fill: Tuple[int, ...],
+                anchor: Optional[str] = None) -> None:
+    """Draw text onto layer exactly like ImageDraw.text, reusing the cached glyph mask."""
+    mask, (left, top) = text_mask(font, text, anchor)
+    layer.paste(fill, (position[0] + left, position[1] + top), mask)
+
+
+def _colored_text(font: ImageFont.FreeTypeFont, text: str,
+                  fill: Tuple[int, ...]) -> Tuple[Image.Image, Tuple[int, int]]:
+    """Glyph-sized RGBA image of text in one color, with its offset from the text origin."""
+    mask, offset = text_mask(font, text)
+    layer = Image.new('RGBA', mask.size, (0, 0, 0, 0))
+    layer.paste(fill, (0, 0), mask)
+    return layer, offset
+
+
+def blurred_fill(alpha: Image.Image, rgb: Tuple[int, ...], radius: float) -> Image.Image:
+    """
+    Single-color RGBA layer whose alpha is the given coverage, softened with a Gaussian blur.
+    
+    Only the coverage channel is blurred, a quarter of the bytes of blurring
+    the whole RGBA layer, and the color is applied afterwards.
+    """
+    layer = Image.new('RGBA', alpha.size, tuple(rgb[:3]) + (0,))
+    layer.putalpha(alpha.filter(ImageFilter.GaussianBlur(radius=radius)))
+    return layer
+
+
+def _blurred_text(size: Tuple[int, int], position: Tuple[int, int], text: str,
+                  font: ImageFont.FreeTypeFont, fill: Tuple[int, int, int, int],
+                  radius: float) -> Image.Image:
+    """Single-color text layer softened with a Gaussian blur."""
+    alpha = Image.new('L', size, 0)
+    _paste_text(alpha, position, text, font, fill[3])
+    return blurred_fill(alpha, fill, radius)
+
+
+@lru_cache(maxsize=64)
+def _rounded_rect_mask(size: Tuple[int, int], box: Tuple[int, int, int, int], radius: int) -> Image.Image:
+    """
+    'L' mask of the given size with a filled rounded rectangle at box.
+    
+    Buttons of one style repeat the same shapes, so the corner arcs are
+    rasterized once per shape. The mask is shared and must not be modified.
+    """
+    mask = Image.new('L', size, 0)
+    ImageDraw.Draw(mask).rounded_rectangle(box, radius=radius, fill=255)
+    return mask
+
+
+def _layer_size(font: ImageFont.FreeTypeFont, text: str, padding: int) -> Tuple[int, int]:
+    """Size of a scratch layer holding text drawn at (padding, padding) with padding pixels of bleed on every side."""
+    mask, (left, top) = text_mask(font, text)
+    return left + mask.width + 2 * padding, top + mask.height + 2 * padding
+
+
+def _composite_layer(target: Image.Image, layer: Image.Image, position: Tuple[int, int]) -> None:
+    """
+    Blend an RGBA layer onto target at position using source-over compositing.
+    
+    RGBA targets use alpha_composite, which keeps opaque backgrounds opaque
+    under the text; other modes fall back to a masked paste. Only the
+    layer's visible bounding box is blended, since padding left
+    transparent for blur and offsets changes nothing.
+    """
+    bbox = layer.getbbox()
+    if bbox is None:
+        return
+    x, y = position[0] + bbox[0], position[1] + bbox[1]
+    if bbox != (0, 0) + layer.size:
+        layer = layer.crop(bbox)
+    
+    if target.mode != 'RGBA':
+        target.paste(layer, (x, y), layer)
+        return
+    
+    # alpha_composite needs a non-negative destination, so drop whatever hangs off the top/left
+    if x < 0 or y < 0:
+        layer = layer.crop((max(-x, 0), max(-y, 0), layer.width, layer.height))
+        x, y = max(x, 0), max(y, 0)
+    if layer.width > 0 and layer.height > 0 and x < target.width and y < target.height:
+        target.alpha_composite(layer, (x, y))
+
+
+def _alpha_ramp_strip(width: int, alphas: np.ndarray,
+                      rgb: Tuple[int, int, int] = (255, 255, 255)) -> Image.Image:
+    """Solid-color RGBA strip with one alpha value per row, replacing a loop of per-row lines."""
+    strip = np.empty((len(alphas), width, 4), dtype=np.uint8)
+    strip[..., :3] = rgb
+    strip[..., 3] = alphas[:, None]
+    return Image.fromarray(strip, 'RGBA')
+
+
+def _gradient_text(font: ImageFont.FreeTypeFont, text: str,
+                   start_color: Tuple[int, ...], end_color: Tuple[int, ...],
+                   fade: float, vertical: bool = True) -> Tuple[Image.Image, Tuple[int, int]]:
+    """
+    Text filled with a linear gradient, with its offset from the text origin.
+    
+    The glyph mask is rasterized once and the color field is built with
+    NumPy, instead of redrawing the whole text once per gradient step.
+    Color runs from start_color to end_color across the glyph box while
+    alpha fades from start_color's alpha by the given fraction.
+    """
+    mask, offset = text_mask(font, text)
+    coverage = np.asarray(mask)
+    ramp = np.linspace(0.0, 1.0, coverage.shape[0] if vertical else coverage.shape[1],
+                       endpoint=False, dtype=np.float32)
+    
+    # Only the per-row (or per-column) ramps are floating point; the full-size
+    # fill and alpha product stay in 8/16-bit integers
+    colors = (np.outer(1 - ramp, start_color[:3]) + np.outer(ramp, end_color[:3])).astype(np.uint8)
+    alphas = (start_color[3] * (1 - ramp * fade)).astype(np.uint16)
+    if vertical:
+        colors, alphas = colors[:, None, :], alphas[:, None]
+    else:
+        colors, alphas = colors[None, :, :], alphas[None, :]
+    
+    rgba = np.empty(coverage.shape + (4,), dtype=np.uint8)
+    rgba[..., :3] = colors
+    rgba[..., 3] = coverage * alphas // 255
+    return Image.fromarray(rgba, 'RGBA'), offset
+
+
 class TypographyEffectsEngine:
     """
     Engine for applying professional typography effects.
@@ -23,6 +198,37 @@ class TypographyEffectsEngine:
         
         # Initialize button style registry
         self.button_registry = self._initialize_button_registry()
+        
+        # Per-thread pool of reusable effect layers, keyed by size
+        self._scratch_pool = threading.local()
+        
+        # Map effect and button style names to their implementation methods once,
+        # so each call is a single dictionary lookup
+        self.effect_methods = {
+            "clean_gradient": self._apply_clean_gradient_effect,
+            "elegant_serif": self._apply_elegant_serif_effect,
+            "subtle_shadow": self._apply_shadow,
+            "shadow": self._apply_shadow,
+            "subtle_glow": self._apply_subtle_glow_effect,
+            "dynamic_bold": self._apply_shadow,  # Using shadow with specific params
+            "minimal_elegant": self._apply_minimal_elegant_effect,
+            "luxury_metallic": self._apply_metallic_effect,
+            "vibrant_overlay": self._apply_vibrant_overlay_effect,
+            "gradient": self._apply_gradient_effect,
+            "premium_gradient": self._apply_premium_gradient,
+            "layered_gradient": self._apply_layered_gradient,
+            "glass_effect": self._apply_glass_effect_text,
+            "nike_bold": self._apply_nike_bold_effect,
+            "subtle_bg": self._apply_subtle_bg_effect
+        }
+        self.button_methods = {
+            "rounded": self._draw_rounded_button,
+            "minimal_line": self._draw_minimal_line_button,
+            "pill": self._draw_pill_button,
+            "gradient": self._draw_gradient_button,
+            "glass": self._draw_glass_button,
+            "flat": self._draw_flat_button
+        }
     
     def _initialize_effects_registry(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -342,7 +548,7 @@ class TypographyEffectsEngine:
                 self.logger.error("Font is None, cannot apply text effect")
                 # Use emergency fallback
                 try:
-                    font = ImageFont.load_default()
+                    font = load_default_font()
                     self.logger.info("Using PIL default font as emergency fallback")
                 except Exception as e:
                     self.logger.error(f"Failed to load default font: {str(e)}")
@@ -354,6 +560,17 @@ class TypographyEffectsEngine:
                 text_color = (r, g, b, 255)  # Force full opacity
                 self.logger.info(f"Forcing full opacity for text color: {text_color}")
             
+            # Calculate position based on alignment; left-aligned text needs no measuring
+            x, y = position
+            if alignment in ("center", "right"):
+                text_width, _ = self._get_text_dimensions(text, font)
+                x = x - (text_width // 2 if alignment == "center" else text_width)
+            
+            # Plain text needs no effect parameters or scratch layers
+            if effect == "simple":
+                draw.text((x, y), text, font=font, fill=text_color)
+                return True
+            
             # Get effect parameters
             effect_params = self.effects_registry.get(effect, self.effects_registry["simple"]).get("params", {})
             
@@ -362,41 +579,14 @@ class TypographyEffectsEngine:
                 for key, value in typography_style["effect_params"].items():
                     effect_params[key] = value
             
-            # Get text dimensions
-            text_width, text_height = self._get_text_dimensions(text, font)
-            
-            # Calculate position based on alignment
-            x, y = position
-            if alignment == "center":
-                x = x - text_width // 2
-            elif alignment == "right":
-                x = x - text_width
-            
             # Apply appropriate effect based on effect name
             self.logger.info(f"Applying effect '{effect}' to text: {text[:20]}{'...' if len(text) > 20 else ''}")
             
-            # Map effect names to their implementation methods
-            effect_methods = {
-                "clean_gradient": self._apply_clean_gradient_effect,
-                "elegant_serif": self._apply_elegant_serif_effect,
-                "subtle_shadow": self._apply_shadow,
-                "shadow": self._apply_shadow,
-                "subtle_glow": self._apply_subtle_glow_effect,
-                "dynamic_bold": self._apply_shadow,  # Using shadow with specific params
-                "minimal_elegant": self._apply_minimal_elegant_effect,
-                "luxury_metallic": self._apply_metallic_effect,
-                "vibrant_overlay": self._apply_vibrant_overlay_effect,
-                "gradient": self._apply_gradient_effect,
-                "premium_gradient": self._apply_premium_gradient,
-                "layered_gradient": self._apply_layered_gradient,
-                "glass_effect": self._apply_glass_effect_text,
-                "nike_bold": self._apply_nike_bold_effect,
-                "subtle_bg": self._apply_subtle_bg_effect
-            }
-            
             # Apply the effect if it has a specific implementation
-            if effect in effect_methods:
-                effect_methods[effect](draw, text, (x, y), font, text_color, accent_color, effect_params)
+            effect_method = self.effect_methods.get(effect)
+            if effect_method is not None:
+                # Layered effects composite onto the image behind draw, resolved once here
+                effect_method(draw, draw._image, text, (x, y), font, text_color, accent_color, effect_params)
             else:
                 # Default to simple rendering
                 draw.text((x, y), text, font=font, fill=text_color)
@@ -444,7 +634,7 @@ class TypographyEffectsEngine:
                      button_style: str = "rounded",
                      text_color: Tuple[int, int, int, int] = (255, 255, 255, 255),
                      button_color: Tuple[int, int, int, int] = (41, 128, 185, 230),
-                     typography_style: Optional[Dict[str, Any]] = None) -> None:
+                     typography_style: Optional[Dict[str, Any]] = None) -> bool:
         """
         Create a button with the specified style.
         
@@ -457,6 +647,9 @@ class TypographyEffectsEngine:
             text_color: Text color (RGBA)
             button_color: Button color (RGBA)
             typography_style: Optional typography style parameters
+            
+        Returns:
+            True if the button was drawn, False if plain fallback text was used
         """
         try:
             # Get button style parameters
@@ -493,67 +686,19 @@ class TypographyEffectsEngine:
             button_right = button_left + button_width
             button_bottom = button_top + button_height
             
-            # Apply the appropriate button style
-            if button_style == "rounded":
-                self._draw_rounded_button(
-                    draw,
-                    (button_left, button_top, button_right, button_bottom),
-                    text,
-                    font,
-                    text_color,
-                    button_color,
-                    style_params
-                )
-            elif button_style == "minimal_line":
-                self._draw_minimal_line_button(
-                    draw,
-                    (button_left, button_top, button_right, button_bottom),
-                    text,
-                    font,
-                    text_color,
-                    button_color,
-                    style_params
-                )
-            elif button_style == "pill":
-                self._draw_pill_button(
-                    draw,
-                    (button_left, button_top, button_right, button_bottom),
-                    text,
-                    font,
-                    text_color,
-                    button_color,
-                    style_params
-                )
-            elif button_style == "gradient":
-                self._draw_gradient_button(
-                    draw,
-                    (button_left, button_top, button_right, button_bottom),
-                    text,
-                    font,
-                    text_color,
-                    button_color,
-                    style_params
-                )
-            elif button_style == "glass":
-                self._draw_glass_button(
-                    draw,
-                    (button_left, button_top, button_right, button_bottom),
-                    text,
-                    font,
-                    text_color,
-                    button_color,
-                    style_params
-                )
-            else:  # Default to flat
-                self._draw_flat_button(
-                    draw,
-                    (button_left, button_top, button_right, button_bottom),
-                    text,
-                    font,
-                    text_color,
-                    button_color,
-                    style_params
-                )
+            # Apply the appropriate button style, defaulting to flat
+            button_method = self.button_methods.get(button_style, self._draw_flat_button)
+            button_method(
+                draw,
+                draw._image,  # Image behind draw, for layered styles
+                (button_left, button_top, button_right, button_bottom),
+                text,
+                font,
+                text_color,
+                button_color,
+                style_params
+            )
+            return True
                 
         except Exception as e:
             self.logger.error(f"Error creating button: {str(e)}")
@@ -564,6 +709,34 @@ class TypographyEffectsEngine:
                 draw.text((x - text_width // 2, y - text_height // 2), text, font=font, fill=text_color)
             except:
                 pass
+            return False
+    
+    def render_text_batch(self,
+                          draw: ImageDraw.Draw,
+                          elements: List[Dict[str, Any]]) -> int:
+        """
+        Render several text elements onto one canvas in a single pass.
+        
+        Each element is a dict of apply_text_effect keyword arguments (text,
+        position, font, effect, ...); elements with a "button_style" key are
+        drawn with create_button instead. Elements are drawn in list order so
+        later ones stay on top, and all of them share the engine's scratch
+        layers and glyph caches.
+        
+        Args:
+            draw: ImageDraw object to draw on
+            elements: Element specifications, back to front
+        
+        Returns:
+            Number of elements whose effect was applied successfully
+        """
+        applied = 0
+        for element in elements:
+            if "button_style" in element:
+                applied += self.create_button(draw, **element)
+            else:
+                applied += self.apply_text_effect(draw, **element)
+        return applied
     
     def draw_rounded_rectangle(self,
                               draw: ImageDraw.Draw,
@@ -583,6 +756,14 @@ class TypographyEffectsEngine:
             outline: Optional outline color
             width: Outline width if outline specified
         """
+        # Filled shapes stamp a cached coverage mask, since buttons repeat the same geometry
+        (x1, y1), (x2, y2) = coords
+        if (outline is None and draw.mode == draw._image.mode
+                and all(type(v) is int for v in (x1, y1, x2, y2)) and x2 >= x1 and y2 >= y1):
+            mask = _rounded_rect_mask((x2 - x1 + 1, y2 - y1 + 1), (0, 0, x2 - x1, y2 - y1), radius)
+            draw._image.paste(color, (x1, y1), mask)
+            return
+        
         # Check if the native rounded_rectangle method is available (Pillow >= 8.0.0)
         if hasattr(draw, 'rounded_rectangle'):
             try:
@@ -627,6 +808,76 @@ class TypographyEffectsEngine:
             except Exception as e:
                 self.logger.warning(f"Drawing outline failed: {str(e)}")
     
+    def _scratch_layer(self, size: Tuple[int, int]) -> Image.Image:
+        """
+        Return a cleared, transparent RGBA layer of the given size.
+        
+        Layers are pooled per thread and per size, so an effect may take at
+        most one layer of a given size and must not keep it past its own call.
+        
+        Args:
+            size: (width, height) of the layer
+            
+        Returns:
+            Transparent RGBA image
+        """
+        pool = getattr(self._scratch_pool, "layers", None)
+        if pool is None:
+            pool = self._scratch_pool.layers = OrderedDict()
+        
+        layer = pool.get(size)
+        if layer is None:
+            layer = pool[size] = Image.new('RGBA', size, (0, 0, 0, 0))
+            if len(pool) > SCRATCH_POOL_SIZE:
+                pool.popitem(last=False)
+        else:
+            pool.move_to_end(size)
+            layer.paste((0, 0, 0, 0), (0, 0) + tuple(size))
+        return layer
+    
+    def _render_text_layer(self,
+                           size: Tuple[int, int],
+                           position: Tuple[int, int],
+                           text: str,
+                           font: ImageFont.FreeTypeFont,
+                           glyphs: Tuple[Image.Image, Tuple[int, int]],
+                           shadow: Optional[Tuple[Tuple[int, int, int, int], int, float]] = None) -> Image.Image:
+        """
+        Render a text element and its drop shadow into one layer.
+        
+        The shadow is painted first and the glyphs are blended over it inside
+        their own box, so the caller composites a single layer onto the image.
+        
+        Args:
+            size: (width, height) of the layer
+            position: Text origin within the layer
+            text: Text to render
+            font: Font to use
+            glyphs: (image, offset) pair from _colored_text or _gradient_text
+            shadow: Optional (color, offset, blur) of a drop shadow
+        
+        Returns:
+            RGBA layer
+        """
+        x, y = position
+        glyph_img, (left, top) = glyphs
+        if shadow is None:
+            # Nothing underneath, so a plain paste copies the glyphs exactly
+            layer = self._scratch_layer(size)
+            layer.paste(glyph_img, (x + left, y + top))
+            return layer
+        
+        shadow_color, shadow_offset, shadow_blur = shadow
+        shadow_position = (x + shadow_offset, y + shadow_offset)
+        if shadow_blur > 0:
+            layer = _blurred_text(size, shadow_position, text, font, shadow_color, shadow_blur)
+        else:
+            layer = self._scratch_layer(size)
+            _paste_text(layer, shadow_position, text, font, shadow_color)
+        
+        _composite_layer(layer, glyph_img, (x + left, y + top))
+        return layer
+
     def _get_text_dimensions(self, text: str, font: ImageFont.FreeTypeFont) -> Tuple[int, int]:
         """
         Get dimensions of text with the given font.
@@ -638,22 +889,11 @@ class TypographyEffectsEngine:
         Returns:
             (width, height) tuple
         """
-        try:
-            # Try getbbox method first (Pillow >= 8.0.0)
-            bbox = font.getbbox(text)
-            if bbox:
-                return bbox[2] - bbox[0], bbox[3] - bbox[1]
-        except (AttributeError, TypeError):
-            try:
-                # Try older PIL method
-                return font.getsize(text)
-            except:
-                # Estimate based on character count
-                size = getattr(font, 'size', 12)
-                return int(len(text) * size * 0.6), int(size * 1.2)
+        return measure_text(font, text)
     
     def _apply_shadow(self,
                      draw: ImageDraw.Draw,
+                     image: Image.Image,
                      text: str,
                      position: Tuple[int, int],
                      font: ImageFont.FreeTypeFont, 
@@ -665,6 +905,7 @@ class TypographyEffectsEngine:
         
         Args:
             draw: ImageDraw object
+            image: Image being drawn on
             text: Text to render
             position: (x, y) position
             font: Font to use
@@ -683,35 +924,19 @@ class TypographyEffectsEngine:
         shadow_color = (0, 0, 0, int(255 * shadow_opacity))
         
         if shadow_blur > 0:
-            # For blurred shadow, create a separate image
-            text_width, text_height = self._get_text_dimensions(text, font)
-            
-            # Create larger image to accommodate blur
+            # For blurred shadow, render shadow and text into one separate image
+            # Create larger image to accommodate blur and offset
             blur_padding = int(shadow_blur * 3)
-            shadow_img = Image.new(
-                'RGBA', 
-                (text_width + blur_padding * 2, text_height + blur_padding * 2), 
-                (0, 0, 0, 0)
-            )
-            shadow_draw = ImageDraw.Draw(shadow_img)
+            layer_width, layer_height = _layer_size(font, text, blur_padding)
+            layer_size = (layer_width + shadow_offset, layer_height + shadow_offset)
             
-            # Draw shadow text
-            shadow_draw.text(
-                (blur_padding, blur_padding), 
-                text, 
-                font=font, 
-                fill=shadow_color
+            shadow_img = self._render_text_layer(
+                layer_size, (blur_padding, blur_padding), text, font,
+                _colored_text(font, text, text_color), (shadow_color, shadow_offset, shadow_blur)
             )
             
-            # Apply blur
-            shadow_img = shadow_img.filter(ImageFilter.GaussianBlur(radius=shadow_blur))
-            
-            # Composite shadow onto the main image
-            # Offset position for shadow
-            offset_x = x + shadow_offset - blur_padding
-            offset_y = y + shadow_offset - blur_padding
-            
-            draw._image.paste(shadow_img, (offset_x, offset_y), shadow_img)
+            # Composite shadow and text onto the main image in one step
+            _composite_layer(image, shadow_img, (x - blur_padding, y - blur_padding))
         else:
             # Simple shadow without blur
             draw.text(
@@ -720,12 +945,13 @@ class TypographyEffectsEngine:
                 font=font, 
                 fill=shadow_color
             )
-        
-        # Draw main text
-        draw.text((x, y), text, font=font, fill=text_color)
+            
+            # Draw main text
+            draw.text((x, y), text, font=font, fill=text_color)
 
     def _apply_elegant_serif_effect(self,
                                    draw: ImageDraw.Draw,
+                                   image: Image.Image,
                                    text: str,
                                    position: Tuple[int, int],
                                    font: ImageFont.FreeTypeFont,
@@ -737,6 +963,7 @@ class TypographyEffectsEngine:
         
         Args:
             draw: ImageDraw object
+            image: Image being drawn on
             text: Text to render
             position: (x, y) position
             font: Font to use
@@ -761,50 +988,39 @@ class TypographyEffectsEngine:
         
         # Create a separate layer for the text effect
         padding = 20
-        text_layer = Image.new('RGBA', (text_width + padding * 2, text_height + padding * 2), (0, 0, 0, 0))
-        text_draw = ImageDraw.Draw(text_layer)
+        text_layer = self._scratch_layer((text_width + padding * 2, text_height + padding * 2))
         
         # Apply shadow if enabled
         if shadow_enabled:
             shadow_color = (0, 0, 0, int(255 * shadow_opacity))
             
-            # Draw shadow
-            text_draw.text(
-                (padding + shadow_offset, padding + shadow_offset), 
-                text, 
-                font=font, 
-                fill=shadow_color
-            )
-            
-            # Apply blur to shadow
+            # Draw shadow, blurred if requested
+            shadow_position = (padding + shadow_offset, padding + shadow_offset)
             if shadow_blur > 0:
-                text_layer = text_layer.filter(ImageFilter.GaussianBlur(radius=shadow_blur))
+                text_layer = _blurred_text(text_layer.size, shadow_position, text, font, shadow_color, shadow_blur)
+            else:
+                _paste_text(text_layer, shadow_position, text, font, shadow_color)
         
         # Determine outline color
         outline_color = accent_color if accent_color else (0, 0, 0, int(255 * outline_opacity))
         
         # Apply outline if enabled
         if outline_enabled:
-            for dx, dy in [(-outline_size, 0), (outline_size, 0), (0, -outline_size), (0, outline_size)]:
-                text_draw.text(
-                    (padding + dx, padding + dy), 
-                    text, 
-                    font=font, 
-                    fill=outline_color
-                )
+            _paste_outline(text_layer, (padding, padding), text, font, outline_color, outline_size)
         
         # Draw main text
-        text_draw.text((padding, padding), text, font=font, fill=text_color)
+        _paste_text(text_layer, (padding, padding), text, font, text_color)
         
         # Apply subtle enhancements for serif elegance
         enhanced_layer = text_layer.copy()
         enhanced_layer = enhanced_layer.filter(ImageFilter.SMOOTH_MORE)
         
         # Paste the result
-        draw._image.paste(text_layer, (x - padding, y - padding), text_layer)
+        _composite_layer(image, text_layer, (x - padding, y - padding))
 
     def _apply_gradient_effect(self,
                               draw: ImageDraw.Draw,
+                              image: Image.Image,
                               text: str,
                               position: Tuple[int, int],
                               font: ImageFont.FreeTypeFont,
@@ -816,6 +1032,7 @@ class TypographyEffectsEngine:
         
         Args:
             draw: ImageDraw object
+            image: Image being drawn on
             text: Text to render
             position: (x, y) position
             font: Font to use
@@ -833,10 +1050,6 @@ class TypographyEffectsEngine:
         # Get text dimensions
         text_width, text_height = self._get_text_dimensions(text, font)
         
-        # Create a separate image for gradient text
-        gradient_img = Image.new('RGBA', (text_width + 20, text_height + 20), (0, 0, 0, 0))
-        gradient_draw = ImageDraw.Draw(gradient_img)
-        
         # Extract color components
         r1, g1, b1, a1 = text_color
         
@@ -848,77 +1061,31 @@ class TypographyEffectsEngine:
             a2 = int(a1 * end_opacity)
         
         # Apply gradient based on direction
-        if direction == "vertical":
-            # Create vertical gradient
-            for i in range(text_height):
-                # Calculate color for this position in the gradient
-                ratio = i / text_height
-                r = int(r1 * (1 - ratio) + r2 * ratio)
-                g = int(g1 * (1 - ratio) + g2 * ratio)
-                b = int(b1 * (1 - ratio) + b2 * ratio)
-                a = int(a1 * (1 - ratio * (1 - end_opacity/start_opacity)))
-                
-                # Draw text line by line with current color
-                line_color = (r, g, b, a)
-                gradient_draw.text((10, 10 + i), text, font=font, fill=line_color)
-        
-        elif direction == "horizontal":
-            # For horizontal gradient, we need to approach differently
-            # Draw text in multiple layers
-            steps = 10  # Number of gradient steps
-            for i in range(steps):
-                # Calculate color for this step
-                ratio = i / (steps - 1)
-                r = int(r1 * (1 - ratio) + r2 * ratio)
-                g = int(g1 * (1 - ratio) + g2 * ratio)
-                b = int(b1 * (1 - ratio) + b2 * ratio)
-                a = int(a1 * (1 - ratio * (1 - end_opacity/start_opacity)))
-                
-                # Calculate horizontal slice
-                slice_width = text_width // steps
-                clip_left = i * slice_width
-                clip_right = (i + 1) * slice_width
-                
-                # Draw this slice with current color
-                mask = Image.new('L', (text_width + 20, text_height + 20), 0)
-                mask_draw = ImageDraw.Draw(mask)
-                mask_draw.rectangle([(clip_left + 10, 0), (clip_right + 10, text_height + 20)], fill=255)
-                
-                # Draw text with current color through mask
-                temp_img = Image.new('RGBA', (text_width + 20, text_height + 20), (0, 0, 0, 0))
-                temp_draw = ImageDraw.Draw(temp_img)
-                temp_draw.text((10, 10), text, font=font, fill=(r, g, b, a))
-                
-                # Composite with mask
-                gradient_img.paste(temp_img, (0, 0), mask)
+        if direction in ("vertical", "horizontal"):
+            glyphs = _gradient_text(
+                font, text, (r1, g1, b1, a1), (r2, g2, b2, a2),
+                1 - end_opacity / start_opacity, vertical=direction == "vertical"
+            )
         
         else:  # diagonal or any other type, default behavior
             # Draw text with single color
-            gradient_draw.text((10, 10), text, font=font, fill=text_color)
+            glyphs = _colored_text(font, text, text_color)
         
         # Apply shadow if enabled
+        shadow = None
         if params.get("shadow_enabled", True):
-            shadow_offset = params.get("shadow_offset", 2)
             shadow_opacity = params.get("shadow_opacity", 0.5)
-            shadow_color = (0, 0, 0, int(255 * shadow_opacity))
-            
-            shadow_img = Image.new('RGBA', (text_width + 20, text_height + 20), (0, 0, 0, 0))
-            shadow_draw = ImageDraw.Draw(shadow_img)
-            shadow_draw.text((10 + shadow_offset, 10 + shadow_offset), text, font=font, fill=shadow_color)
-            
-            if params.get("shadow_blur", 0) > 0:
-                shadow_img = shadow_img.filter(ImageFilter.GaussianBlur(radius=params.get("shadow_blur", 0)))
-            
-            # Composite shadow and gradient
-            composite = Image.alpha_composite(shadow_img, gradient_img)
-        else:
-            composite = gradient_img
+            shadow = ((0, 0, 0, int(255 * shadow_opacity)), params.get("shadow_offset", 2),
+                      params.get("shadow_blur", 0))
         
-        # Paste the final composite
-        draw._image.paste(composite, (x - 10, y - 10), composite)
+        # Shadow and gradient share one layer, composited once
+        composite = self._render_text_layer((text_width + 20, text_height + 20), (10, 10),
+                                            text, font, glyphs, shadow)
+        _composite_layer(image, composite, (x - 10, y - 10))
 
     def _apply_metallic_effect(self,
                               draw: ImageDraw.Draw,
+                              image: Image.Image,
                               text: str,
                               position: Tuple[int, int],
                               font: ImageFont.FreeTypeFont,
@@ -930,6 +1097,7 @@ class TypographyEffectsEngine:
         
         Args:
             draw: ImageDraw object
+            image: Image being drawn on
             text: Text to render
             position: (x, y) position
             font: Font to use
@@ -943,13 +1111,11 @@ class TypographyEffectsEngine:
         highlight = params.get("metallic_highlight", 0.7)
         shadows = params.get("metallic_shadows", 0.3)
         
-        # Get text dimensions
-        text_width, text_height = self._get_text_dimensions(text, font)
-        
-        # Create a separate image for metallic effect
-        padding = 20
-        metal_img = Image.new('RGBA', (text_width + padding * 2, text_height + padding * 2), (0, 0, 0, 0))
-        metal_draw = ImageDraw.Draw(metal_img)
+        # Size the scratch image to the widest offset plus one pixel of blur
+        shadow_offset = params.get("shadow_offset", 3) if params.get("shadow_enabled", True) else 0
+        outline_size = params.get("outline_size", 1) if params.get("outline_enabled", True) else 0
+        padding = max(shadow_offset, outline_size, 1) + 1
+        metal_img = self._scratch_layer(_layer_size(font, text, padding))
         
         # Determine base metallic color (gold or silver by default)
         if accent_color:
@@ -962,51 +1128,49 @@ class TypographyEffectsEngine:
         
         # Draw shadow first
         if params.get("shadow_enabled", True):
-            shadow_offset = params.get("shadow_offset", 3)
             shadow_opacity = params.get("shadow_opacity", 0.6)
             shadow_color = (0, 0, 0, int(255 * shadow_opacity))
             
-            metal_draw.text((padding + shadow_offset, padding + shadow_offset), 
-                           text, font=font, fill=shadow_color)
+            _paste_text(metal_img, (padding + shadow_offset, padding + shadow_offset), text, font, shadow_color)
         
-        # 1. Draw darker base for depth
-        dark_base = (int(r * shadows), int(g * shadows), int(b * shadows), a)
-        metal_draw.text((padding, padding), text, font=font, fill=dark_base)
+        # 1. Draw darker base for depth; an opaque main color drawn at the same
+        # position covers it completely, so it only matters for translucent metals
+        if a < 255:
+            dark_base = (int(r * shadows), int(g * shadows), int(b * shadows), a)
+            _paste_text(metal_img, (padding, padding), text, font, dark_base)
         
         # 2. Draw multiple layers for metallic effect
         # Bottom highlight
         bottom_highlight = (min(int(r * 1.2), 255), min(int(g * 1.2), 255), min(int(b * 1.2), 255), int(a * 0.9))
-        metal_draw.text((padding, padding + 1), text, font=font, fill=bottom_highlight)
+        _paste_text(metal_img, (padding, padding + 1), text, font, bottom_highlight)
         
         # Main color
-        metal_draw.text((padding, padding), text, font=font, fill=base_color)
+        _paste_text(metal_img, (padding, padding), text, font, base_color)
         
         # Top highlight for metallic shine
         top_highlight = (min(int(r * highlight), 255), min(int(g * highlight), 255), min(int(b * highlight), 255), int(a * 0.8))
-        metal_draw.text((padding, padding - 1), text, font=font, fill=top_highlight)
+        _paste_text(metal_img, (padding, padding - 1), text, font, top_highlight)
         
         # Extreme highlight for sparkle effect
         sparkle = (min(int(r * 1.5), 255), min(int(g * 1.5), 255), min(int(b * 1.5), 255), int(a * 0.6))
-        metal_draw.text((padding - 1, padding - 1), text, font=font, fill=sparkle)
+        _paste_text(metal_img, (padding - 1, padding - 1), text, font, sparkle)
         
         # Apply outline if specified
         if params.get("outline_enabled", True):
-            outline_size = params.get("outline_size", 1)
             outline_opacity = params.get("outline_opacity", 0.5)
             outline_color = (0, 0, 0, int(255 * outline_opacity))
             
-            for dx, dy in [(outline_size, 0), (-outline_size, 0), (0, outline_size), (0, -outline_size)]:
-                if dx != 0 or dy != 0:  # Skip center position
-                    metal_draw.text((padding + dx, padding + dy), text, font=font, fill=outline_color)
+            _paste_outline(metal_img, (padding, padding), text, font, outline_color, outline_size)
         
         # Apply slight blur for smoother metallic look
         metal_img = metal_img.filter(ImageFilter.GaussianBlur(radius=0.3))
         
         # Paste the metallic image
-        draw._image.paste(metal_img, (x - padding, y - padding), metal_img)
+        _composite_layer(image, metal_img, (x - padding, y - padding))
     
     def _apply_clean_gradient_effect(self, 
                                     draw: ImageDraw.Draw,
+                                    image: Image.Image,
                                     text: str,
                                     position: Tuple[int, int],
                                     font: ImageFont.FreeTypeFont,
@@ -1018,6 +1182,7 @@ class TypographyEffectsEngine:
         
         Args:
             draw: ImageDraw object
+            image: Image being drawn on
             text: Text to render
             position: (x, y) position
             font: Font to use
@@ -1030,10 +1195,6 @@ class TypographyEffectsEngine:
         # Get text dimensions
         text_width, text_height = self._get_text_dimensions(text, font)
         
-        # Create a separate layer for the text effect
-        text_layer = Image.new('RGBA', (text_width + 40, text_height + 40), (0, 0, 0, 0))
-        text_draw = ImageDraw.Draw(text_layer)
-        
         # Extract color components
         r, g, b, a = text_color
         
@@ -1050,34 +1211,19 @@ class TypographyEffectsEngine:
                 a
             )
         
-        # Draw gradient text
-        steps = text_height
-        for i in range(steps):
-            # Calculate color for this position
-            ratio = i / steps
-            current_r = int(r * (1 - ratio) + end_color[0] * ratio)
-            current_g = int(g * (1 - ratio) + end_color[1] * ratio)
-            current_b = int(b * (1 - ratio) + end_color[2] * ratio)
-            current_a = int(a * (1 - ratio * 0.2))  # Slight fade
-            
-            line_color = (current_r, current_g, current_b, current_a)
-            text_draw.text((20, 20 + i), text, font=font, fill=line_color)
+        # Draw gradient text with a slight fade
+        glyphs = _gradient_text(font, text, text_color, end_color, 0.2)
         
-        # Add subtle shadow
-        shadow_color = (0, 0, 0, 80)
-        shadow_layer = Image.new('RGBA', (text_width + 40, text_height + 40), (0, 0, 0, 0))
-        shadow_draw = ImageDraw.Draw(shadow_layer)
-        shadow_draw.text((21, 21), text, font=font, fill=shadow_color)
-        shadow_layer = shadow_layer.filter(ImageFilter.GaussianBlur(1))
-        
-        # Combine shadow and text
-        result = Image.alpha_composite(shadow_layer, text_layer)
+        # Render text over a subtle shadow in one layer
+        shadow = ((0, 0, 0, 80), 1, 1)
+        result = self._render_text_layer((text_width + 40, text_height + 40), (20, 20), text, font, glyphs, shadow)
         
         # Paste the result
-        draw._image.paste(result, (x - 20, y - 20), result)
+        _composite_layer(image, result, (x - 20, y - 20))
     
     def _apply_subtle_glow_effect(self,
                                  draw: ImageDraw.Draw,
+                                 image: Image.Image,
                                  text: str,
                                  position: Tuple[int, int],
                                  font: ImageFont.FreeTypeFont,
@@ -1089,6 +1235,7 @@ class TypographyEffectsEngine:
         
         Args:
             draw: ImageDraw object
+            image: Image being drawn on
             text: Text to render
             position: (x, y) position
             font: Font to use
@@ -1103,8 +1250,6 @@ class TypographyEffectsEngine:
         
         # Add padding for glow
         padding = 20
-        glow_img = Image.new('RGBA', (text_width + padding * 2, text_height + padding * 2), (0, 0, 0, 0))
-        glow_draw = ImageDraw.Draw(glow_img)
         
         # Get glow parameters
         glow_radius = params.get("glow_radius", 5)
@@ -1124,25 +1269,20 @@ class TypographyEffectsEngine:
                 int(255 * glow_opacity)
             )
         
-        # Draw glow
-        glow_draw.text((padding, padding), text, font=font, fill=glow_color)
+        # Draw and blur glow
+        glow_img = _blurred_text((text_width + padding * 2, text_height + padding * 2), (padding, padding),
+                                 text, font, glow_color, glow_radius)
         
-        # Apply blur to glow
-        glow_img = glow_img.filter(ImageFilter.GaussianBlur(radius=glow_radius))
-        
-        # Draw main text on separate layer
-        text_layer = Image.new('RGBA', (text_width + padding * 2, text_height + padding * 2), (0, 0, 0, 0))
-        text_draw = ImageDraw.Draw(text_layer)
-        text_draw.text((padding, padding), text, font=font, fill=text_color)
-        
-        # Composite glow and text
-        result = Image.alpha_composite(glow_img, text_layer)
+        # Composite the main text over the glow, touching only the glyph box
+        text_img, (left, top) = _colored_text(font, text, text_color)
+        glow_img.alpha_composite(text_img, (padding + left, padding + top))
         
         # Paste the result
-        draw._image.paste(result, (x - padding, y - padding), result)
+        _composite_layer(image, glow_img, (x - padding, y - padding))
     
     def _apply_minimal_elegant_effect(self,
                                      draw: ImageDraw.Draw,
+                                     image: Image.Image,
                                      text: str,
                                      position: Tuple[int, int],
                                      font: ImageFont.FreeTypeFont,
@@ -1154,6 +1294,7 @@ class TypographyEffectsEngine:
         
         Args:
             draw: ImageDraw object
+            image: Image being drawn on
             text: Text to render
             position: (x, y) position
             font: Font to use
@@ -1170,52 +1311,39 @@ class TypographyEffectsEngine:
         # Get text dimensions
         text_width, text_height = self._get_text_dimensions(text, font)
         
-        # Create a separate layer
-        text_layer = Image.new('RGBA', (text_width + 40, text_height + 40), (0, 0, 0, 0))
-        text_draw = ImageDraw.Draw(text_layer)
-        
-        # Apply letter spacing if specified
+        # Character runs and their offsets from the text origin
         if letter_spacing > 0:
             # Draw each character with spacing
+            runs = []
             spaced_width = 0
             for char in text:
                 char_width, _ = self._get_text_dimensions(char, font)
-                text_draw.text((20 + spaced_width, 20), char, font=font, fill=text_color)
+                runs.append((char, spaced_width))
                 spaced_width += char_width + int(text_height * letter_spacing)
         else:
             # Draw text normally
-            text_draw.text((20, 20), text, font=font, fill=text_color)
+            runs = [(text, 0)]
         
-        # Apply very subtle shadow if not lightweight
+        # Shadow and text share one layer
+        result = self._scratch_layer((text_width + 40, text_height + 40))
+        
+        # Apply very subtle shadow underneath if not lightweight
         if not lightweight:
             shadow_color = (0, 0, 0, 40)
             shadow_offset = 1
-            shadow_layer = Image.new('RGBA', (text_width + 40, text_height + 40), (0, 0, 0, 0))
-            shadow_draw = ImageDraw.Draw(shadow_layer)
-            
-            if letter_spacing > 0:
-                # Draw shadow for each character with spacing
-                spaced_width = 0
-                for char in text:
-                    char_width, _ = self._get_text_dimensions(char, font)
-                    shadow_draw.text((20 + spaced_width + shadow_offset, 20 + shadow_offset), 
-                                  char, font=font, fill=shadow_color)
-                    spaced_width += char_width + int(text_height * letter_spacing)
-            else:
-                # Draw shadow normally
-                shadow_draw.text((20 + shadow_offset, 20 + shadow_offset), 
-                              text, font=font, fill=shadow_color)
-            
-            # Composite shadow and text
-            result = Image.alpha_composite(shadow_layer, text_layer)
-        else:
-            result = text_layer
+            for run, run_x in runs:
+                _paste_text(result, (20 + run_x + shadow_offset, 20 + shadow_offset), run, font, shadow_color)
+        
+        for run, run_x in runs:
+            glyph_img, (left, top) = _colored_text(font, run, text_color)
+            result.alpha_composite(glyph_img, (20 + run_x + left, 20 + top))
         
         # Paste the result
-        draw._image.paste(result, (x - 20, y - 20), result)
+        _composite_layer(image, result, (x - 20, y - 20))
     
     def _apply_vibrant_overlay_effect(self,
                                      draw: ImageDraw.Draw,
+                                     image: Image.Image,
                                      text: str,
                                      position: Tuple[int, int],
                                      font: ImageFont.FreeTypeFont,
@@ -1227,6 +1355,7 @@ class TypographyEffectsEngine:
         
         Args:
             draw: ImageDraw object
+            image: Image being drawn on
             text: Text to render
             position: (x, y) position
             font: Font to use
@@ -1257,7 +1386,7 @@ class TypographyEffectsEngine:
         bg_width = text_width + (padding * 2)
         bg_height = text_height + (padding * 2)
         
-        bg_layer = Image.new('RGBA', (bg_width + 20, bg_height + 20), (0, 0, 0, 0))
+        bg_layer = self._scratch_layer((bg_width + 20, bg_height + 20))
         bg_draw = ImageDraw.Draw(bg_layer)
         
         # Draw rounded rectangle background
@@ -1270,15 +1399,14 @@ class TypographyEffectsEngine:
         
         # Create text layer
         text_layer = Image.new('RGBA', (bg_width + 20, bg_height + 20), (0, 0, 0, 0))
-        text_draw = ImageDraw.Draw(text_layer)
         
         # Draw text centered on the background
         text_x = 10 + padding + (text_width // 2)
         text_y = 10 + padding
         
-        # Draw text with subtle shadow for depth
-        text_draw.text((text_x + 1, text_y + 1), text, font=font, fill=(0, 0, 0, 80), anchor="mt")
-        text_draw.text((text_x, text_y), text, font=font, fill=text_color, anchor="mt")
+        # Draw text with subtle shadow for depth; both share one rasterized mask
+        _paste_text(text_layer, (text_x + 1, text_y + 1), text, font, (0, 0, 0, 80), anchor="mt")
+        _paste_text(text_layer, (text_x, text_y), text, font, text_color, anchor="mt")
         
         # Composite background and text
         result = Image.alpha_composite(bg_layer, text_layer)
@@ -1288,10 +1416,11 @@ class TypographyEffectsEngine:
         result_y = y - 10
         
         # Paste the result
-        draw._image.paste(result, (result_x, result_y), result)
+        _composite_layer(image, result, (result_x, result_y))
     
     def _apply_premium_gradient(self,
                                draw: ImageDraw.Draw,
+                               image: Image.Image,
                                text: str,
                                position: Tuple[int, int],
                                font: ImageFont.FreeTypeFont,
@@ -1303,6 +1432,7 @@ class TypographyEffectsEngine:
         
         Args:
             draw: ImageDraw object
+            image: Image being drawn on
             text: Text to render
             position: (x, y) position
             font: Font to use
@@ -1321,23 +1451,15 @@ class TypographyEffectsEngine:
         glow_opacity = params.get("glow_opacity", 0.15)
         glow_radius = params.get("glow_radius", 3)
         
-        # Get text dimensions
-        text_width, text_height = self._get_text_dimensions(text, font)
-        
-        # Create a separate layer for the text effect
-        padding = 30  # Extra space for effects
-        text_layer = Image.new('RGBA', (text_width + padding * 2, text_height + padding * 2), (0, 0, 0, 0))
-        text_draw = ImageDraw.Draw(text_layer)
+        # Create a separate layer sized to the shadow offset and glow spread
+        padding = max(shadow_offset if shadow_enabled else 0,
+                      int(math.ceil(glow_radius * 3)) if glow_enabled else 0) + 1
+        text_layer = self._scratch_layer(_layer_size(font, text, padding))
         
         # Apply shadow if enabled
         if shadow_enabled:
             shadow_color = (0, 0, 0, int(255 * shadow_opacity))
-            text_draw.text(
-                (padding + shadow_offset, padding + shadow_offset),
-                text,
-                font=font,
-                fill=shadow_color
-            )
+            _paste_text(text_layer, (padding + shadow_offset, padding + shadow_offset), text, font, shadow_color)
         
         # Apply glow if enabled
         if glow_enabled:
@@ -1355,16 +1477,14 @@ class TypographyEffectsEngine:
                     int(255 * glow_opacity)
                 )
             
-            # Create glow layer
-            glow_layer = Image.new('RGBA', text_layer.size, (0, 0, 0, 0))
-            glow_draw = ImageDraw.Draw(glow_layer)
-            glow_draw.text((padding, padding), text, font=font, fill=glow_color)
+            # Create blurred glow layer
+            glow_layer = _blurred_text(text_layer.size, (padding, padding), text, font, glow_color, glow_radius)
             
-            # Apply blur for glow effect
-            glow_layer = glow_layer.filter(ImageFilter.GaussianBlur(radius=glow_radius))
-            
-            # Composite with text layer
-            text_layer = Image.alpha_composite(glow_layer, text_layer)
+            # Composite with text layer; without a shadow the glow is the whole layer so far
+            if shadow_enabled:
+                text_layer = Image.alpha_composite(glow_layer, text_layer)
+            else:
+                text_layer = glow_layer
         
         # Apply gradient effect
         r1, g1, b1, a1 = text_color
@@ -1378,34 +1498,20 @@ class TypographyEffectsEngine:
             b2 = min(b1 + 70, 255)
             a2 = a1
         
-        # Create gradient layer
-        gradient_layer = Image.new('RGBA', text_layer.size, (0, 0, 0, 0))
-        gradient_draw = ImageDraw.Draw(gradient_layer)
-        
-        # Draw gradient text
-        for i in range(text_height):
-            # Calculate position in gradient (0 to 1)
-            pos = i / text_height
-            
-            # Calculate color for this position
-            r = int(r1 * (1 - pos) + r2 * pos)
-            g = int(g1 * (1 - pos) + g2 * pos)
-            b = int(b1 * (1 - pos) + b2 * pos)
-            a = int(a1 * (1 - pos * 0.1))  # Slight fade
-            
-            current_color = (r, g, b, a)
-            
-            # Draw text at this position
-            gradient_draw.text((padding, padding + i), text, font=font, fill=current_color)
-        
-        # Composite with result
-        text_layer = Image.alpha_composite(text_layer, gradient_layer)
+        # Composite gradient text with a slight fade
+        gradient_text, (left, top) = _gradient_text(font, text, (r1, g1, b1, a1), (r2, g2, b2, a2), 0.1)
+        if shadow_enabled or glow_enabled:
+            text_layer.alpha_composite(gradient_text, (padding + left, padding + top))
+        else:
+            # Blending onto a fully transparent layer is a plain copy
+            text_layer.paste(gradient_text, (padding + left, padding + top))
         
         # Paste the result
-        draw._image.paste(text_layer, (x - padding, y - padding), text_layer)
+        _composite_layer(image, text_layer, (x - padding, y - padding))
 
     def _apply_layered_gradient(self,
                                draw: ImageDraw.Draw,
+                               image: Image.Image,
                                text: str,
                                position: Tuple[int, int],
                                font: ImageFont.FreeTypeFont,
@@ -1417,6 +1523,7 @@ class TypographyEffectsEngine:
         
         Args:
             draw: ImageDraw object
+            image: Image being drawn on
             text: Text to render
             position: (x, y) position
             font: Font to use
@@ -1433,23 +1540,14 @@ class TypographyEffectsEngine:
         gradient_direction = params.get("gradient_direction", "vertical")
         gradient_layers = params.get("gradient_layers", 3)
         
-        # Get text dimensions
-        text_width, text_height = self._get_text_dimensions(text, font)
-        
-        # Create a separate layer for the text effect
-        padding = 30  # Extra space for effects
-        text_layer = Image.new('RGBA', (text_width + padding * 2, text_height + padding * 2), (0, 0, 0, 0))
-        text_draw = ImageDraw.Draw(text_layer)
+        # Create a separate layer sized to the shadow and layer offsets
+        padding = max(shadow_offset if shadow_enabled else 0, (gradient_layers - 1) * 2) + 1
+        text_layer = self._scratch_layer(_layer_size(font, text, padding))
         
         # Apply shadow if enabled
         if shadow_enabled:
             shadow_color = (0, 0, 0, int(255 * shadow_opacity))
-            text_draw.text(
-                (padding + shadow_offset, padding + shadow_offset),
-                text,
-                font=font,
-                fill=shadow_color
-            )
+            _paste_text(text_layer, (padding + shadow_offset, padding + shadow_offset), text, font, shadow_color)
         
         # Extract color components
         r1, g1, b1, a1 = text_color
@@ -1463,47 +1561,32 @@ class TypographyEffectsEngine:
             b2 = int(b1 * 0.7)
             a2 = a1
         
-        # Create multiple gradient layers
-        for layer in range(gradient_layers):
-            # Calculate offset for this layer
+        # Interpolate every layer color at once, with a slight fade
+        blends = np.linspace(0.0, 1.0, gradient_layers)[:, None]
+        colors = (np.array([r1, g1, b1, a1]) * (1 - blends) + np.array([r2, g2, b2, 0]) * blends).astype(int)
+        colors[:, 3] = (a1 * (1 - blends[:, 0] * 0.2)).astype(int)
+        
+        # Composite one colorized copy of the glyph mask per layer
+        for layer, layer_color in enumerate(colors.tolist()):
+            # Offset each layer by 2 pixels along the gradient direction
             if gradient_direction == "vertical":
-                offset_x = 0
-                offset_y = layer * 2  # Offset each layer by 2 pixels
+                offset_x, offset_y = 0, layer * 2
             else:  # horizontal
-                offset_x = layer * 2
-                offset_y = 0
-            
-            # Calculate blend factor for colors
-            blend = layer / (gradient_layers - 1) if gradient_layers > 1 else 0
-            
-            # Calculate color for this layer
-            r = int(r1 * (1 - blend) + r2 * blend)
-            g = int(g1 * (1 - blend) + g2 * blend)
-            b = int(b1 * (1 - blend) + b2 * blend)
-            a = int(a1 * (1 - blend * 0.2))  # Slight fade
+                offset_x, offset_y = layer * 2, 0
             
-            layer_color = (r, g, b, a)
-            
-            # Create layer
-            layer_img = Image.new('RGBA', text_layer.size, (0, 0, 0, 0))
-            layer_draw = ImageDraw.Draw(layer_img)
-            
-            # Draw text on this layer
-            layer_draw.text(
-                (padding + offset_x, padding + offset_y),
-                text,
-                font=font,
-                fill=layer_color
-            )
-            
-            # Composite with text layer
-            text_layer = Image.alpha_composite(text_layer, layer_img)
+            layer_img, (left, top) = _colored_text(font, text, tuple(layer_color))
+            if layer == 0 and not shadow_enabled:
+                # Without a shadow the first layer lands on a transparent buffer, so copy it
+                text_layer.paste(layer_img, (padding + offset_x + left, padding + offset_y + top))
+            else:
+                text_layer.alpha_composite(layer_img, (padding + offset_x + left, padding + offset_y + top))
         
         # Paste the result
-        draw._image.paste(text_layer, (x - padding, y - padding), text_layer)
+        _composite_layer(image, text_layer, (x - padding, y - padding))
 
     def _apply_glass_effect_text(self,
                                draw: ImageDraw.Draw,
+                               image: Image.Image,
                                text: str,
                                position: Tuple[int, int],
                                font: ImageFont.FreeTypeFont,
@@ -1515,6 +1598,7 @@ class TypographyEffectsEngine:
         
         Args:
             draw: ImageDraw object
+            image: Image being drawn on
             text: Text to render
             position: (x, y) position
             font: Font to use
@@ -1532,14 +1616,11 @@ class TypographyEffectsEngine:
         # Get text dimensions
         text_width, text_height = self._get_text_dimensions(text, font)
         
-        # Create a separate layer for the text effect
-        padding = 30  # Extra space for effects
-        text_layer = Image.new('RGBA', (text_width + padding * 2, text_height + padding * 2), (0, 0, 0, 0))
+        # Create a separate layer just large enough for the glass panel and its blur
+        padding = 14  # 10px panel margin plus blur spread
+        text_layer = self._scratch_layer(_layer_size(font, text, padding))
         text_draw = ImageDraw.Draw(text_layer)
         
-        # Extract color components
-        r, g, b, a = text_color
-        
         # Create glass background
         bg_color = (255, 255, 255, int(255 * glass_opacity * 0.6))
         
@@ -1553,30 +1634,25 @@ class TypographyEffectsEngine:
         
         # Add reflection gradient at top
         highlight_height = int(text_height * 0.4)
-        for i in range(highlight_height):
-            alpha = int(255 * glass_reflection * (1 - i / highlight_height))
-            highlight_color = (255, 255, 255, alpha)
-            
-            text_draw.line(
-                [(padding - 10, padding - 10 + i), (padding + text_width + 10, padding - 10 + i)],
-                fill=highlight_color
-            )
+        if highlight_height > 0:
+            alphas = (255 * glass_reflection * (1 - np.arange(highlight_height) / highlight_height)).astype(np.uint8)
+            text_layer.paste(_alpha_ramp_strip(text_width + 21, alphas), (padding - 10, padding - 10))
         
         # Draw text
-        text_draw.text((padding, padding), text, font=font, fill=text_color)
+        _paste_text(text_layer, (padding, padding), text, font, text_color)
         
         # Apply blur to create glass effect
         text_layer = text_layer.filter(ImageFilter.GaussianBlur(radius=1))
         
         # Draw text again on top for sharpness
-        text_draw = ImageDraw.Draw(text_layer)
-        text_draw.text((padding, padding), text, font=font, fill=text_color)
+        _paste_text(text_layer, (padding, padding), text, font, text_color)
         
         # Paste the result
-        draw._image.paste(text_layer, (x - padding, y - padding), text_layer)
+        _composite_layer(image, text_layer, (x - padding, y - padding))
 
     def _apply_nike_bold_effect(self,
                                draw: ImageDraw.Draw,
+                               image: Image.Image,
                                text: str,
                                position: Tuple[int, int],
                                font: ImageFont.FreeTypeFont,
@@ -1588,6 +1664,7 @@ class TypographyEffectsEngine:
         
         Args:
             draw: ImageDraw object
+            image: Image being drawn on
             text: Text to render
             position: (x, y) position
             font: Font to use
@@ -1618,8 +1695,7 @@ class TypographyEffectsEngine:
         
         # Create a separate layer for the text effect
         padding = 30  # Extra space for effects
-        text_layer = Image.new('RGBA', (text_width + padding * 2, text_height + padding * 2), (0, 0, 0, 0))
-        text_draw = ImageDraw.Draw(text_layer)
+        text_layer = self._scratch_layer((text_width + padding * 2, text_height + padding * 2))
         
         # Handle condensed text with custom letter spacing
         if condensed and letter_spacing != 0:
@@ -1634,16 +1710,10 @@ class TypographyEffectsEngine:
                 # Apply outline if enabled
                 if outline_enabled:
                     outline_color = (0, 0, 0, int(255 * outline_opacity))
-                    for dx, dy in [(outline_size, 0), (-outline_size, 0), (0, outline_size), (0, -outline_size)]:
-                        text_draw.text(
-                            (pos_x + dx, padding + dy),
-                            char,
-                            font=font,
-                            fill=outline_color
-                        )
+                    _paste_outline(text_layer, (pos_x, padding), char, font, outline_color, outline_size)
                 
                 # Draw character
-                text_draw.text((pos_x, padding), char, font=font, fill=text_color)
+                _paste_text(text_layer, (pos_x, padding), char, font, text_color)
                 
                 # Move to next position with spacing
                 pos_x += char_width + spacing_px
@@ -1651,22 +1721,17 @@ class TypographyEffectsEngine:
             # Apply outline if enabled
             if outline_enabled:
                 outline_color = (0, 0, 0, int(255 * outline_opacity))
-                for dx, dy in [(outline_size, 0), (-outline_size, 0), (0, outline_size), (0, -outline_size)]:
-                    text_draw.text(
-                        (padding + dx, padding + dy),
-                        text,
-                        font=font,
-                        fill=outline_color
-                    )
+                _paste_outline(text_layer, (padding, padding), text, font, outline_color, outline_size)
             
             # Draw text normally
-            text_draw.text((padding, padding), text, font=font, fill=text_color)
+            _paste_text(text_layer, (padding, padding), text, font, text_color)
         
         # Paste the result
-        draw._image.paste(text_layer, (x - padding, y - padding), text_layer)
+        _composite_layer(image, text_layer, (x - padding, y - padding))
 
     def _apply_subtle_bg_effect(self,
                                draw: ImageDraw.Draw,
+                               image: Image.Image,
                                text: str,
                                position: Tuple[int, int],
                                font: ImageFont.FreeTypeFont,
@@ -1678,6 +1743,7 @@ class TypographyEffectsEngine:
         
         Args:
             draw: ImageDraw object
+            image: Image being drawn on
             text: Text to render
             position: (x, y) position
             font: Font to use
@@ -1699,7 +1765,7 @@ class TypographyEffectsEngine:
         
         # Create a separate layer for the text effect
         padding = max(30, background_padding + 10)  # Extra space for effects
-        text_layer = Image.new('RGBA', (text_width + padding * 2, text_height + padding * 2), (0, 0, 0, 0))
+        text_layer = self._scratch_layer((text_width + padding * 2, text_height + padding * 2))
         text_draw = ImageDraw.Draw(text_layer)
         
         # Create background if enabled
@@ -1717,42 +1783,30 @@ class TypographyEffectsEngine:
                     r, g, b = 255, 255, 255  # Light background for dark text
             
             bg_color = (r, g, b, int(255 * background_opacity))
+            bg_box = [
+                (padding - background_padding, padding - background_padding),
+                (padding + text_width + background_padding, padding + text_height + background_padding)
+            ]
             
-            # Draw background with rounded corners
-            self.draw_rounded_rectangle(
-                text_draw,
-                [
-                    (padding - background_padding, padding - background_padding),
-                    (padding + text_width + background_padding, padding + text_height + background_padding)
-                ],
-                bg_color,
-                radius=background_radius
-            )
-            
-            # Apply blur if specified
+            # Apply blur if specified: a soft halo from the blurred background coverage
             if background_blur > 0:
-                text_layer = text_layer.filter(ImageFilter.GaussianBlur(radius=background_blur))
-                
-                # Redraw background after blur
+                halo = Image.new('L', text_layer.size, 0)
+                self.draw_rounded_rectangle(ImageDraw.Draw(halo), bg_box, bg_color[3], radius=background_radius)
+                text_layer = blurred_fill(halo, bg_color, background_blur)
                 text_draw = ImageDraw.Draw(text_layer)
-                self.draw_rounded_rectangle(
-                    text_draw,
-                    [
-                        (padding - background_padding, padding - background_padding),
-                        (padding + text_width + background_padding, padding + text_height + background_padding)
-                    ],
-                    bg_color,
-                    radius=background_radius
-                )
+            
+            # Draw background with rounded corners
+            self.draw_rounded_rectangle(text_draw, bg_box, bg_color, radius=background_radius)
         
         # Draw text
-        text_draw.text((padding, padding), text, font=font, fill=text_color)
+        _paste_text(text_layer, (padding, padding), text, font, text_color)
 
     # Paste the result
-        draw._image.paste(text_layer, (x - padding, y - padding), text_layer)
+        _composite_layer(image, text_layer, (x - padding, y - padding))
     
     def _draw_rounded_button(self,
                             draw: ImageDraw.Draw,
+                            image: Image.Image,
                             bounds: Tuple[int, int, int, int],
                             text: str,
                             font: ImageFont.FreeTypeFont,
@@ -1764,6 +1818,7 @@ class TypographyEffectsEngine:
         
         Args:
             draw: ImageDraw object
+            image: Image being drawn on
             bounds: (left, top, right, bottom) bounds
             text: Button text
             font: Font to use
@@ -1819,6 +1874,7 @@ class TypographyEffectsEngine:
     
     def _draw_minimal_line_button(self,
                                  draw: ImageDraw.Draw,
+                                 image: Image.Image,
                                  bounds: Tuple[int, int, int, int],
                                  text: str,
                                  font: ImageFont.FreeTypeFont,
@@ -1830,6 +1886,7 @@ class TypographyEffectsEngine:
         
         Args:
             draw: ImageDraw object
+            image: Image being drawn on
             bounds: (left, top, right, bottom) bounds
             text: Button text
             font: Font to use
@@ -1874,6 +1931,7 @@ class TypographyEffectsEngine:
     
     def _draw_pill_button(self,
                          draw: ImageDraw.Draw,
+                         image: Image.Image,
                          bounds: Tuple[int, int, int, int],
                          text: str,
                          font: ImageFont.FreeTypeFont,
@@ -1885,6 +1943,7 @@ class TypographyEffectsEngine:
         
         Args:
             draw: ImageDraw object
+            image: Image being drawn on
             bounds: (left, top, right, bottom) bounds
             text: Button text
             font: Font to use
@@ -1941,6 +2000,7 @@ class TypographyEffectsEngine:
     
     def _draw_gradient_button(self,
                              draw: ImageDraw.Draw,
+                             image: Image.Image,
                              bounds: Tuple[int, int, int, int],
                              text: str,
                              font: ImageFont.FreeTypeFont,
@@ -1952,6 +2012,7 @@ class TypographyEffectsEngine:
         
         Args:
             draw: ImageDraw object
+            image: Image being drawn on
             bounds: (left, top, right, bottom) bounds
             text: Button text
             font: Font to use
@@ -1968,10 +2029,6 @@ class TypographyEffectsEngine:
         direction = params.get("direction", "vertical")
         darkness_factor = params.get("darkness_factor", 0.7)
         
-        # Create separate image for gradient button
-        button_img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-        button_draw = ImageDraw.Draw(button_img)
-        
         # Calculate gradient colors
         r, g, b, a = button_color
         
@@ -1983,51 +2040,32 @@ class TypographyEffectsEngine:
             a
         )
         
-        # Draw gradient
-        if direction == "vertical":
-            # Vertical gradient (top to bottom)
-            for y in range(height):
-                # Calculate color for this line
-                ratio = y / height
-                r = int(start_color[0] * (1 - ratio) + end_color[0] * ratio)
-                g = int(start_color[1] * (1 - ratio) + end_color[1] * ratio)
-                b = int(start_color[2] * (1 - ratio) + end_color[2] * ratio)
-                a = int(start_color[3] * (1 - ratio) + end_color[3] * ratio)
-                
-                line_color = (r, g, b, a)
-                button_draw.line([(0, y), (width, y)], fill=line_color)
+        # Build the gradient in one array: one color per row (vertical, top to
+        # bottom) or per column (horizontal, left to right)
+        vertical = direction == "vertical"
+        steps = height if vertical else width
+        ratio = (np.arange(steps) / steps)[:, None]
+        line_colors = (np.array(start_color) * (1 - ratio) + np.array(end_color) * ratio).astype(np.uint8)
+        if vertical:
+            gradient = np.broadcast_to(line_colors[:, None, :], (height, width, 4))
         else:
-            # Horizontal gradient (left to right)
-            for x in range(width):
-                # Calculate color for this line
-                ratio = x / width
-                r = int(start_color[0] * (1 - ratio) + end_color[0] * ratio)
-                g = int(start_color[1] * (1 - ratio) + end_color[1] * ratio)
-                b = int(start_color[2] * (1 - ratio) + end_color[2] * ratio)
-                a = int(start_color[3] * (1 - ratio) + end_color[3] * ratio)
-                
-                line_color = (r, g, b, a)
-                button_draw.line([(x, 0), (x, height)], fill=line_color)
-        
-        # Create mask for rounded corners
-        mask = Image.new('L', (width, height), 0)
-        mask_draw = ImageDraw.Draw(mask)
-        mask_draw.rounded_rectangle([(0, 0), (width, height)], radius=radius, fill=255)
+            gradient = np.broadcast_to(line_colors[None, :, :], (height, width, 4))
+        button_img = Image.fromarray(np.ascontiguousarray(gradient), 'RGBA')
         
         # Apply mask for rounded corners
-        button_img.putalpha(mask)
+        button_img.putalpha(_rounded_rect_mask((width, height), (0, 0, width, height), radius))
         
         # Add subtle shadow
-        shadow_img = Image.new('RGBA', (width + 4, height + 4), (0, 0, 0, 0))
-        shadow_draw = ImageDraw.Draw(shadow_img)
-        shadow_draw.rounded_rectangle([(2, 2), (width + 2, height + 2)], radius=radius, fill=(0, 0, 0, 80))
-        shadow_img = shadow_img.filter(ImageFilter.GaussianBlur(radius=1))
+        shadow_size = (width + 4, height + 4)
+        shadow_alpha = Image.new('L', shadow_size, 0)
+        shadow_alpha.paste(80, (0, 0), _rounded_rect_mask(shadow_size, (2, 2, width + 2, height + 2), radius))
+        shadow_img = blurred_fill(shadow_alpha, (0, 0, 0), 1)
         
         # Paste shadow
-        draw._image.paste(shadow_img, (left - 2, top - 2), shadow_img)
+        _composite_layer(image, shadow_img, (left - 2, top - 2))
         
         # Paste button
-        draw._image.paste(button_img, (left, top), button_img)
+        _composite_layer(image, button_img, (left, top))
         
         # Calculate text position
         text_width, text_height = self._get_text_dimensions(text, font)
@@ -2040,6 +2078,7 @@ class TypographyEffectsEngine:
     
     def _draw_glass_button(self,
                           draw: ImageDraw.Draw,
+                          image: Image.Image,
                           bounds: Tuple[int, int, int, int],
                           text: str,
                           font: ImageFont.FreeTypeFont,
@@ -2051,6 +2090,7 @@ class TypographyEffectsEngine:
         
         Args:
             draw: ImageDraw object
+            image: Image being drawn on
             bounds: (left, top, right, bottom) bounds
             text: Button text
             font: Font to use
@@ -2067,61 +2107,43 @@ class TypographyEffectsEngine:
         opacity = params.get("opacity", 0.6)
         reflection_opacity = params.get("reflection_opacity", 0.3)
         
-        # Create a separate image for the glass button
-        button_img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-        button_draw = ImageDraw.Draw(button_img)
-        
         # Extract color components
         r, g, b, a = button_color
         
-        # Draw base with adjusted opacity
+        # Build the glass button in one RGBA array, starting with the base at adjusted opacity
         base_color = (r, g, b, int(a * opacity))
-        button_draw.rounded_rectangle(
-            [(0, 0), (width, height)],
-            radius=radius,
-            fill=base_color
-        )
+        button_arr = np.zeros((height, width, 4), dtype=np.uint8)
+        button_arr[np.asarray(_rounded_rect_mask((width, height), (0, 0, width, height), radius)) > 0] = base_color
         
-        # Add top highlight (glass reflection)
+        # Add top highlight (glass reflection) as an alpha ramp over full rows
         highlight_height = height // 3
-        
-        # Create gradient for highlight
-        for i in range(highlight_height):
-            alpha = int(255 * reflection_opacity * (1 - i / highlight_height))
-            highlight_color = (255, 255, 255, alpha)
-            button_draw.line(
-                [(0, i), (width, i)],
-                fill=highlight_color
-            )
+        if highlight_height > 0:
+            button_arr[:highlight_height, :, :3] = 255
+            button_arr[:highlight_height, :, 3] = (
+                255 * reflection_opacity * (1 - np.arange(highlight_height) / highlight_height)
+            ).astype(np.uint8)[:, None]
         
         # Add bottom shadow for depth
         shadow_height = height // 4
-        shadow_top = height - shadow_height
-        
-        # Create gradient for shadow
-        for i in range(shadow_height):
-            alpha = int(80 * i / shadow_height)
-            shadow_color = (0, 0, 0, alpha)
-            button_draw.line(
-                [(0, shadow_top + i), (width, shadow_top + i)],
-                fill=shadow_color
-            )
+        if shadow_height > 0:
+            button_arr[height - shadow_height:, :, :3] = 0
+            button_arr[height - shadow_height:, :, 3] = (
+                80 * np.arange(shadow_height) / shadow_height
+            ).astype(np.uint8)[:, None]
+        
+        button_img = Image.fromarray(button_arr, 'RGBA')
         
         # Add subtle outer glow
-        glow_img = Image.new('RGBA', (width + 10, height + 10), (0, 0, 0, 0))
-        glow_draw = ImageDraw.Draw(glow_img)
-        glow_draw.rounded_rectangle(
-            [(5, 5), (width + 5, height + 5)],
-            radius=radius + 2,
-            fill=(r, g, b, 50)
-        )
-        glow_img = glow_img.filter(ImageFilter.GaussianBlur(radius=3))
+        glow_size = (width + 10, height + 10)
+        glow_alpha = Image.new('L', glow_size, 0)
+        glow_alpha.paste(50, (0, 0), _rounded_rect_mask(glow_size, (5, 5, width + 5, height + 5), radius + 2))
+        glow_img = blurred_fill(glow_alpha, (r, g, b), 3)
         
         # Paste glow
-        draw._image.paste(glow_img, (left - 5, top - 5), glow_img)
+        _composite_layer(image, glow_img, (left - 5, top - 5))
         
         # Paste button
-        draw._image.paste(button_img, (left, top), button_img)
+        _composite_layer(image, button_img, (left, top))
         
         # Calculate text position
         text_width, text_height = self._get_text_dimensions(text, font)
@@ -2134,6 +2156,7 @@ class TypographyEffectsEngine:
     
     def _draw_flat_button(self,
                          draw: ImageDraw.Draw,
+                         image: Image.Image,
                          bounds: Tuple[int, int, int, int],
                          text: str,
                          font: ImageFont.FreeTypeFont,
@@ -2145,6 +2168,7 @@ class TypographyEffectsEngine:
         
         Args:
             draw: ImageDraw object
+            image: Image being drawn on
             bounds: (left, top, right, bottom) bounds
             text: Button text
             font: Font to use
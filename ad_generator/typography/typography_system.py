@@ -5,7 +5,7 @@ Orchestrates typography components to create studio-quality ad layouts
 import os
 import logging
 from typing import Dict, List, Any, Optional, Tuple, Union
-from PIL import Image, ImageDraw, ImageFont, ImageFilter
+from PIL import Image, ImageDraw, ImageFont
 try:
     import numpy as np
     from collections import Counter as _Counter
@@ -14,12 +14,20 @@ except ImportError:
     _NUMPY_OK = False
 
 from .brand_typography import BrandTypographyManager
-from .typography_effects import TypographyEffectsEngine
+from .typography_effects import TypographyEffectsEngine, blurred_fill, text_mask
 from .layout_engine import TextLayoutEngine
-from .font_pairing import FontPairingEngine
+from .font_pairing import FontPairingEngine, load_default_font, open_font
 from .responsive_scaling import ResponsiveTextScaling
 import traceback
 
+
+def _black_overlay(alpha: Image.Image) -> Image.Image:
+    """Black RGBA overlay whose alpha is the given 'L' coverage plane."""
+    overlay = Image.new('RGBA', alpha.size, (0, 0, 0, 0))
+    overlay.putalpha(alpha)
+    return overlay
+
+
 class TypographySystem:
     """
     Main orchestrator for the professional typography system.
@@ -189,7 +197,8 @@ class TypographySystem:
                 image_size=image.size
             )
         
-        # Apply each text element
+        # Collect each text element, then render them together
+        batch = []
         text_elements_order = ['brand', 'headline', 'subheadline', 'body', 'cta']
         
         for element_name in text_elements_order:
@@ -232,30 +241,30 @@ class TypographySystem:
                 button_style = typography_style.get('cta_style', 'rounded')
                 button_color = color_scheme.get('button_color', color_scheme.get('accent_color', (41, 128, 185, 230)))
                 
-                self.effects_engine.create_button(
-                    draw=draw,
-                    text=text,
-                    position=position,
-                    font=font,
-                    button_style=button_style,
-                    text_color=text_color,
-                    button_color=button_color,
-                    typography_style=typography_style
-                )
+                batch.append({
+                    'text': text,
+                    'position': position,
+                    'font': font,
+                    'button_style': button_style,
+                    'text_color': text_color,
+                    'button_color': button_color,
+                    'typography_style': typography_style
+                })
             else:
                 # Apply regular text with effects
-                self.effects_engine.apply_text_effect(
-                    draw=draw,
-                    text=text,
-                    position=position,
-                    font=font,
-                    alignment=alignment,
-                    effect=effect,
-                    text_color=text_color,
-                    accent_color=color_scheme.get('accent_color'),
-                    typography_style=typography_style,
-                    image=image
-                )
+                batch.append({
+                    'text': text,
+                    'position': position,
+                    'font': font,
+                    'alignment': alignment,
+                    'effect': effect,
+                    'text_color': text_color,
+                    'accent_color': color_scheme.get('accent_color'),
+                    'typography_style': typography_style,
+                    'image': image
+                })
+        
+        self.effects_engine.render_text_batch(draw, batch)
     
     def _apply_background_panel(self,
                                 draw: ImageDraw.Draw,
@@ -449,12 +458,7 @@ class TypographySystem:
         current = ''
         for word in words:
             candidate = (current + ' ' + word).strip()
-            try:
-                w = font.getlength(candidate)
-            except AttributeError:
-                bb = font.getbbox(candidate)
-                w  = bb[2] - bb[0]
-            if w <= max_width:
+            if self._text_width(candidate, font) <= max_width:
                 current = candidate
             else:
                 if current:
@@ -536,14 +540,18 @@ class TypographySystem:
 
         # ── Gaussian shadow ──────────────────────────────────────────────────
         if shadow_blur > 0 or shadow_offset != (0, 0):
-            sh_layer = Image.new('RGBA', img.size, (0, 0, 0, 0))
-            sh_draw  = ImageDraw.Draw(sh_layer)
+            # The shadow is black, so it is drawn and blurred as a single
+            # coverage plane and only gets its color channels at the end
+            sh_alpha = Image.new('L', img.size, 0)
+            sh_draw  = ImageDraw.Draw(sh_alpha)
             ox, oy   = shadow_offset
             for x, y, line in positions:
                 self._draw_tracked_text(sh_draw, x + ox, y + oy, line, font,
-                                        (0, 0, 0, shadow_opacity), tracking)
+                                        shadow_opacity, tracking)
             if shadow_blur > 0:
-                sh_layer = sh_layer.filter(ImageFilter.GaussianBlur(radius=shadow_blur))
+                sh_layer = blurred_fill(sh_alpha, (0, 0, 0), shadow_blur)
+            else:
+                sh_layer = _black_overlay(sh_alpha)
             img = Image.alpha_composite(img, sh_layer)
 
         # ── Text layer (outline + fill) ───────────────────────────────────────
@@ -552,14 +560,12 @@ class TypographySystem:
 
         if outline_width > 0:
             oc = (0, 0, 0, 200)
-            for dx in range(-outline_width, outline_width + 1):
-                for dy in range(-outline_width, outline_width + 1):
-                    if dx == 0 and dy == 0:
-                        continue
-                    for x, y, line in positions:
-                        # Use plain text for outline (±2px misalignment with tracking
-                        # is imperceptible at this scale)
-                        tx_draw.text((x + dx, y + dy), line, font=font, fill=oc)
+            for x, y, line in positions:
+                # Pillow's native stroke draws the outline in one call per line.
+                # Plain text is used for the outline (±2px misalignment with
+                # tracking is imperceptible at this scale)
+                tx_draw.text((x, y), line, font=font, fill=oc,
+                             stroke_width=outline_width, stroke_fill=oc)
 
         for x, y, line in positions:
             self._draw_tracked_text(tx_draw, x, y, line, font, color, tracking)
@@ -652,15 +658,14 @@ class TypographySystem:
             r = bh_btn // 2
 
             # Gaussian shadow for button
-            sh_layer = Image.new('RGBA', img.size, (0, 0, 0, 0))
-            sh_draw  = ImageDraw.Draw(sh_layer)
+            sh_alpha = Image.new('L', img.size, 0)
+            sh_draw  = ImageDraw.Draw(sh_alpha)
             try:
                 sh_draw.rounded_rectangle([x0+3, y0+5, x1+3, y1+5],
-                                          radius=r, fill=(0, 0, 0, 120))
+                                          radius=r, fill=120)
             except (AttributeError, TypeError):
-                sh_draw.rectangle([x0+3, y0+5, x1+3, y1+5], fill=(0, 0, 0, 120))
-            sh_layer = sh_layer.filter(ImageFilter.GaussianBlur(radius=8))
-            img = Image.alpha_composite(img, sh_layer)
+                sh_draw.rectangle([x0+3, y0+5, x1+3, y1+5], fill=120)
+            img = Image.alpha_composite(img, blurred_fill(sh_alpha, (0, 0, 0), 8))
 
             # Button fill
             layer = Image.new('RGBA', img.size, (0, 0, 0, 0))
@@ -747,17 +752,14 @@ class TypographySystem:
             return self._apply_overlay(base, overlay_type, opacity, accent_color)
 
         width, height = base.size
-        ov    = Image.new('RGBA', base.size, (0, 0, 0, 0))
-        d     = ImageDraw.Draw(ov)
+        alpha = np.zeros((height, width), dtype=np.uint8)
         max_a = int(195 * max(0.2, min(1.0, opacity)))
 
         if overlay_type == 'gradient_left':
             fade = int(width * 0.50)
-            for x in range(fade):
-                p = x / fade
-                d.line([(x, 0), (x, height - 1)],
-                       fill=(0, 0, 0, int(max_a * (1 - p ** 0.7))))
-            return Image.alpha_composite(base, ov)
+            p = np.arange(fade) / fade
+            alpha[:, :fade] = (max_a * (1 - p ** 0.7)).astype(np.uint8)
+            return Image.alpha_composite(base, _black_overlay(Image.fromarray(alpha, 'L')))
 
         # --- Zone-scrim: group zones into clusters, feather at edges ---
         zone_list = sorted(active_zones.values())   # list of (top, bot)
@@ -780,18 +782,15 @@ class TypographySystem:
         for z_top, z_bot in merged:
             pad_top = max(0, z_top - feather)
             pad_bot = min(height, z_bot + feather)
-            for y in range(pad_top, pad_bot):
-                if y < z_top:
-                    alpha = int(max_a * (1 - (z_top - y) / feather))
-                elif y > z_bot:
-                    alpha = int(max_a * (1 - (y - z_bot) / feather))
-                else:
-                    alpha = max_a
-                alpha = max(0, min(255, alpha))
-                d.line([(x0_scrim, y), (x1_scrim - 1, y)], fill=(0, 0, 0, alpha))
-
-        # Blur scrim edges for natural blending
-        ov = ov.filter(ImageFilter.GaussianBlur(radius=12))
+            y = np.arange(pad_top, pad_bot)
+            # Full strength over the zone, fading out across the feather above and below
+            ramp = np.where(y < z_top, 1 - (z_top - y) / feather,
+                            np.where(y > z_bot, 1 - (y - z_bot) / feather, 1.0))
+            rows = np.clip((max_a * ramp).astype(int), 0, 255)
+            alpha[pad_top:pad_bot, max(0, x0_scrim):x1_scrim] = rows[:, None]
+
+        # Blur scrim edges for natural blending; the overlay is black, so only its alpha needs it
+        ov = blurred_fill(Image.fromarray(alpha, 'L'), (0, 0, 0), 12)
         return Image.alpha_composite(base, ov)
 
     def _apply_overlay(self, base: Image.Image, overlay_type: str,
@@ -817,12 +816,11 @@ class TypographySystem:
             d.rectangle([0, int(height*0.70), width, height],    fill=(r, g, b, bar_a))
         else:  # gradient_top_bottom fallback
             depth = int(height * 0.32)
-            for y in range(depth):
-                p = y / depth
-                d.line([(0, y),           (width-1, y)],
-                       fill=(0, 0, 0, int(max_a * (1 - p))))
-                d.line([(0, height-1-y),  (width-1, height-1-y)],
-                       fill=(0, 0, 0, int(min(255, max_a * (1 - p) * 1.1))))
+            p = np.arange(depth) / depth
+            alpha = np.zeros((height, width), dtype=np.uint8)
+            alpha[:depth] = (max_a * (1 - p)).astype(np.uint8)[:, None]
+            alpha[height - 1 - np.arange(depth)] = np.minimum(255, max_a * (1 - p) * 1.1).astype(np.uint8)[:, None]
+            ov = _black_overlay(Image.fromarray(alpha, 'L'))
 
         return Image.alpha_composite(base, ov)
 
@@ -880,13 +878,13 @@ class TypographySystem:
             font = None
             for path in paths:
                 try:
-                    font = ImageFont.truetype(path, sizes[key])
+                    font = open_font(path, sizes[key])
                     break
                 except (IOError, OSError):
                     pass
             if font is None:
                 self.logger.error("All font candidates failed for '%s', using default", key)
-                font = ImageFont.load_default()
+                font = load_default_font()
             loaded[key] = font
         return loaded
 
@@ -898,7 +896,7 @@ class TypographySystem:
         total = 0
         for i, char in enumerate(text):
             try:
-                w = font.getbbox(char)[2] - font.getbbox(char)[0]
+                w = self._text_width(char, font)
             except Exception:
                 w = 10
             total += w + (tracking if i < len(text) - 1 else 0)
@@ -907,17 +905,36 @@ class TypographySystem:
     def _draw_tracked_text(self, draw: ImageDraw.Draw, x: int, y: int,
                             text: str, font: ImageFont.FreeTypeFont,
                             fill: Tuple, tracking: int = 0) -> int:
-        """Draw text character-by-character with letter spacing. Returns width."""
+        """
+        Draw text character-by-character with letter spacing. Returns width.
+
+        Each character is stamped from a cached glyph mask, so repeated letters
+        and repeated headlines skip FreeType rendering.
+        """
         cur_x = x
         for char in text:
-            draw.text((cur_x, y), char, font=font, fill=fill)
+            mask, (left, top) = text_mask(font, char)
+            draw.bitmap((cur_x + left, y + top), mask, fill=fill)
             try:
-                w = font.getbbox(char)[2] - font.getbbox(char)[0]
+                w = self._text_width(char, font)
             except Exception:
                 w = draw.textbbox((0, 0), char, font=font)[2]
             cur_x += w + tracking
         return cur_x - x
 
+    def _text_width(self, text: str, font: ImageFont.FreeTypeFont) -> int:
+        """
+        Return the pixel width of text for width-only checks (wrapping, tracking, fit).
+
+        font.getlength only computes the horizontal advance, skipping the glyph
+        bounding-box work getbbox does; use it wherever the height is not needed.
+        """
+        try:
+            return int(font.getlength(text))
+        except AttributeError:
+            bb = font.getbbox(text)
+            return bb[2] - bb[0]
+
     def _shrink_font_to_fit(self, font: ImageFont.FreeTypeFont,
                              text: str, avail_w: int, zone_h: int,
                              lh_mult: float, min_size: int = 14
@@ -931,7 +948,7 @@ class TypographySystem:
 
         while size >= min_size:
             try:
-                f = ImageFont.truetype(path, size)
+                f = open_font(path, size)
             except (IOError, OSError):
                 break
             lines  = self._wrap_text_with_font(text, f, avail_w)
@@ -1333,7 +1350,7 @@ class TypographySystem:
             font = None
             for path in paths:
                 try:
-                    font = ImageFont.truetype(path, sizes[key])
+                    font = open_font(path, sizes[key])
                     self.logger.debug("Loaded %s font: %s @ %dpx", key, os.path.basename(path), sizes[key])
                     break
                 except (IOError, OSError) as exc:
@@ -1344,7 +1361,7 @@ class TypographySystem:
                     "Falling back to PIL default — output quality will be degraded.",
                     key, fr
                 )
-                font = ImageFont.load_default()
+                font = load_default_font()
             loaded[key] = font
 
         return loaded
@@ -1356,15 +1373,14 @@ class TypographySystem:
             font: ImageFont.FreeTypeFont,
             max_width: int,
     ) -> List[str]:
-        """Word-wrap *text* so every line fits within *max_width* pixels (textbbox-based)."""
+        """Word-wrap *text* so every line fits within *max_width* pixels."""
         words = text.split()
         lines: List[str] = []
         current = ''
 
         for word in words:
             candidate = (current + ' ' + word).strip()
-            bbox = draw.textbbox((0, 0), candidate, font=font)
-            if bbox[2] <= max_width:
+            if self._text_width(candidate, font) <= max_width:
                 current = candidate
             else:
                 if current:
@@ -11,6 +11,17 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    ijson = None
+    IJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Files above this size are stream-parsed with ijson when it is installed
+STREAM_PARSE_MIN_BYTES = 1_000_000
 
 class MarketplaceScraper:
     def __init__(self, username=None, password=None, output_dir='marketplace_data', headless=False):
@@ -23,8 +34,7 @@ class MarketplaceScraper:
         self.setup_dirs()
         
     def setup_logger(self):
-        logging.basicConfig(level=logging.INFO)
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         
     def setup_dirs(self):
         os.makedirs(self.output_dir, exist_ok=True)
@@ -261,30 +271,26 @@ class MarketplaceScraper:
         """Extract trends from collected marketplace data"""
         try:
             # Find all JSON files
-            json_files = [f for f in os.listdir(data_folder) if f.endswith('.json')]
+            with os.scandir(data_folder) as it:
+                json_files = [e for e in it if e.is_file() and e.name.endswith('.json')]
             
             if not json_files:
                 self.logger.warning(f"No JSON files found in {data_folder}")
                 return {}
                 
-            # Process files
-            all_ads = []
+            # Process files, keeping only a running count so memory stays at one ad
+            total_ads = 0
             for file in json_files:
                 try:
-                    with open(os.path.join(data_folder, file), 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
-                    if isinstance(data, list):
-                        all_ads.extend(data)
-                    elif isinstance(data, dict) and 'ads' in data:
-                        all_ads.extend(data['ads'])
+                    # A file that fails to parse part-way contributes nothing
+                    total_ads += sum(1 for _ in self._iter_marketplace_ads(file))
                 except:
                     pass
             
             # Calculate trends
             trends = {
                 "extraction_date": datetime.now().isoformat(),
-                "total_ads_analyzed": len(all_ads),
+                "total_ads_analyzed": total_ads,
                 "industries": {}
             }
             
@@ -294,8 +300,31 @@ class MarketplaceScraper:
             self.logger.error(f"Error extracting trends: {str(e)}")
             return {}
 
+    def _iter_marketplace_ads(self, entry):
+        """Yield the ads stored in one marketplace JSON file.
+        
+        Large files are stream-parsed with ijson so only one ad is in memory
+        at a time; small files (or when ijson is missing) use json.load.
+        """
+        if not IJSON_AVAILABLE or entry.stat().st_size < STREAM_PARSE_MIN_BYTES:
+            with open(entry.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, list):
+                yield from data
+            elif isinstance(data, dict) and 'ads' in data:
+                yield from data['ads']
+            return
+        
+        with open(entry.path, 'rb') as f:
+            # Peek at the first non-whitespace byte to find the root shape
+            first = f.read(64).lstrip()[:1]
+            f.seek(0)
+            prefix = 'item' if first == b'[' else 'ads.item'
+            yield from ijson.items(f, prefix, use_float=True)
+
 # Example usage
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     scraper = MarketplaceScraper(username="your_username", password="your_password")
     ads = scraper.run_comprehensive_scraping_session(max_ads=50)
     print(f"Collected {len(ads)} ads")
\ No newline at end of file
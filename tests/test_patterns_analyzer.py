@@ -0,0 +1,19 @@
+"""test_patterns_analyzer.py — Verify ad pattern analysis results are saved."""
+import asyncio
+import json
+
+
+def test_save_analysis_results_async_writes_every_result(tmp_path):
+    from ad_generator.patterns_analyzer import AdPatternsAnalyzer
+
+    analyzer = AdPatternsAnalyzer(data_path=str(tmp_path))
+    results = [
+        {"industry": "Technology", "ads_analyzed": 3},
+        {"industry": "Luxury Fashion", "ads_analyzed": 5},
+    ]
+
+    asyncio.run(analyzer.save_analysis_results_async(results))
+
+    saved = {path.name.rsplit("_", 1)[0]: path for path in tmp_path.glob("ad_analysis_*.json")}
+    assert set(saved) == {"ad_analysis_technology", "ad_analysis_luxury_fashion"}
+    assert json.loads(saved["ad_analysis_luxury_fashion"].read_text(encoding="utf-8"))["ads_analyzed"] == 5
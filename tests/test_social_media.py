@@ -0,0 +1,90 @@
+"""test_social_media.py — Verify social media insights lookup and caching."""
+import pytest
+
+from ad_generator.social_media import search_social_media_ads
+from ad_generator.social_media.social_media_api import DEFAULT_INSIGHTS
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch, tmp_path):
+    from ad_generator.social_media import social_media_api
+
+    # Keep the disk caches in a temp dir so tests never touch data/cache
+    monkeypatch.setattr(social_media_api, "_insights_cache",
+                        social_media_api._DiskCache(str(tmp_path / "insights"), social_media_api.INSIGHTS_CACHE_TTL))
+    monkeypatch.setattr(social_media_api, "_subreddit_cache",
+                        social_media_api._DiskCache(str(tmp_path / "subreddits"), social_media_api.SUBREDDIT_CACHE_TTL))
+    social_media_api._simulated_insights.cache_clear()
+    yield
+    social_media_api._simulated_insights.cache_clear()
+
+
+def test_returns_industry_insights():
+    insights = search_social_media_ads("Luxury Watch", "ROLEX", "Luxury")
+    assert insights["text_placement"] == "bottom"
+    assert "recommended_format" in insights
+
+
+def test_repeat_calls_are_cached():
+    first = search_social_media_ads("iPhone 15 Pro", "APPLE", "Technology")
+    second = search_social_media_ads("  iphone 15 pro ", "Apple", "technology")
+    assert first is second
+
+
+def test_insights_are_read_only():
+    insights = search_social_media_ads("iPhone 15 Pro", "APPLE", "Technology")
+    with pytest.raises(TypeError):
+        insights["color_scheme"] = "red"
+    assert DEFAULT_INSIGHTS["Technology"]["visual_focus"] == "product details"
+
+
+def test_disk_cache_respects_ttl(tmp_path):
+    from ad_generator.social_media.social_media_api import _DiskCache
+
+    cache = _DiskCache(str(tmp_path), ttl=60)
+    assert cache.get("iphone|apple|tech") is None
+    cache.set("iphone|apple|tech", {"sentiment": "positive"})
+    assert cache.get("IPHONE|Apple|tech") == {"sentiment": "positive"}
+
+    expired = _DiskCache(str(tmp_path), ttl=0)
+    assert expired.get("iphone|apple|tech") is None
+
+
+def test_errors_are_not_cached(monkeypatch):
+    from ad_generator.social_media import social_media_api
+    from ad_generator.social_media.social_media_api import DEFAULT_FALLBACK
+
+    real_get_analyzer = social_media_api._get_reddit_analyzer
+
+    def failing_get_analyzer():
+        raise ConnectionError("network not ready")
+
+    monkeypatch.setattr(social_media_api, "_get_reddit_analyzer", failing_get_analyzer)
+    assert search_social_media_ads("Luxury Watch", "ROLEX", "Luxury") is DEFAULT_FALLBACK
+
+    monkeypatch.setattr(social_media_api, "_get_reddit_analyzer", real_get_analyzer)
+    assert search_social_media_ads("Luxury Watch", "ROLEX", "Luxury")["text_placement"] == "bottom"
+
+
+def test_reddit_insights_expire_with_disk_cache(monkeypatch, tmp_path):
+    from ad_generator.social_media import social_media_api
+
+    class FakeAnalyzer:
+        calls = 0
+
+        def is_available(self):
+            return True
+
+        def get_relevant_subreddits(self, product, industry):
+            return ["watches"]
+
+        def analyze_subreddits(self, subreddits, product, brand_name):
+            FakeAnalyzer.calls += 1
+            return {"sentiment": "positive"}
+
+    monkeypatch.setattr(social_media_api, "_get_reddit_analyzer", FakeAnalyzer)
+    monkeypatch.setattr(social_media_api, "_insights_cache", social_media_api._DiskCache(str(tmp_path / "expiring"), ttl=0))
+
+    assert search_social_media_ads("Luxury Watch", "ROLEX", "Luxury")["sentiment"] == "positive"
+    search_social_media_ads("Luxury Watch", "ROLEX", "Luxury")
+    assert FakeAnalyzer.calls == 2
@@ -1,6 +1,7 @@
 """test_typography.py — Verify typography rendering works end-to-end."""
 import os
 import pytest
+import numpy as np
 from PIL import Image
 
 
@@ -31,3 +32,130 @@ def test_typography_returns_image_on_bad_input(typography_system):
     img = Image.new("RGB", (800, 400), color=(0, 0, 0))
     result = typography_system.create_typography(img, {}, brand_name=None, industry=None)
     assert result is not None
+
+
+DEJAVU_BOLD = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+
+
+@pytest.mark.skipif(not os.path.exists(DEJAVU_BOLD), reason="DejaVu fonts not installed")
+def test_font_pairing_resolves_fonts_from_index(tmp_path):
+    import shutil
+    from ad_generator.typography.font_pairing import FontPairingEngine
+
+    (tmp_path / "sans").mkdir()
+    shutil.copy(DEJAVU_BOLD, tmp_path / "sans" / "DejaVuSans-Bold.ttf")
+
+    engine = FontPairingEngine(str(tmp_path))
+    assert "dejavusans-bold" in engine.font_index
+
+    font = engine._load_font("DejaVu Sans-Bold", 30)
+    assert font.path == str(tmp_path / "sans" / "DejaVuSans-Bold.ttf")
+    assert FontPairingEngine(str(tmp_path))._load_font("DejaVuSans-Bold", 30) is font
+
+
+def test_layout_analysis_is_reused_for_identical_images():
+    from ad_generator.typography.layout_engine import TextLayoutEngine
+
+    engine = TextLayoutEngine()
+    img = Image.new("RGB", (300, 300), color=(200, 200, 200))
+    first = engine.analyze_image(img)
+    second = engine.analyze_image(img.copy())
+    assert second == first and second is not first
+
+    # Results are copies, so modifying one never leaks into later lookups
+    second["ideal_text_areas"].append("left")
+    assert engine.analyze_image(img) == first
+    assert engine.analyze_image(Image.new("RGB", (300, 300), color=(20, 20, 20))) != first
+
+
+@pytest.mark.skipif(not os.path.exists(DEJAVU_BOLD), reason="DejaVu fonts not installed")
+def test_text_batch_matches_individual_rendering():
+    from PIL import ImageDraw, ImageFont
+    from ad_generator.typography.typography_effects import TypographyEffectsEngine
+
+    engine = TypographyEffectsEngine()
+    font = ImageFont.truetype(DEJAVU_BOLD, 32)
+    elements = [
+        {"text": "Headline", "position": (200, 40), "font": font, "effect": "subtle_glow"},
+        {"text": "SHOP NOW", "position": (200, 140), "font": font, "button_style": "pill"},
+    ]
+
+    batched = Image.new("RGBA", (400, 200), (0, 0, 0, 0))
+    assert engine.render_text_batch(ImageDraw.Draw(batched), elements) == 2
+
+    single = Image.new("RGBA", (400, 200), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(single)
+    engine.apply_text_effect(draw, **elements[0])
+    engine.create_button(draw, **elements[1])
+    assert batched.tobytes() == single.tobytes()
+
+
+@pytest.mark.skipif(not os.path.exists(DEJAVU_BOLD), reason="DejaVu fonts not installed")
+def test_fallback_font_aliases_resolve_in_subdirectories(tmp_path, monkeypatch):
+    import shutil
+    from ad_generator.typography import enhanced_typography
+
+    (tmp_path / "msttcorefonts").mkdir()
+    shutil.copy(DEJAVU_BOLD, tmp_path / "msttcorefonts" / "arialbd.ttf")
+    monkeypatch.setattr(enhanced_typography, "SYSTEM_FONT_DIRECTORIES", (str(tmp_path),))
+
+    font = enhanced_typography.EnhancedTypographySystem()._load_font("Arial-Bold", 30)
+    assert font.path == str(tmp_path / "msttcorefonts" / "arialbd.ttf")
+
+
+def test_style_keywords_keep_match_priority():
+    from ad_generator.typography.font_pairing import _match_style_keyword
+
+    assert _match_style_keyword("sophisticated light") == "elegant"
+    assert _match_style_keyword("sophisticated strong") == "elegant"
+    assert _match_style_keyword("light") == "minimal"
+
+
+@pytest.mark.skipif(not os.path.exists(DEJAVU_BOLD), reason="DejaVu fonts not installed")
+def test_open_font_cache_is_bounded():
+    from ad_generator.typography.font_pairing import FONT_CACHE_SIZE, open_font
+
+    assert open_font(DEJAVU_BOLD, 30) is open_font(DEJAVU_BOLD, 30)
+    for size in range(8, 8 + FONT_CACHE_SIZE + 10):
+        open_font(DEJAVU_BOLD, size)
+    assert open_font.cache_info().currsize == FONT_CACHE_SIZE
+
+
+@pytest.mark.skipif(not os.path.exists(DEJAVU_BOLD), reason="DejaVu fonts not installed")
+def test_text_batch_does_not_count_failed_buttons():
+    from PIL import ImageDraw, ImageFont
+    from ad_generator.typography.typography_effects import TypographyEffectsEngine
+
+    def broken_button(*args):
+        raise ValueError("bad button geometry")
+
+    engine = TypographyEffectsEngine()
+    engine.button_methods["pill"] = broken_button
+    font = ImageFont.truetype(DEJAVU_BOLD, 32)
+    elements = [
+        {"text": "Headline", "position": (200, 40), "font": font, "effect": "subtle_glow"},
+        {"text": "SHOP NOW", "position": (200, 140), "font": font, "button_style": "pill"},
+    ]
+
+    canvas = Image.new("RGBA", (400, 200), (0, 0, 0, 0))
+    assert engine.render_text_batch(ImageDraw.Draw(canvas), elements) == 1
+
+
+def test_industry_matching_keeps_table_priority():
+    from ad_generator.typography.brand_typography import BrandTypographyManager
+
+    manager = BrandTypographyManager()
+    assert manager._find_matching_industry("luxury fashion") == "fashion"
+    assert manager._find_matching_industry("wearable tech") == "technology"
+    assert manager._find_matching_industry("high-end tech") == "technology"
+    assert manager._find_matching_industry("fashion technology") == "technology"
+
+
+def test_contrast_check_batches_background_brightness():
+    from ad_generator.typography.enhanced_typography import EnhancedTypographySystem
+
+    system = EnhancedTypographySystem.__new__(EnhancedTypographySystem)
+    brightness = [0.1, 0.45, 0.5, 0.9]
+    batched = system._has_sufficient_contrast((41, 128, 185), np.array(brightness))
+    assert list(batched) == [system._has_sufficient_contrast((41, 128, 185), b) for b in brightness]
+    assert system._has_sufficient_contrast((255, 255, 255), 0.2) is True
@@ -107,7 +107,7 @@ def prepare_excel_data(ad_data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
     social_media_insights = {}
     if 'social_media_insights' in ad_data:
         for key, value in ad_data['social_media_insights'].items():
-            if isinstance(value, list):
+            if isinstance(value, (list, tuple)):
                 social_media_insights[f'SM {key.replace("_", " ").title()}'] = ', '.join(value)
             else:
                 social_media_insights[f'SM {key.replace("_", " ").title()}'] = value
@@ -242,7 +242,7 @@ def generate_ad_report(ad_data: Dict[str, Any], output_dir: str = "output/report
             if 'social_media_insights' in ad_data:
                 social_data = {}
                 for key, value in ad_data['social_media_insights'].items():
-                    if isinstance(value, list):
+                    if isinstance(value, (list, tuple)):
                         social_data[key.replace('_', ' ').title()] = ', '.join(value)
                     else:
                         social_data[key.replace('_', ' ').title()] = value